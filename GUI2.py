@@ -8,6 +8,10 @@ import pandas as pd
 import math
 
 from Python.Vandermonde import comparar_metodos
+from Python.expresion import compile_expression, CachedFunction
+from Python.aislamiento import FAILED_KIND, OUTSIDE_KIND, find_all_roots, as_bracket_solver
+from Python.comparacion import summarize_run, run_root_method, create_pool
+from Python.tareas import Job, run_job
 
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
@@ -122,14 +126,113 @@ METHODS = {
         )
     },
 
+    "Regla Falsa (Illinois)": {
+        "module": ("regla_falsa", "illinois_method"),
+        # Descripción corta, general
+        "description": (
+            "La variante de Illinois es una regla falsa modificada para encontrar una raíz real de f(x) = 0 en un "
+            "intervalo [a, b] con cambio de signo. Corrige el principal defecto de la regla falsa clásica: que un "
+            "extremo del intervalo se quede fijo durante muchas iteraciones."
+        ),
+        # Para qué sirve
+        "purpose": (
+            "Se utiliza en los mismos casos que la regla falsa (f(a) y f(b) con signos opuestos), sobre todo cuando la "
+            "función es convexa o cóncava en el intervalo. Allí la regla falsa clásica converge lentamente (de forma "
+            "lineal) y suele agotar el máximo de iteraciones, mientras que Illinois recupera convergencia superlineal."
+        ),
+        # Cómo funciona
+        "how_it_works": (
+            "1. Se parte de un intervalo inicial [a, b] con f(a) y f(b) de signos opuestos.\n"
+            "2. Se calcula xr = b - f(b)·(b - a) / (f(b) - f(a)), igual que en la regla falsa.\n"
+            "3. Se reemplaza el extremo que tiene el mismo signo que f(xr).\n"
+            "4. Si el mismo extremo se conserva dos veces seguidas, su valor de f se divide entre 2 para la "
+            "siguiente fórmula; así la recta secante se inclina y el extremo estancado termina moviéndose.\n"
+            "5. Se detiene cuando el error es menor que la tolerancia o se alcanza el máximo de iteraciones."
+        ),
+        # Datos requeridos
+        "required_inputs": [
+            "Función f(x) continua en el intervalo [a, b] (por ejemplo: np.exp(x) - 10)",
+            "Límite inferior (a), donde f(a) y f(b) tienen signos opuestos",
+            "Límite superior (b)",
+            "Tolerancia (Tol), por ejemplo 1e-6",
+            "Máximo iteraciones (it), por ejemplo 50 o 100"
+        ],
+        # Qué verá el usuario en la GUI
+        "ui_info": (
+            "En la interfaz podrás ver:\n"
+            "• La misma tabla que en la regla falsa: a, f(a), b, f(b), xr, f(xr) y el error (f sin escalar).\n"
+            "• La aproximación final de la raíz y el número de iteraciones.\n"
+            "• En el informe comparativo, la reducción de iteraciones frente a la regla falsa clásica."
+        ),
+        # Ejemplo
+        "example": (
+            "Ejemplo de uso:\n"
+            "• f(x) = np.exp(x) - 10\n"
+            "• a = 0\n"
+            "• b = 5\n"
+            "• Tol = 1e-10\n"
+            "• it = 200\n\n"
+            "La regla falsa clásica necesita más de 100 iteraciones; la variante de Illinois, alrededor de 13."
+        )
+    },
+
+    "Regla Falsa (Anderson-Björck)": {
+        "module": ("regla_falsa", "anderson_bjorck_method"),
+        # Descripción corta, general
+        "description": (
+            "La variante de Anderson-Björck es una regla falsa modificada para encontrar una raíz real de f(x) = 0 en "
+            "un intervalo [a, b] con cambio de signo. Como la de Illinois, evita que un extremo se quede fijo, pero "
+            "escala su valor de f con un factor que depende de cómo cambió la función."
+        ),
+        # Para qué sirve
+        "purpose": (
+            "Se utiliza en los mismos casos que la regla falsa, especialmente con funciones convexas o cóncavas en el "
+            "intervalo. Suele ser la variante que menos iteraciones necesita en funciones suaves."
+        ),
+        # Cómo funciona
+        "how_it_works": (
+            "1. Se parte de un intervalo inicial [a, b] con f(a) y f(b) de signos opuestos.\n"
+            "2. Se calcula xr = b - f(b)·(b - a) / (f(b) - f(a)), igual que en la regla falsa.\n"
+            "3. Se reemplaza el extremo que tiene el mismo signo que f(xr).\n"
+            "4. Si el mismo extremo se conserva dos veces seguidas, su valor de f se multiplica por "
+            "m = 1 - f(xr)/f(extremo reemplazado) (o por 1/2 si m ≤ 0).\n"
+            "5. Se detiene cuando el error es menor que la tolerancia o se alcanza el máximo de iteraciones."
+        ),
+        # Datos requeridos
+        "required_inputs": [
+            "Función f(x) continua en el intervalo [a, b] (por ejemplo: np.exp(x) - 10)",
+            "Límite inferior (a), donde f(a) y f(b) tienen signos opuestos",
+            "Límite superior (b)",
+            "Tolerancia (Tol), por ejemplo 1e-6",
+            "Máximo iteraciones (it), por ejemplo 50 o 100"
+        ],
+        # Qué verá el usuario en la GUI
+        "ui_info": (
+            "En la interfaz podrás ver:\n"
+            "• La misma tabla que en la regla falsa: a, f(a), b, f(b), xr, f(xr) y el error (f sin escalar).\n"
+            "• La aproximación final de la raíz y el número de iteraciones.\n"
+            "• En el informe comparativo, la reducción de iteraciones frente a la regla falsa clásica."
+        ),
+        # Ejemplo
+        "example": (
+            "Ejemplo de uso:\n"
+            "• f(x) = np.exp(x) - 10\n"
+            "• a = 0\n"
+            "• b = 5\n"
+            "• Tol = 1e-10\n"
+            "• it = 200\n\n"
+            "La regla falsa clásica necesita más de 100 iteraciones; la variante de Anderson-Björck, alrededor de 10."
+        )
+    },
+
     "Newton": {
         "module": ("newton", "newton_method"),
         # Descripción corta, general
         "description": (
             "El método de Newton (o Newton-Raphson) es un procedimiento iterativo para encontrar raíces de la ecuación "
             "f(x) = 0 utilizando información de la derivada de la función. "
-            "En ESTA APLICACIÓN la derivada f'(x) se calcula automáticamente de forma numérica a partir de la f(x) "
-            "que escribas, por lo que NO necesitas ingresar la derivada de manera explícita."
+            "En ESTA APLICACIÓN la derivada f'(x) se calcula automáticamente (diferenciación automática, exacta) "
+            "a partir de la f(x) que escribas, por lo que NO necesitas ingresar la derivada de manera explícita."
         ),
         # Para qué sirve
         "purpose": (
@@ -290,8 +393,8 @@ METHODS = {
         "description": (
             "El método de raíces múltiples es una variante del método de Newton diseñada para encontrar raíces de "
             "multiplicidad mayor que 1, utilizando información de la primera y la segunda derivada de la función. "
-            "En ESTA APLICACIÓN tanto f'(x) como f''(x) se calculan automáticamente de forma numérica a partir de f(x), "
-            "por lo que NO necesitas escribir las derivadas."
+            "En ESTA APLICACIÓN tanto f'(x) como f''(x) se calculan automáticamente a partir de f(x) "
+            "(diferenciación automática, en una sola evaluación), por lo que NO necesitas escribir las derivadas."
         ),
         # Para qué sirve
         "purpose": (
@@ -309,8 +412,8 @@ METHODS = {
             "4. Se repite el proceso hasta que el cambio entre dos aproximaciones consecutivas sea menor que la "
             "tolerancia o se alcance el máximo número de iteraciones.\n"
             "5. Es importante que la función sea suficientemente suave (derivable dos veces) en torno a la raíz.\n\n"
-            "En esta aplicación NO se te pide escribir f'(x) ni f''(x): ambas derivadas se aproximan numéricamente "
-            "a partir de la función f(x) que ingresas, cumpliendo el requisito de ayudar al usuario con el cálculo "
+            "En esta aplicación NO se te pide escribir f'(x) ni f''(x): ambas derivadas se obtienen por diferenciación "
+            "automática a partir de la función f(x) que ingresas, cumpliendo el requisito de ayudar al usuario con el cálculo "
             "de derivadas."
         ),
         # Datos requeridos
@@ -343,6 +446,60 @@ METHODS = {
         )
     },
 
+    "Chandrupatla": {
+        "module": ("chandrupatla", "chandrupatla_method"),
+        # Descripción corta, general
+        "description": (
+            "El método de Chandrupatla es una variante del método de Brent para encontrar una raíz real de "
+            "f(x) = 0 en un intervalo [a, b] con cambio de signo. Combina interpolación cuadrática inversa con "
+            "pasos de bisección de respaldo, de modo que siempre conserva un intervalo que contiene la raíz."
+        ),
+        # Para qué sirve
+        "purpose": (
+            "Se utiliza cuando se conoce un intervalo [a, b] con f(a) y f(b) de signos opuestos y se quiere la "
+            "seguridad de la bisección con una velocidad cercana a la de la secante. A diferencia de la regla "
+            "falsa, no se estanca cuando la función es convexa o cóncava, y en raíces múltiples no es más lento "
+            "que la bisección."
+        ),
+        # Cómo funciona
+        "how_it_works": (
+            "1. Se parte de un intervalo inicial [a, b] con f(a) y f(b) de signos opuestos.\n"
+            "2. Se evalúa un punto nuevo xt = a + t·(b - a) (al inicio t = 0.5, es decir, el punto medio).\n"
+            "3. Se actualiza el intervalo para que siga habiendo cambio de signo y se guarda el punto descartado c.\n"
+            "4. Si los tres puntos a, b, c hacen confiable la interpolación cuadrática inversa, t se calcula con "
+            "ella; si no, se usa t = 0.5 (bisección).\n"
+            "5. La aproximación de la raíz es el extremo del intervalo con menor |f(x)|.\n"
+            "6. Se detiene cuando el error (ancho del intervalo o |f(x)|) es menor que la tolerancia o se alcanza "
+            "el máximo número de iteraciones."
+        ),
+        # Datos requeridos
+        "required_inputs": [
+            "Función f(x) continua en el intervalo [a, b] (por ejemplo: x**3 - x - 2)",
+            "Límite inferior (a), donde f(a) y f(b) tienen signos opuestos",
+            "Límite superior (b)",
+            "Tolerancia (Tol), por ejemplo 1e-6",
+            "Máximo iteraciones (it), por ejemplo 50 o 100"
+        ],
+        # Qué verá el usuario en la GUI
+        "ui_info": (
+            "En la interfaz podrás ver:\n"
+            "• Una tabla de iteraciones con el intervalo [a, b], la mejor aproximación xr, f(xr) y el error.\n"
+            "• La aproximación final de la raíz y el número total de iteraciones utilizadas.\n"
+            "• Si activas la comparación automática, verás que suele necesitar muchas menos iteraciones que "
+            "la bisección y la regla falsa."
+        ),
+        # Ejemplo
+        "example": (
+            "Ejemplo de uso:\n"
+            "• f(x) = x**3 - x - 2\n"
+            "• a = 1\n"
+            "• b = 2\n"
+            "• Tol = 1e-6\n"
+            "• it = 50\n\n"
+            "El método encuentra la raíz cercana a 1.5214 en unas pocas iteraciones, frente a unas 20 de la bisección."
+        )
+    },
+
     "Jacobi": {
         "module": ("jacobi", "jacobi"),
         # Descripción corta, general
@@ -369,7 +526,8 @@ METHODS = {
         # Datos requeridos
         "required_inputs": [
             "Matriz A (escrita como filas separadas por ';', por ejemplo: '4,1;2,3')",
-            "Vector b (separado por comas, por ejemplo: '5,4')",
+            "Vector b (separado por comas, por ejemplo: '5,4'); para resolver varios sistemas con la misma A "
+            "se separan los vectores con ';' (por ejemplo: '5,4;1,0')",
             "Vector inicial x0 (opcional, por defecto puede ser ceros; en la interfaz se escribe como '0,0')",
             "Tolerancia (Tol), por ejemplo 1e-4",
             "Máximo iteraciones (it), por ejemplo 50 o 100"
@@ -377,7 +535,8 @@ METHODS = {
         # Qué verá el usuario en la GUI
         "ui_info": (
             "En la interfaz podrás ver:\n"
-            "• Una tabla con las iteraciones del vector x^{(k)} y el error asociado a cada paso.\n"
+            "• Una tabla con las iteraciones del vector x^{(k)} y el error asociado a cada paso "
+            "(con varios vectores b, una columna de x y un error por cada sistema).\n"
             "• La aproximación final del vector solución x y el número de iteraciones usadas.\n"
             "• Mensajes de advertencia si el método no converge dentro del número de iteraciones indicado."
         ),
@@ -449,6 +608,54 @@ METHODS = {
         )
     },
 
+    "Gauss-Seidel (multicolor)": {
+        "module": ("gauss_seidel", "multicolor_gauss_seidel_method"),
+        # Descripción corta, general
+        "description": (
+            "Variante de Gauss-Seidel que reordena las incógnitas por colores (rojo-negro en mallas) para "
+            "actualizar de una vez, en bloque, todas las componentes de un mismo color."
+        ),
+        # Para qué sirve
+        "purpose": (
+            "Sirve para sistemas grandes y dispersos (por ejemplo, discretizaciones de Poisson), donde el barrido "
+            "componente a componente de Gauss-Seidel es secuencial. Cada color se calcula como una operación "
+            "vectorizada y los colores grandes se reparten entre varios hilos."
+        ),
+        # Cómo funciona
+        "how_it_works": (
+            "1. Se colorea el grafo de A: i y j son vecinos si a_ij ≠ 0 o a_ji ≠ 0, y dos vecinos nunca comparten color.\n"
+            "2. Las componentes de un mismo color no dependen entre sí, así que se actualizan juntas:\n"
+            "      x_i^{(k+1)} = (1 / a_ii) * (b_i - Σ_{j≠i} a_ij · x_j),  para todo i del color c,\n"
+            "   usando los valores ya actualizados de los colores anteriores.\n"
+            "3. Un barrido recorre todos los colores; equivale a Gauss-Seidel sobre A reordenada por colores.\n"
+            "4. Se repite hasta que el error sea menor que la tolerancia o se alcance el máximo de iteraciones."
+        ),
+        # Datos requeridos
+        "required_inputs": [
+            "Matriz A (filas separadas por ';')",
+            "Vector b (separado por comas)",
+            "Vector inicial x0",
+            "Tolerancia (Tol)",
+            "Máximo iteraciones (it)"
+        ],
+        # Qué verá el usuario en la GUI
+        "ui_info": (
+            "En la interfaz podrás ver:\n"
+            "• La misma tabla de Gauss-Seidel: x^{(k)} y el error de cada barrido.\n"
+            "• El radio espectral de la iteración reordenada y el número y tamaño de los colores."
+        ),
+        # Ejemplo
+        "example": (
+            "Ejemplo de uso (Poisson 1D, rojo-negro):\n"
+            "• Matriz A = '2,-1,0,0;-1,2,-1,0;0,-1,2,-1;0,0,-1,2'\n"
+            "• Vector b = '1,0,0,1'\n"
+            "• x0 = '0,0,0,0'\n"
+            "• Tol = 1e-6\n"
+            "• it = 200\n\n"
+            "Se obtienen 2 colores: las componentes 1 y 3 (rojas) y 2 y 4 (negras). La solución es x = (1, 1, 1, 1)."
+        )
+    },
+
     "SOR": {
         "module": ("SOR", "sor_method"),
         # Descripción corta, general
@@ -477,7 +684,7 @@ METHODS = {
             "Matriz A",
             "Vector b",
             "Vector inicial x0",
-            "Factor w (por ejemplo 1.1, 1.2, etc.)",
+            "Factor w (por ejemplo 1.1, 1.2, etc.) o 'auto' para elegirlo automáticamente",
             "Tolerancia (Tol)",
             "Máximo iteraciones (it)"
         ],
@@ -486,7 +693,9 @@ METHODS = {
             "En la interfaz podrás ver:\n"
             "• Una tabla con las iteraciones del vector x y el error asociado.\n"
             "• El valor final aproximado de la solución.\n"
-            "• Podrás experimentar cambiando w para ver cómo afecta el número de iteraciones y la convergencia."
+            "• Podrás experimentar cambiando w para ver cómo afecta el número de iteraciones y la convergencia.\n"
+            "• Con w = 'auto' se usa la fórmula de Young (matrices consistentemente ordenadas) o una búsqueda de w; "
+            "el resumen muestra el w elegido y las iteraciones que se ahorran frente a Gauss-Seidel."
         ),
         # Ejemplo
         "example": (
@@ -502,6 +711,391 @@ METHODS = {
         )
     },
 
+    "Gradiente Conjugado (PCG)": {
+        "module": ("gradiente_conjugado", "pcg_method"),
+        # Descripción corta, general
+        "description": (
+            "El gradiente conjugado precondicionado (PCG) resuelve sistemas A·x = b con A simétrica definida positiva "
+            "minimizando el error en la norma de A sobre espacios de Krylov crecientes."
+        ),
+        # Para qué sirve
+        "purpose": (
+            "Es el método iterativo de referencia para matrices simétricas definidas positivas (por ejemplo, "
+            "discretizaciones de Poisson o de elasticidad). A diferencia de Jacobi, Gauss-Seidel y SOR, su número de "
+            "iteraciones crece con la raíz del número de condición, y un buen precondicionador lo reduce aún más."
+        ),
+        # Cómo funciona
+        "how_it_works": (
+            "1. Se calcula el residuo r0 = b - A·x0 y la dirección inicial p0 = z0 = M⁻¹·r0.\n"
+            "2. En cada iteración se avanza en la dirección p_k el paso óptimo α_k = (r_k·z_k) / (p_k·A·p_k):\n"
+            "      x_{k+1} = x_k + α_k·p_k,   r_{k+1} = r_k - α_k·A·p_k.\n"
+            "3. Se precondiciona el residuo, z_{k+1} = M⁻¹·r_{k+1}, y la nueva dirección es A-conjugada a las anteriores:\n"
+            "      p_{k+1} = z_{k+1} + β_k·p_k,   β_k = (r_{k+1}·z_{k+1}) / (r_k·z_k).\n"
+            "4. M puede ser: none (sin precondicionar), jacobi (la diagonal de A), ssor o ic (Cholesky incompleta).\n"
+            "5. Se repite hasta que el residuo sea menor que la tolerancia o se alcance el máximo de iteraciones."
+        ),
+        # Datos requeridos
+        "required_inputs": [
+            "Matriz A simétrica definida positiva (filas separadas por ';')",
+            "Vector b (separado por comas)",
+            "Vector inicial x0",
+            "Tolerancia (Tol)",
+            "Máximo iteraciones (it)",
+            "Precondicionador: none, jacobi, ssor o ic"
+        ],
+        # Qué verá el usuario en la GUI
+        "ui_info": (
+            "En la interfaz podrás ver:\n"
+            "• Una tabla con x^{(k)}, el residuo ||b - A·x^{(k)}|| y el residuo relativo en cada iteración.\n"
+            "• El precondicionador usado y el residuo final.\n"
+            "• Con el informe de Jacobi, Gauss-Seidel o SOR, PCG aparece también en la comparación."
+        ),
+        # Ejemplo
+        "example": (
+            "Ejemplo de uso:\n"
+            "• Matriz A = '4,1,0;1,4,1;0,1,4'\n"
+            "• Vector b = '1,2,3'\n"
+            "• x0 = '0,0,0'\n"
+            "• Tol = 1e-8\n"
+            "• it = 50\n"
+            "• Precondicionador = jacobi\n\n"
+            "En un sistema 3×3, PCG termina en a lo sumo 3 iteraciones (en aritmética exacta)."
+        )
+    },
+
+    "GMRES(m)": {
+        "module": ("gmres", "gmres_method"),
+        # Descripción corta, general
+        "description": (
+            "GMRES con reinicio resuelve sistemas A·x = b generales (no simétricos y sin diagonal dominante) "
+            "eligiendo en cada iteración el x que minimiza el residuo sobre un espacio de Krylov."
+        ),
+        # Para qué sirve
+        "purpose": (
+            "Es la alternativa cuando Jacobi, Gauss-Seidel y SOR divergen (radio espectral ≥ 1). El residuo nunca "
+            "aumenta dentro de un ciclo; el reinicio cada m iteraciones limita la memoria a m vectores."
+        ),
+        # Cómo funciona
+        "how_it_works": (
+            "1. Con r0 = b - A·x0 se construye, por Arnoldi, una base ortonormal v1, ..., vk de span{r0, A·r0, A²·r0, ...}.\n"
+            "2. x_k = x0 + V_k·y_k, donde y_k minimiza ||b - A·x_k||; las rotaciones de Givens dan ese residuo en cada paso.\n"
+            "3. Al llegar a m vectores se reinicia desde x_m (GMRES(m)).\n"
+            "4. Con precondicionador M (un barrido de Jacobi, Gauss-Seidel, SOR o SSOR) se resuelve M⁻¹A·x = M⁻¹b "
+            "(por la izquierda) o A·M⁻¹·u = b con x = M⁻¹u (por la derecha).\n"
+            "5. Se repite hasta que el residuo sea menor que la tolerancia o se alcance el máximo de iteraciones."
+        ),
+        # Datos requeridos
+        "required_inputs": [
+            "Matriz A (filas separadas por ';')",
+            "Vector b (separado por comas)",
+            "Vector inicial x0",
+            "Tolerancia (Tol)",
+            "Máximo iteraciones (it)",
+            "Reinicio m (por defecto 30)",
+            "Precondicionador: none, jacobi, gauss_seidel, sor o ssor",
+            "Lado del precondicionador: right o left",
+            "Factor w (solo para sor y ssor)"
+        ],
+        # Qué verá el usuario en la GUI
+        "ui_info": (
+            "En la interfaz podrás ver:\n"
+            "• Una tabla con x^{(k)} y el residuo (absoluto y relativo) de cada iteración.\n"
+            "• Con precondicionador por la derecha el residuo es el verdadero ||b - A·x||; por la izquierda, ||M⁻¹(b - A·x)||."
+        ),
+        # Ejemplo
+        "example": (
+            "Ejemplo de uso (Jacobi y Gauss-Seidel divergen con esta matriz):\n"
+            "• Matriz A = '1,2,0;3,1,1;0,2,1'\n"
+            "• Vector b = '3,5,3'\n"
+            "• x0 = '0,0,0'\n"
+            "• Tol = 1e-8, it = 50, m = 30, precondicionador = none\n\n"
+            "GMRES llega a x = (1, 1, 1) en a lo sumo 3 iteraciones (la dimensión del sistema)."
+        )
+    },
+
+    "BiCGSTAB": {
+        "module": ("bicgstab", "bicgstab_method"),
+        # Descripción corta, general
+        "description": (
+            "BiCGSTAB (gradiente biconjugado estabilizado) resuelve sistemas A·x = b no simétricos con memoria fija, "
+            "combinando un paso de gradiente biconjugado con un paso que suaviza el residuo."
+        ),
+        # Para qué sirve
+        "purpose": (
+            "Sirve, como GMRES, cuando los métodos estacionarios divergen. No necesita guardar una base creciente, "
+            "así que es útil en sistemas grandes; su residuo puede oscilar, a diferencia del de GMRES."
+        ),
+        # Cómo funciona
+        "how_it_works": (
+            "1. Se fija r̂ = r0 = b - A·x0.\n"
+            "2. En cada iteración se da un paso de gradiente biconjugado en la dirección p_k, "
+            "s = r_k - α·A·p_k, con α = (r̂·r_k) / (r̂·A·p_k).\n"
+            "3. Luego un paso de residuo mínimo sobre s: ω = (t·s) / (t·t) con t = A·s, y r_{k+1} = s - ω·t.\n"
+            "4. Con precondicionador M (un barrido de Jacobi, Gauss-Seidel, SOR o SSOR) las direcciones pasan por M⁻¹ "
+            "(por la derecha) o se itera sobre M⁻¹A (por la izquierda).\n"
+            "5. Se repite hasta que el residuo sea menor que la tolerancia o se alcance el máximo de iteraciones."
+        ),
+        # Datos requeridos
+        "required_inputs": [
+            "Matriz A (filas separadas por ';')",
+            "Vector b (separado por comas)",
+            "Vector inicial x0",
+            "Tolerancia (Tol)",
+            "Máximo iteraciones (it)",
+            "Precondicionador: none, jacobi, gauss_seidel, sor o ssor",
+            "Lado del precondicionador: right o left",
+            "Factor w (solo para sor y ssor)"
+        ],
+        # Qué verá el usuario en la GUI
+        "ui_info": (
+            "En la interfaz podrás ver:\n"
+            "• Una tabla con x^{(k)} y el residuo (absoluto y relativo) de cada iteración.\n"
+            "• Si el método se interrumpe (división por cero interna) se indica con un mensaje; pruebe GMRES u otro x0."
+        ),
+        # Ejemplo
+        "example": (
+            "Ejemplo de uso:\n"
+            "• Matriz A = '1,2,0;3,1,1;0,2,1'\n"
+            "• Vector b = '3,5,3'\n"
+            "• x0 = '0,0,0'\n"
+            "• Tol = 1e-8, it = 50, precondicionador = none\n\n"
+            "BiCGSTAB aproxima x = (1, 1, 1) aunque Jacobi y Gauss-Seidel divergen."
+        )
+    },
+
+    "Factorización LU": {
+        "module": ("directos", "lu_method"),
+        # Descripción corta, general
+        "description": (
+            "Método directo: factoriza P·A·Q = L·U (L triangular inferior con unos en la diagonal, U triangular "
+            "superior) y resuelve A·x = b con una sustitución hacia adelante y otra hacia atrás."
+        ),
+        # Para qué sirve
+        "purpose": (
+            "Da la solución exacta (salvo redondeo) en un número fijo de operaciones, sin tolerancia ni iteraciones. "
+            "La factorización se guarda: volver a resolver con la misma A y otro b solo cuesta las dos sustituciones."
+        ),
+        # Cómo funciona
+        "how_it_works": (
+            "1. Eliminación gaussiana: en el paso k se anulan los elementos bajo a_kk restando múltiplos "
+            "m_ik = a_ik / a_kk de la fila k; los m_ik forman L y lo que queda, U.\n"
+            "2. Pivoteo parcial: antes de cada paso se sube la fila con el mayor |a_ik| de la columna k (P). "
+            "Pivoteo total: se elige el mayor |a_ij| de toda la submatriz restante e intercambia filas y columnas (P y Q).\n"
+            "3. Se resuelve L·y = P·b hacia adelante y U·z = y hacia atrás; x = Q·z.\n"
+            "4. Las columnas se procesan por bloques, así la mayor parte del trabajo es un producto de matrices."
+        ),
+        # Datos requeridos
+        "required_inputs": [
+            "Matriz A (filas separadas por ';')",
+            "Vector b (separado por comas)",
+            "Pivoteo: none, partial o total"
+        ],
+        # Qué verá el usuario en la GUI
+        "ui_info": (
+            "En la interfaz podrás ver:\n"
+            "• Las matrices L y U, el orden de filas (y de columnas con pivoteo total) y det(A).\n"
+            "• Una tabla con cada componente x_i y su residuo (b - A·x)_i.\n"
+            "• Si la factorización se reutilizó de una ejecución anterior con la misma A."
+        ),
+        # Ejemplo
+        "example": (
+            "Ejemplo de uso:\n"
+            "• Matriz A = '2,1,1;4,3,3;8,7,9'\n"
+            "• Vector b = '1,2,3'\n"
+            "• Pivoteo = partial\n\n"
+            "Resultado: x = (0.5, 0.5, -0.5) y det(A) = 4."
+        )
+    },
+
+    "Cholesky / LDLᵀ": {
+        "module": ("directos", "cholesky_method"),
+        # Descripción corta, general
+        "description": (
+            "Método directo para matrices simétricas: A = L·Lᵀ (Cholesky) si A es definida positiva y "
+            "P·A·Pᵀ = L·D·Lᵀ con pivoteo de Bunch-Kaufman si es indefinida. Detecta solo la simetría y la "
+            "definición positiva."
+        ),
+        # Para qué sirve
+        "purpose": (
+            "Aprovecha la simetría: hace la mitad de operaciones que LU y guarda solo el triángulo inferior del "
+            "factor (empaquetado), que se reutiliza para nuevos vectores b. Si A no es simétrica usa LU."
+        ),
+        # Cómo funciona
+        "how_it_works": (
+            "1. Se comprueba si A = Aᵀ.\n"
+            "2. Se elimina sin pivoteo, trabajando solo con el triángulo inferior y por bloques de columnas, "
+            "mientras todos los pivotes sean positivos.\n"
+            "3. Si todos lo son, A es definida positiva y el factor se convierte en el de Cholesky, L·sqrt(D); "
+            "se resuelve L·y = b hacia adelante y Lᵀ·x = y hacia atrás.\n"
+            "4. Con un pivote cero o negativo (A indefinida), la eliminación sin pivoteo deja de ser estable: se "
+            "factoriza P·A·Pᵀ = L·D·Lᵀ con pivoteo simétrico de Bunch-Kaufman (D con bloques de 1x1 y 2x2).\n"
+            "5. Si A no es simétrica, se resuelve con LU y pivoteo parcial."
+        ),
+        # Datos requeridos
+        "required_inputs": [
+            "Matriz A (filas separadas por ';')",
+            "Vector b (separado por comas)"
+        ],
+        # Qué verá el usuario en la GUI
+        "ui_info": (
+            "En la interfaz podrás ver:\n"
+            "• Qué factorización se usó (Cholesky, LDLᵀ pivoteada o LU), el factor L (y D y P) y det(A).\n"
+            "• Una tabla con cada componente x_i y su residuo (b - A·x)_i."
+        ),
+        # Ejemplo
+        "example": (
+            "Ejemplo de uso:\n"
+            "• Matriz A = '4,2,0;2,5,1;0,1,3'\n"
+            "• Vector b = '1,2,3'\n\n"
+            "A es simétrica definida positiva: se usa Cholesky, con L = [[2,0,0],[1,2,0],[0,0.5,1.658]]."
+        )
+    },
+
+    "Matriz de banda (Thomas / LU)": {
+        "module": ("bandas", "band_method"),
+        # Descripción corta, general
+        "description": (
+            "Método directo para matrices de banda (solo kl subdiagonales y ku superdiagonales no nulas): "
+            "guarda únicamente la banda y resuelve con el algoritmo de Thomas (tridiagonal) o con LU de banda."
+        ),
+        # Para qué sirve
+        "purpose": (
+            "Los sistemas de banda (tridiagonales de splines y diferencias finitas, pentadiagonales, ...) se resuelven "
+            "de forma exacta en O(n) o O(n·kl·(kl + ku)) operaciones, mucho menos que una LU densa O(n³) o que "
+            "muchas iteraciones de Jacobi o Gauss-Seidel."
+        ),
+        # Cómo funciona
+        "how_it_works": (
+            "1. Se detecta la banda de A (kl, ku) y se guarda en formato LAPACK: ab[ku + i - j, j] = a_ij.\n"
+            "2. Si A es tridiagonal y diagonalmente dominante (o simétrica definida positiva), algoritmo de Thomas: w_1 = d_1, m_i = a_i / w_{i-1}, w_i = d_i - m_i·c_{i-1}; "
+            "luego y_i = b_i - m_i·y_{i-1} y x_i = (y_i - c_i·x_{i+1}) / w_i.\n"
+            "3. Si no (Thomas, sin pivoteo, podría dar un resultado erróneo), LU con pivoteo parcial dentro de la banda.\n"
+            "4. Jacobi, Gauss-Seidel y SOR hacen lo mismo con la opción 'Banda = auto' si A es tridiagonal (n >= 3) "
+            "o la banda ocupa a lo sumo la mitad de las columnas (kl + ku + 1 <= n/2); si no, iteran. "
+            "Con 'Mostrar informe' siempre iteran, para el informe."
+        ),
+        # Datos requeridos
+        "required_inputs": [
+            "Matriz A (filas separadas por ';')",
+            "Vector b (separado por comas)"
+        ],
+        # Qué verá el usuario en la GUI
+        "ui_info": (
+            "En la interfaz podrás ver:\n"
+            "• La banda detectada (kl, ku) y el algoritmo usado.\n"
+            "• La solución x y el residuo ||b - A·x||."
+        ),
+        # Ejemplo
+        "example": (
+            "Ejemplo de uso:\n"
+            "• Matriz A = '4,1,0,0;1,4,1,0;0,1,4,1;0,0,1,4'\n"
+            "• Vector b = '5,6,6,5'\n\n"
+            "A es tridiagonal (kl = ku = 1): Thomas da x = (1, 1, 1, 1)."
+        )
+    },
+
+    "Multigrid (Poisson)": {
+        "module": ("multigrid", "multigrid_method"),
+        # Descripción corta, general
+        "description": (
+            "Multigrid geométrico para sistemas tipo Poisson en mallas 1D o 2D: combina unos pocos barridos de "
+            "Gauss-Seidel o Jacobi ponderado con correcciones calculadas en mallas cada vez más gruesas."
+        ),
+        # Para qué sirve
+        "purpose": (
+            "Jacobi y Gauss-Seidel eliminan rápido el error oscilante pero muy lento el error suave, así que sus "
+            "iteraciones crecen con el tamaño de la malla. Multigrid corrige el error suave en la malla gruesa, donde "
+            "vuelve a ser oscilante: el número de ciclos casi no cambia aunque la malla llegue a millones de incógnitas."
+        ),
+        # Cómo funciona
+        "how_it_works": (
+            "1. Se construyen los niveles: la malla de n puntos (n impar, idealmente 2^k - 1) pasa a (n - 1)/2 puntos "
+            "por lado; la forma 1D o 2D se deduce del ancho de banda de A.\n"
+            "2. Pre-suavizado: 2 barridos de Gauss-Seidel o de Jacobi ponderado.\n"
+            "3. El residuo r = b - A·x se restringe a la malla gruesa (R = Pᵀ/2^d) y allí se resuelve A_c·e = R·r "
+            "con el mismo ciclo, hasta la malla más gruesa (resuelta de forma directa).\n"
+            "4. La corrección se interpola a la malla fina (P lineal), x = x + P·e, y se hacen 2 barridos de post-suavizado.\n"
+            "5. Ciclo V: una corrección gruesa por nivel; ciclo F: un ciclo F seguido de un ciclo V en la malla gruesa.\n"
+            "6. Se repiten ciclos hasta que el residuo sea menor que la tolerancia o se alcance el máximo de ciclos."
+        ),
+        # Datos requeridos
+        "required_inputs": [
+            "Matriz A de una malla 1D (tridiagonal) o 2D de n x n puntos (filas separadas por ';')",
+            "Vector b (separado por comas)",
+            "Vector inicial x0",
+            "Tolerancia (Tol)",
+            "Máximo de ciclos (it)",
+            "Ciclo: V o F",
+            "Suavizador: gauss_seidel o jacobi"
+        ],
+        # Qué verá el usuario en la GUI
+        "ui_info": (
+            "En la interfaz podrás ver:\n"
+            "• Una tabla con x^{(k)} y el residuo (absoluto y relativo) después de cada ciclo.\n"
+            "• Los niveles de malla usados y el factor medio de reducción del residuo por ciclo."
+        ),
+        # Ejemplo
+        "example": (
+            "Ejemplo de uso:\n"
+            "• Matriz A = '2,-1,0,0,0,0,0;-1,2,-1,0,0,0,0;0,-1,2,-1,0,0,0;0,0,-1,2,-1,0,0;0,0,0,-1,2,-1,0;0,0,0,0,-1,2,-1;0,0,0,0,0,-1,2'\n"
+            "• Vector b = '1,1,1,1,1,1,1'\n"
+            "• x0 = '0,0,0,0,0,0,0'\n"
+            "• Tol = 1e-8, it = 20, ciclo = V, suavizador = gauss_seidel\n\n"
+            "Con 3 niveles (7 → 3 → 1 puntos) converge en unos 5 ciclos; en mallas mucho más grandes el número "
+            "de ciclos apenas aumenta."
+        )
+    },
+
+    "Refinamiento (precisión mixta)": {
+        "module": ("refinamiento", "refinement_method"),
+        # Descripción corta, general
+        "description": (
+            "Refinamiento iterativo en precisión mixta: resuelve A·x = b haciendo la parte cara en float32 "
+            "(factorización o iteraciones de Jacobi / Gauss-Seidel) y corrige el resultado con residuos en float64."
+        ),
+        # Para qué sirve
+        "purpose": (
+            "En sistemas grandes el costo está en mover datos: en float32 la matriz y su factor ocupan la mitad y "
+            "cada operación procesa el doble de números. El refinamiento recupera la precisión completa de float64 "
+            "con unas pocas correcciones baratas, siempre que A no esté demasiado mal condicionada (cond(A) < 10⁷ aprox.)."
+        ),
+        # Cómo funciona
+        "how_it_works": (
+            "1. Se copia A a float32 y se factoriza una sola vez (Cholesky, LDLᵀ o LU, como en los métodos directos) "
+            "o se arma la partición de Jacobi / Gauss-Seidel en float32.\n"
+            "2. Se calcula el residuo r = b - A·x en float64.\n"
+            "3. Se resuelve A·d = r en float32 (r escalado por su máximo para no perder sus entradas pequeñas).\n"
+            "4. Se actualiza x = x + d en float64.\n"
+            "5. Se repiten los pasos 2-4 hasta que el residuo sea menor que la tolerancia o deje de bajar."
+        ),
+        # Datos requeridos
+        "required_inputs": [
+            "Matriz A (filas separadas por ';')",
+            "Vector b (separado por comas)",
+            "Vector inicial x0",
+            "Tolerancia (Tol)",
+            "Máximo de correcciones (it)",
+            "Corrección: direct, jacobi o gauss_seidel"
+        ],
+        # Qué verá el usuario en la GUI
+        "ui_info": (
+            "En la interfaz podrás ver:\n"
+            "• Una tabla con x^{(k)} y el residuo (absoluto y relativo) después de cada corrección.\n"
+            "• La precisión usada en cada fase, la memoria en float32 y, con Jacobi o Gauss-Seidel, "
+            "las iteraciones internas."
+        ),
+        # Ejemplo
+        "example": (
+            "Ejemplo de uso:\n"
+            "• Matriz A = '4,1,0;1,4,1;0,1,4'\n"
+            "• Vector b = '5,6,5'\n"
+            "• x0 = '0,0,0'\n"
+            "• Tol = 1e-14, it = 10, corrección = direct\n\n"
+            "A es simétrica definida positiva: se factoriza con Cholesky en float32 y en 2 o 3 correcciones "
+            "x = (1, 1, 1) con residuo relativo del orden de 1e-15."
+        )
+    },
+
     "Vandermonde": {
         "module": ("Vandermonde", "interpolacion_vandermonde"),
         # Descripción corta, general
@@ -740,10 +1334,22 @@ METHODS = {
 ROOT_METHODS = [
     "Bisección",
     "Regla Falsa",
+    "Regla Falsa (Illinois)",
+    "Regla Falsa (Anderson-Björck)",
     "Newton",
     "Secante",
     "Punto Fijo",
-    "Raíces Múltiples"
+    "Raíces Múltiples",
+    "Chandrupatla"
+]
+
+# Métodos de interpolación: dibujan con matplotlib, así que corren en el hilo de Tk
+INTERPOLATION_METHODS = [
+    "Vandermonde",
+    "Interpolación Newton",
+    "Interpolación Lagrange",
+    "Spline Lineal",
+    "Spline Cúbico"
 ]
 
 # Traducción de parámetros comunes
@@ -756,6 +1362,15 @@ SPANISH_PARAMS = {
     "max_iterations": "Máximo de iteraciones",
     "error_type": "Tipo de error (abs/rel)",
     "w": "Factor de relajación (w)",
+    "preconditioner": "Precondicionador",
+    "restart": "Reinicio m (GMRES)",
+    "side": "Lado del precondicionador (left/right)",
+    "cycle": "Ciclo multigrid (V/F)",
+    "smoother": "Suavizador (gauss_seidel/jacobi)",
+    "trace": "Registro (full/errors/every:k/last:N)",
+    "pivoting": "Pivoteo (none/partial/total)",
+    "band": "Banda (off/auto)",
+    "solver": "Corrección (direct/jacobi/gauss_seidel)",
     "A": "Matriz A (separar filas con ;)",
     "b": "Vector b (separar con ,)",
     "x_points": "Puntos x (separar con ,)",
@@ -781,6 +1396,20 @@ class App(tk.Tk):
         # Historial de ejecuciones para el informe comparativo
         # Cada entrada: {"method", "root", "iterations", "final_error", "error_type"}
         self.run_history = []
+        # Pool de procesos de la comparación automática (se crea al primer uso)
+        self._comparison_pool = None
+        # {future: CachedFunction de la sesión} a la que se pasan los valores de cada proceso
+        self._comparison_caches = {}
+        # Ejecución en curso (tareas.Job), para poder cancelarla
+        self.current_job = None
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self):
+        if self.current_job is not None:
+            self.current_job.cancel()
+        if self._comparison_pool is not None:
+            self._comparison_pool.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
 
 
     def show_main_menu(self):
@@ -802,8 +1431,9 @@ class App(tk.Tk):
         button_frame.pack()
 
         categories = {
-            "Ecuaciones No Lineales": ["Bisección", "Regla Falsa", "Newton", "Secante", "Punto Fijo", "Raíces Múltiples"],
-            "Sistemas Lineales": ["Jacobi", "Gauss-Seidel", "SOR"],
+            "Ecuaciones No Lineales": ["Bisección", "Regla Falsa", "Newton", "Secante", "Punto Fijo", "Raíces Múltiples",
+                                       "Chandrupatla", "Regla Falsa (Illinois)", "Regla Falsa (Anderson-Björck)"],
+            "Sistemas Lineales": ["Jacobi", "Gauss-Seidel", "Gauss-Seidel (multicolor)", "SOR", "Gradiente Conjugado (PCG)", "GMRES(m)", "BiCGSTAB", "Multigrid (Poisson)", "Factorización LU", "Cholesky / LDLᵀ", "Matriz de banda (Thomas / LU)", "Refinamiento (precisión mixta)"],
             "Interpolación": ["Vandermonde", "Interpolación Newton", "Interpolación Lagrange", "Spline Lineal", "Spline Cúbico"]
         }
 
@@ -1090,7 +1720,7 @@ class App(tk.Tk):
         use_f = params and params[0] == 'f'
 
         # Ahora también saltamos error_type porque lo manejamos con un combobox aparte
-        SKIP_PARAMS = {'show_report', 'eval_grid', 'auto_compare', 'error_type'}
+        SKIP_PARAMS = {'show_report', 'eval_grid', 'auto_compare', 'error_type', 'variant', 'workers'}
         params = [p for p in params if p not in SKIP_PARAMS]
 
         if use_f:
@@ -1111,6 +1741,10 @@ class App(tk.Tk):
                      bg='#f0f0f0', fg='#2c3e50').grid(row=row, column=0, sticky='w', pady=5)
             entry = tk.Entry(input_frame, width=50, font=("Arial", 10))
             entry.grid(row=row, column=1, padx=(10, 0), pady=5, sticky='ew')
+            # los parámetros opcionales (precondicionador, reinicio, ...) vienen rellenos con su valor por defecto
+            default = sig.parameters[param].default
+            if default is not inspect.Parameter.empty and default is not None:
+                entry.insert(0, str(default))
             entries[param] = entry
             row += 1
 
@@ -1125,6 +1759,10 @@ class App(tk.Tk):
         # 🔹 NUEVO: checkbox para comparar tipos de error en el Capítulo 1
         self.compare_error_types_var = tk.BooleanVar(value=False)
 
+        # checkbox para buscar todas las raíces de [a, b] barriendo la malla de Eval grid
+        # (los métodos abiertos no piden [a, b], así que no lo muestran)
+        self.find_all_roots_var = tk.BooleanVar(value=False)
+
         # NUEVO: tipo de error seleccionado por el usuario
         error_type_var = tk.StringVar(value='rel')  # 'rel', 'abs' o 'cond'
 
@@ -1153,6 +1791,15 @@ class App(tk.Tk):
             bg='#f0f0f0'
         ).pack(side='left', padx=(10, 10))
 
+        # el barrido necesita [a, b]: solo se ofrece en los métodos de intervalo
+        if 'lower_bound' in params and 'upper_bound' in params:
+            tk.Checkbutton(
+                opts_frame,
+                text='Buscar todas las raíces',
+                variable=self.find_all_roots_var,
+                bg='#f0f0f0'
+            ).pack(side='left', padx=(10, 10))
+
         tk.Label(opts_frame, text='Eval grid:', bg='#f0f0f0').pack(side='left')
         tk.Entry(opts_frame, textvariable=eval_grid_var, width=6).pack(side='left', padx=(5, 0))
 
@@ -1172,6 +1819,7 @@ class App(tk.Tk):
 
                 # reset valores para graficar
                 self.last_function_str = None
+                self.last_function = None
                 self.last_a = None
                 self.last_b = None
 
@@ -1183,11 +1831,10 @@ class App(tk.Tk):
 
                     self.last_function_str = f_str
 
-                    f = lambda x: eval(f_str, {
-                        "np": np, "x": x, "math": math,
-                        "sin": np.sin, "cos": np.cos, "tan": np.tan,
-                        "exp": np.exp, "log": np.log, "sqrt": np.sqrt
-                    })
+                    # Se compila una sola vez; la misma función la usan todos los métodos y la gráfica.
+                    # La caché LRU se comparte en toda la sesión de comparación de esta ejecución.
+                    f = CachedFunction(compile_expression(f_str))
+                    self.last_function = f
                     args.append(f)
 
                 x_vals = None
@@ -1195,6 +1842,8 @@ class App(tk.Tk):
 
                 tol_value = None
                 max_it_value = None
+                # parámetros que van después de los omitidos (error_type, ...) se pasan por nombre
+                keyword_args = {}
 
                 for param in params:
                     val = entries[param].get().strip()
@@ -1237,8 +1886,15 @@ class App(tk.Tk):
                             matrix.append([float(x.strip()) for x in row_.split(',')])
                         args.append(np.array(matrix))
                     elif param == "b":
-                        vector = [float(x.strip()) for x in val.split(',')]
-                        args.append(np.array(vector))
+                        if ';' in val and method_name == "Jacobi":
+                            # varios términos independientes: cada grupo es una columna de B (n x k)
+                            columns = [[float(x.strip()) for x in group.split(',')] for group in val.split(';')]
+                            args.append(np.array(columns).T)
+                        else:
+                            vector = [float(x.strip()) for x in val.split(',')]
+                            args.append(np.array(vector))
+                    elif param in ("trace", "band"):
+                        keyword_args[param] = val
                     else:
                         try:
                             args.append(float(val))
@@ -1250,7 +1906,7 @@ class App(tk.Tk):
                     self.ultimo_y = y_vals
                     args = [x_vals, y_vals] + args
 
-                kwargs = {}
+                kwargs = dict(keyword_args)
                 try:
                     f_sig = inspect.signature(func)
                     if 'show_report' in f_sig.parameters:
@@ -1273,70 +1929,183 @@ class App(tk.Tk):
                     pass
 
                 # === EJECUCIÓN PRINCIPAL ===
-                result = func(*args, **kwargs)
-                self.last_called_show_report = bool(kwargs.get('show_report', False))
-
-                # NUEVO: construir y guardar resumen solo para métodos de raíces
-                if method_name in ROOT_METHODS:
-                    summary = self.build_run_summary(method_name, result, error_type_var.get())
-                    if summary:
-                        self.run_history.append(summary)
-
-                    # ⚠ AUTO-EJECUTAR los otros métodos de raíces para comparación
-                    if self.auto_cmp_var.get() and use_f and self.last_a is not None and self.last_b is not None:
-                        self.auto_run_other_root_methods(
-                            current_method=method_name,
-                            f_str=self.last_function_str,
-                            a=self.last_a,
-                            b=self.last_b,
-                            tol=tol_value,
-                            max_iter=max_it_value,
-                            error_type=error_type_var.get(),
-                            eval_grid=eval_grid_var.get()
-                        )
-
-                self.show_result(method_name, result)
-
-                # NUEVO: si el usuario quiere comparación automática e hizo un método de raíces, mostrar informe
-                if self.auto_cmp_var.get() and method_name in ROOT_METHODS:
-                    self.show_comparison_report(error_type_var.get())
-
-                # 🔹 NUEVO: Comparar TIPOS de error (abs/rel/cond) para ESTE método de raíces
-                if method_name in ROOT_METHODS and self.compare_error_types_var.get():
-                    error_runs = []
-                    tipos = ['abs', 'rel', 'cond']
+                # Los valores de la interfaz se leen aquí: el hilo de trabajo no toca Tk
+                error_type = error_type_var.get()
+                compare_types = method_name in ROOT_METHODS and self.compare_error_types_var.get()
+                scan_roots = (method_name in ROOT_METHODS and self.find_all_roots_var.get()
+                              and self.last_a is not None and self.last_b is not None)
+                try:
+                    grid = int(eval_grid_var.get())
+                except Exception:
+                    grid = 500
+                scan_f, scan_a, scan_b = self.last_function, self.last_a, self.last_b
 
-                    for et in tipos:
+                def work():
+                    """Todo el cálculo de la ejecución (corre en el hilo de trabajo)."""
+                    result = func(*args, **kwargs)
+
+                    # 🔹 NUEVO: Comparar TIPOS de error (abs/rel/cond) para ESTE método de raíces
+                    error_runs = []
+                    if compare_types:
                         local_kwargs = kwargs.copy()
                         # Forzamos configuración silenciosa sin informes ni auto comparación
                         local_kwargs['show_report'] = False
                         local_kwargs['auto_compare'] = False
-                        local_kwargs['error_type'] = et
 
+                        # Una sola corrida calcula los tres criterios ('all') y dice
+                        # en qué iteración se habría detenido cada uno
+                        runs_by_type = None
                         try:
-                            res_et = func(*args, **local_kwargs)
-                            summary_et = self.build_run_summary(method_name, res_et, et)
-                            if summary_et:
-                                error_runs.append(summary_et)
+                            local_kwargs['error_type'] = 'all'
+                            runs_by_type = func(*args, **local_kwargs)
                         except Exception:
-                            continue
+                            runs_by_type = None
 
-                    if error_runs:
-                        self.show_error_type_report(method_name, error_runs)
+                        for et in ['abs', 'rel', 'cond']:
+                            try:
+                                if isinstance(runs_by_type, dict) and et in runs_by_type:
+                                    res_et = runs_by_type[et]
+                                else:
+                                    # método sin modo 'all': se repite la corrida con ese criterio
+                                    local_kwargs['error_type'] = et
+                                    res_et = func(*args, **local_kwargs)
+                                summary_et = self.build_run_summary(method_name, res_et, et)
+                                if summary_et:
+                                    error_runs.append(summary_et)
+                            except Exception:
+                                continue
+
+                    # Todas las raíces de [a, b]: barrido en la malla y el método elegido en cada subintervalo
+                    roots = None
+                    if scan_roots:
+                        solver = as_bracket_solver(func)
+                        if solver is not None:
+                            roots = find_all_roots(
+                                scan_f, scan_a, scan_b, solver,
+                                tol_value if tol_value is not None else 1e-4,
+                                max_it_value if max_it_value is not None else 50,
+                                error_type=error_type,
+                                eval_grid=grid
+                            )
+
+                    return result, error_runs, roots
+
+                def finish(outcome):
+                    """Muestra los resultados (en el hilo de Tk, cuando la tarea terminó)."""
+                    # con Cancelar o Volver el usuario ya no espera este resultado: no
+                    # se reemplaza la pantalla a la que se fue
+                    if job.cancel_requested():
+                        return
+                    result, error_runs, roots = outcome
+                    try:
+                        self.last_called_show_report = bool(kwargs.get('show_report', False))
+
+                        # métodos de la comparación que siguen ejecutándose en el pool
+                        pending_runs = {}
+
+                        # NUEVO: construir y guardar resumen solo para métodos de raíces
+                        if method_name in ROOT_METHODS:
+                            summary = self.build_run_summary(method_name, result, error_type)
+                            if summary:
+                                self.run_history.append(summary)
+
+                            # ⚠ AUTO-EJECUTAR los otros métodos de raíces para comparación
+                            if self.auto_cmp_var.get() and use_f and self.last_a is not None and self.last_b is not None:
+                                pending_runs = self.auto_run_other_root_methods(
+                                    current_method=method_name,
+                                    f_str=self.last_function_str,
+                                    a=self.last_a,
+                                    b=self.last_b,
+                                    tol=tol_value,
+                                    max_iter=max_it_value,
+                                    error_type=error_type,
+                                    eval_grid=grid,
+                                    f=self.last_function
+                                )
+
+                        auto_cmp = self.auto_cmp_var.get()
+                        self.show_result(method_name, result)
+
+                        # NUEVO: si el usuario quiere comparación automática e hizo un método de raíces, mostrar informe
+                        if auto_cmp and method_name in ROOT_METHODS:
+                            self.show_comparison_report(error_type, self._function_cache_info(), pending_runs)
+
+                        if error_runs:
+                            self.show_error_type_report(method_name, error_runs, self._function_cache_info())
+
+                        if roots is not None:
+                            self.show_all_roots_report(method_name, roots, grid)
+
+                    except Exception as e:
+                        messagebox.showerror("Error", f"Error en la ejecución: {str(e)}")
+
+                def reset_controls(message=""):
+                    if run_button.winfo_exists():
+                        run_button.config(state='normal')
+                        cancel_button.config(state='disabled')
+                    progress_var.set(message)
+
+                def on_progress(iteration, error):
+                    text = f"Iteración {iteration}"
+                    if error is not None:
+                        try:
+                            text += f"  —  error: {float(error):.3e}"
+                        except (TypeError, ValueError):
+                            pass
+                    progress_var.set(text)
+
+                def on_error(e):
+                    reset_controls()
+                    messagebox.showerror("Error", f"Error en la ejecución: {str(e)}")
+
+                # Los métodos que dibujan con matplotlib (informes, interpolación) deben
+                # correr en el hilo de Tk; el resto va a un hilo de trabajo cancelable.
+                background = not (kwargs.get('show_report') or method_name in INTERPOLATION_METHODS)
+
+                run_button.config(state='disabled')
+                cancel_button.config(state='normal' if background else 'disabled')
+                progress_var.set("Ejecutando...")
+
+                job = Job(work, background=background)
+                self.current_job = run_job(
+                    self,
+                    job,
+                    on_done=finish,
+                    on_progress=on_progress,
+                    on_error=on_error,
+                    on_cancel=lambda: reset_controls("Ejecución cancelada.")
+                )
 
             except Exception as e:
                 messagebox.showerror("Error", f"Error en la ejecución: {str(e)}")
 
+        def go_back():
+            # si hay una ejecución en curso, se cancela antes de salir
+            if self.current_job is not None and not self.current_job.done():
+                self.current_job.cancel()
+            self.show_method_info(method_name)
+
+        progress_var = tk.StringVar(value="")
+        tk.Label(main_frame, textvariable=progress_var, font=("Arial", 10),
+                 bg='#f0f0f0', fg='#2c3e50').pack(pady=(10, 0))
+
         button_frame = tk.Frame(main_frame, bg='#f0f0f0')
         button_frame.pack(pady=20)
 
-        tk.Button(button_frame, text="Ejecutar Método", font=("Arial", 12, "bold"),
-                  bg='#27ae60', fg='white', padx=20, pady=8, cursor='hand2',
-                  command=execute).pack(side='left', padx=10)
+        run_button = tk.Button(button_frame, text="Ejecutar Método", font=("Arial", 12, "bold"),
+                               bg='#27ae60', fg='white', padx=20, pady=8, cursor='hand2',
+                               command=execute)
+        run_button.pack(side='left', padx=10)
+
+        cancel_button = tk.Button(button_frame, text="Cancelar", font=("Arial", 12),
+                                  bg='#e74c3c', fg='white', padx=20, pady=8, cursor='hand2',
+                                  state='disabled',
+                                  command=lambda: self.current_job is not None and self.current_job.cancel())
+        cancel_button.pack(side='left', padx=(0, 10))
 
         tk.Button(button_frame, text="Volver", font=("Arial", 12),
                   bg='#95a5a6', fg='white', padx=20, pady=8, cursor='hand2',
-                  command=lambda: self.show_method_info(method_name)).pack(side='left')
+                  command=go_back).pack(side='left')
 
     def show_result(self, method_name, result):
         for widget in self.winfo_children():
@@ -1375,10 +2144,13 @@ class App(tk.Tk):
         graficables = [
             "Bisección",
             "Regla Falsa",
+            "Regla Falsa (Illinois)",
+            "Regla Falsa (Anderson-Björck)",
             "Punto Fijo",
             "Newton",
             "Secante",
-            "Raíces Múltiples"
+            "Raíces Múltiples",
+            "Chandrupatla"
         ]
 
         if method_name in graficables:
@@ -1412,7 +2184,8 @@ class App(tk.Tk):
         table_data = None
         header_text = None
         if isinstance(result, tuple):
-            header_text = "\n".join([str(r) for r in result[:-1]]) if len(result) > 1 else None
+            # el informe de Cap. 2 (dict con métricas) ya se mostró en su figura
+            header_text = "\n".join([str(r) for r in result[:-1] if not isinstance(r, dict)]) if len(result) > 1 else None
             table_data = result[-1]
         elif isinstance(result, dict):
             table_data = result
@@ -1447,7 +2220,8 @@ class App(tk.Tk):
                 columns = ["Iteración", "a", "f(a)", "pm", "f(pm)", "b", "f(b)", "Error Abs."]
                 custom_headers = True
 
-            elif method_name == "Regla Falsa" and n_cols == 8:
+            elif method_name in ("Regla Falsa", "Regla Falsa (Illinois)", "Regla Falsa (Anderson-Björck)",
+                                 "Chandrupatla") and n_cols == 8:
                 # [Iter, A, F(A), B, F(B), Xr, F(Xr), Error]
                 columns = ["Iteración", "a", "f(a)", "b", "f(b)", "xr", "f(xr)", "Error"]
                 custom_headers = True
@@ -1496,7 +2270,8 @@ class App(tk.Tk):
             if isinstance(row, dict):
                 values = [str(row.get(col, '')) for col in columns]
             elif isinstance(row, (list, tuple)):
-                values = [str(val) for val in row]
+                # None: dato no guardado (p. ej. iterado con trace='errors')
+                values = ['' if val is None else str(val) for val in row]
             else:
                 values = [str(row)]
             tree.insert('', 'end', values=values)
@@ -1573,94 +2348,42 @@ class App(tk.Tk):
         Extrae un resumen de la ejecución de un método de raíces:
         raíz aproximada, número de iteraciones y error final.
         Supone que el último elemento de la tupla 'result' es la tabla de iteraciones.
+        (La lógica está en Python/comparacion.py para usarla también en los procesos.)
         """
+        return summarize_run(method_name, result, error_type)
 
-        table_data = result[-1] if isinstance(result, tuple) else result
-
-        if not isinstance(table_data, list) or not table_data:
-            return None
-
-        last_row = table_data[-1]
-        if not isinstance(last_row, (list, tuple)):
-            return None
-
-        n_cols = len(last_row)
-
-        # Formatos esperados de tablas (si coinciden, mejor):
-        # Bisección:        [Iter, A, F(A), Pm, F(Pm), B, F(B), Error]
-        # Regla Falsa:      [Iter, A, F(A), B, F(B), Xr, F(Xr), Error]
-        # Newton:           [Iter, x, f(x), f'(x), Error]
-        # Secante:          [Iter, x_{i-1}, x_i, f(x_i), Error]
-        # Punto Fijo:       [Iter, x, g(x), Error]
-        # Raíces Múltiples: [Iter, x, f(x), f'(x), f''(x), Error]
-
-        x_col_map = {
-            "Bisección": 3,        # Pm
-            "Regla Falsa": 5,      # Xr
-            "Newton": 1,           # x
-            "Secante": 2,          # x_i
-            "Punto Fijo": 1,       # x
-            "Raíces Múltiples": 1  # x
-        }
-
-        err_col_map = {
-            "Bisección": 7,        # Error Abs.
-            "Regla Falsa": 7,      # Error
-            "Newton": 4,           # Error
-            "Secante": 4,          # Error
-            "Punto Fijo": 3,       # Error
-            "Raíces Múltiples": 5  # Error
-        }
-
-        # Valores por defecto (plan B) si algo falla:
-        # - raíz ≈ columna 1 (la segunda)
-        # - error ≈ última columna
-        default_x_col = 1 if n_cols > 1 else 0
-        default_err_col = n_cols - 1
-
-        # Elegir índices
-        x_col = x_col_map.get(method_name, default_x_col)
-        err_col = err_col_map.get(method_name, default_err_col)
-
-        # Asegurar que están dentro de rango; si no, usar plan B
-        if x_col >= n_cols:
-            x_col = default_x_col
-        if err_col >= n_cols:
-            err_col = default_err_col
-
-        try:
-            approx_root = float(last_row[x_col])
-        except Exception:
-            # último intento: tomar la segunda columna que haya
-            try:
-                approx_root = float(last_row[default_x_col])
-            except Exception:
-                return None
+    def _function_cache_info(self):
+        """Estadísticas de la caché de f(x) de la ejecución actual (o None)."""
+        f = getattr(self, 'last_function', None)
+        return f.cache_info() if isinstance(f, CachedFunction) else None
 
-        try:
-            final_error = abs(float(last_row[err_col]))
-        except Exception:
-            # si falla, probamos con la última columna
-            try:
-                final_error = abs(float(last_row[default_err_col]))
-            except Exception:
-                return None
+    def _method_target(self, method_name):
+        """(módulo completo, nombre de función) de un método registrado en METHODS."""
+        method_info = METHODS[method_name]["module"]
+        package = METHODS[method_name].get("package", "")
 
-        iterations = len(table_data)
+        if isinstance(method_info, tuple):
+            module_name, function_name = method_info
+        else:
+            module_name = function_name = method_info
 
-        return {
-            "method": method_name,
-            "root": approx_root,
-            "iterations": iterations,
-            "final_error": final_error,
-            "error_type": error_type
-        }
+        if package:
+            return f"Python.{package}.{module_name}", function_name
+        return f"Python.{module_name}", function_name
 
-    def auto_run_other_root_methods(self, current_method, f_str, a, b, tol, max_iter, error_type, eval_grid):
+    def auto_run_other_root_methods(self, current_method, f_str, a, b, tol, max_iter, error_type, eval_grid, f=None):
         """
         Ejecuta automáticamente los demás métodos de raíces con la misma función f(x),
         el mismo intervalo [a, b] y la misma tolerancia / iteraciones, sin mostrar sus tablas,
         solo para llenar el informe comparativo.
+
+        Los métodos se envían a un pool de procesos (cada proceso reconstruye f
+        desde f_str, con los valores ya guardados en la caché de f de la sesión)
+        y se devuelve {future: nombre del método} con los pendientes;
+        show_comparison_report() los va agregando a medida que terminan y pasa
+        a la caché de la sesión los valores de f(x) que calculó cada proceso.
+        Si el pool no está disponible, se ejecutan aquí mismo reutilizando la
+        caché de f (la CachedFunction de la ejecución, si se pasa) y no queda nada pendiente.
         """
 
         # Valores por defecto si algo no vino definido
@@ -1669,119 +2392,62 @@ class App(tk.Tk):
         if max_iter is None:
             max_iter = 50
 
-        # Definir f(x) a partir de la cadena f_str
-        def f(x):
-            return eval(f_str, {
-                "np": np, "x": x, "math": math,
-                "sin": np.sin, "cos": np.cos, "tan": np.tan,
-                "exp": np.exp, "log": np.log, "sqrt": np.sqrt
-            })
+        if self._comparison_pool is None:
+            self._comparison_pool = create_pool()
+
+        pending = {}
+        local_f = f
+        seed = f.export() if isinstance(f, CachedFunction) else None
 
         for method_name in ROOT_METHODS:
             if method_name == current_method:
                 continue  # ya lo ejecutó el usuario
 
-            method_info = METHODS[method_name]["module"]
-            package = METHODS[method_name].get("package", "")
-
-            if isinstance(method_info, tuple):
-                module_name, function_name = method_info
-            else:
-                module_name = function_name = method_info
-
-            if package:
-                full_module = f"Python.{package}.{module_name}"
-            else:
-                full_module = f"Python.{module_name}"
-
-            try:
-                module = importlib.import_module(full_module)
-                func = getattr(module, function_name)
-            except Exception:
-                # Si no se puede importar, se salta este método
-                continue
-
-            try:
-                sig = inspect.signature(func)
-            except Exception:
-                continue
+            module_name, function_name = self._method_target(method_name)
+            task = (method_name, module_name, function_name, f_str, a, b, tol, max_iter, error_type, eval_grid)
 
-            params = list(sig.parameters.keys())
-            SKIP_PARAMS = {'show_report', 'eval_grid', 'auto_compare', 'error_type'}
-            core_params = [p for p in params if p not in SKIP_PARAMS]
-
-            args = []
-            kwargs = {}
-
-            # Si el primer parámetro es f, lo agregamos
-            idx = 0
-            if core_params and core_params[0] == 'f':
-                args.append(f)
-                idx = 1
-
-            # Construir argumentos según nombre de parámetro
-            for p in core_params[idx:]:
-                if p in ('lower_bound', 'a'):
-                    args.append(a)
-                elif p in ('upper_bound', 'b'):
-                    args.append(b)
-                elif p in ('x0', 'x_inicial', 'x_ini'):
-                    x0 = (a + b) / 2.0
-                    args.append(x0)
-                elif p in ('x1', 'x_inicial2', 'x1_ini'):
-                    x1 = b
-                    args.append(x1)
-                elif p == 'tolerance':
-                    args.append(tol)
-                elif p in ('max_iterations', 'n_iter', 'iteraciones'):
-                    args.append(max_iter)
-                else:
-                    # Fallback: usar el punto medio del intervalo
-                    args.append((a + b) / 2.0)
-
-            # Parámetros opcionales por kwargs
-            if 'error_type' in sig.parameters:
-                kwargs['error_type'] = error_type
-            if 'show_report' in sig.parameters:
-                kwargs['show_report'] = False  # no queremos más ventanas
-            if 'eval_grid' in sig.parameters:
+            if self._comparison_pool is not None:
                 try:
-                    kwargs['eval_grid'] = int(eval_grid)
+                    future = self._comparison_pool.submit(run_root_method, *task, seed=seed)
+                    pending[future] = method_name
+                    if isinstance(f, CachedFunction):
+                        self._comparison_caches[future] = f
+                    continue
                 except Exception:
-                    kwargs['eval_grid'] = 500
-            if 'auto_compare' in sig.parameters:
-                kwargs['auto_compare'] = False
+                    # pool roto: seguir sin él
+                    self._comparison_pool = None
 
-            # Ejecutar el método y guardar resumen
+            # Ejecución en este mismo proceso (sin pool)
+            if local_f is None:
+                local_f = CachedFunction(compile_expression(f_str))
             try:
-                result = func(*args, **kwargs)
-                summary = self.build_run_summary(method_name, result, error_type)
+                summary, _, _ = run_root_method(*task, f=local_f)
                 if summary:
                     self.run_history.append(summary)
             except Exception:
                 # Si algo falla en este método, simplemente no se añade
                 continue
 
-    
-    def show_comparison_report(self, error_type):
+        return pending
+
+    def show_comparison_report(self, error_type, cache_info=None, pending=None):
         """
         Muestra un informe comparativo entre todos los métodos de raíces que se han ejecutado
         en esta sesión con el mismo tipo de error (rel/abs/cond).
         Identifica y resalta cuál fue el mejor método.
+        cache_info: estadísticas de la caché de f(x) (CachedFunction.cache_info()), opcional.
+        pending: {future: método} de auto_run_other_root_methods(); el informe se
+                 completa a medida que los procesos terminan.
         """
+        pending = dict(pending or {})
 
-        runs = [r for r in self.run_history if r["error_type"] == error_type]
-
-        if not runs:
+        if not pending and not any(r["error_type"] == error_type for r in self.run_history):
             messagebox.showinfo(
                 "Informe",
                 f"No hay ejecuciones registradas con tipo de error '{error_type}'."
             )
             return
 
-        # Mejor método: menor error final; si empatan, menos iteraciones
-        best = min(runs, key=lambda r: (r["final_error"], r["iterations"]))
-
         win = tk.Toplevel(self)
         win.title(f"Informe comparativo - Error: {error_type}")
         win.geometry("700x400")
@@ -1806,17 +2472,6 @@ class App(tk.Tk):
             tree.heading(col, text=col)
             tree.column(col, width=150, anchor='center')
 
-        for r in runs:
-            vals = (
-                r["method"],
-                f"{r['root']:.6g}",
-                r["iterations"],
-                f"{r['final_error']:.3e}"
-            )
-            item_id = tree.insert('', 'end', values=vals)
-            if r is best:
-                tree.item(item_id, tags=('best',))
-
         tree.tag_configure('best', background='#d5f5e3')
 
         vscroll = ttk.Scrollbar(frame, orient='vertical', command=tree.yview)
@@ -1831,20 +2486,180 @@ class App(tk.Tk):
         info_frame = tk.Frame(win, bg='#f0f0f0')
         info_frame.pack(fill='x', padx=10, pady=(0, 10))
 
-        msg = (
-            f"Mejor método (según error '{error_type}'):\n"
-            f"- {best['method']} con error final ≈ {best['final_error']:.3e} "
-            f"en {best['iterations']} iteraciones."
+        msg_label = tk.Label(
+            info_frame,
+            text="",
+            font=("Arial", 10, "bold"),
+            bg='#f0f0f0',
+            fg='#2c3e50',
+            justify='left'
         )
+        msg_label.pack(anchor='w')
+
+        tk.Button(
+            win,
+            text="Cerrar",
+            font=("Arial", 10, "bold"),
+            bg='#95a5a6',
+            fg='white',
+            padx=15,
+            pady=5,
+            cursor='hand2',
+            command=win.destroy
+        ).pack(pady=(0, 10))
+
+        worker_caches = []
+
+        def refresh():
+            runs = [r for r in self.run_history if r["error_type"] == error_type]
+            tree.delete(*tree.get_children())
+            if not runs:
+                msg_label.config(text=f"Ejecutando {len(pending)} métodos...")
+                return
+
+            # Mejor método: menor error final; si empatan, menos iteraciones
+            best = min(runs, key=lambda r: (r["final_error"], r["iterations"]))
+
+            for r in runs:
+                vals = (
+                    r["method"],
+                    f"{r['root']:.6g}",
+                    r["iterations"],
+                    f"{r['final_error']:.3e}"
+                )
+                item_id = tree.insert('', 'end', values=vals)
+                if r is best:
+                    tree.item(item_id, tags=('best',))
+
+            msg = (
+                f"Mejor método (según error '{error_type}'):\n"
+                f"- {best['method']} con error final ≈ {best['final_error']:.3e} "
+                f"en {best['iterations']} iteraciones."
+            )
+            msg += self._cache_info_text(self._sum_cache_info(cache_info, worker_caches))
+            if pending:
+                msg += f"\nEjecutando {len(pending)} métodos más..."
+            msg_label.config(text=msg)
+
+        def poll():
+            for future in [fut for fut in pending if fut.done()]:
+                pending.pop(future)
+                try:
+                    summary, info, entries = future.result()
+                except Exception:
+                    # Si algo falla en este método, simplemente no se añade
+                    self._comparison_caches.pop(future, None)
+                    continue
+                # los valores de f(x) del proceso pasan a la caché de la sesión
+                session_f = self._comparison_caches.pop(future, None)
+                if session_f is not None:
+                    session_f.merge(entries)
+                if summary:
+                    self.run_history.append(summary)
+                if info is not None:
+                    worker_caches.append(info)
+            if win.winfo_exists():
+                refresh()
+            if pending:
+                self.after(100, poll)
+
+        refresh()
+        if pending:
+            self.after(100, poll)
+
+    def _sum_cache_info(self, cache_info, others):
+        """Suma las estadísticas de caché de la ejecución y de los procesos de la comparación."""
+        infos = [i for i in [cache_info] + list(others) if i is not None]
+        if not infos:
+            return None
+        return type(infos[0])(
+            sum(i.hits for i in infos),
+            sum(i.misses for i in infos),
+            infos[0].maxsize,
+            sum(i.currsize for i in infos)
+        )
+
+    def _cache_info_text(self, cache_info):
+        """Línea del informe con las evaluaciones de f(x) ahorradas por la caché."""
+        if cache_info is None:
+            return ""
+        total = cache_info.hits + cache_info.misses
+        return (
+            f"\nEvaluaciones de f(x): {cache_info.misses} calculadas, "
+            f"{cache_info.hits} reutilizadas de la caché (de {total} solicitadas)."
+        )
+
+    def show_all_roots_report(self, method_name, roots, eval_grid):
+        """
+        Muestra todas las raíces encontradas en [a, b] por el barrido de la
+        malla (find_all_roots), una fila por raíz; también los subintervalos
+        donde el método falló o convergió fuera del subintervalo.
+        """
+        win = tk.Toplevel(self)
+        win.title(f"Todas las raíces - {method_name}")
+        win.geometry("800x400")
+        win.configure(bg='#f0f0f0')
 
         tk.Label(
-            info_frame,
+            win,
+            text=f"RAÍCES EN [{self.last_a:g}, {self.last_b:g}] - {method_name.upper()}",
+            font=("Arial", 14, "bold"),
+            bg='#f0f0f0',
+            fg='#2c3e50'
+        ).pack(pady=(10, 10))
+
+        frame = tk.Frame(win, bg='#f0f0f0')
+        frame.pack(fill='both', expand=True, padx=10, pady=10)
+
+        columns = ("#", "Raíz", "f(raíz)", "Iteraciones", "Detección", "Subintervalo")
+
+        tree = ttk.Treeview(frame, columns=columns, show='headings', height=10)
+        for col in columns:
+            tree.heading(col, text=col)
+            tree.column(col, width=40 if col == "#" else 130, anchor='center')
+
+        for i, r in enumerate(roots, start=1):
+            lo, hi = r["interval"]
+            failed = r["root"] is None
+            tree.insert('', 'end', values=(
+                i,
+                "" if failed else f"{r['root']:.10g}",
+                "" if failed else f"{r['f_root']:.3e}",
+                "" if failed else r["iterations"],
+                f"{r['kind']}: {r['error']}" if failed else r["kind"],
+                f"[{lo:.6g}, {hi:.6g}]"
+            ))
+
+        vscroll = ttk.Scrollbar(frame, orient='vertical', command=tree.yview)
+        tree.configure(yscrollcommand=vscroll.set)
+
+        tree.grid(row=0, column=0, sticky='nsew')
+        vscroll.grid(row=0, column=1, sticky='ns')
+
+        frame.grid_rowconfigure(0, weight=1)
+        frame.grid_columnconfigure(0, weight=1)
+
+        found = [r for r in roots if r["kind"] not in (FAILED_KIND, OUTSIDE_KIND)]
+        failed = sum(r["kind"] == FAILED_KIND for r in roots)
+        outside = sum(r["kind"] == OUTSIDE_KIND for r in roots)
+        if roots:
+            msg = f"Se encontraron {len(found)} raíces con una malla de {eval_grid} puntos."
+            if outside:
+                msg += f"\n{outside} resultado(s) del método quedaron fuera de su subintervalo (pueden repetir otra raíz)."
+            if failed:
+                msg += f"\nEl método falló en {failed} subintervalo(s); pruebe con un método de intervalo."
+        else:
+            msg = (f"No se encontraron raíces con una malla de {eval_grid} puntos. "
+                   f"Pruebe con una malla más fina o con otro intervalo.")
+
+        tk.Label(
+            win,
             text=msg,
             font=("Arial", 10, "bold"),
             bg='#f0f0f0',
             fg='#2c3e50',
             justify='left'
-        ).pack(anchor='w')
+        ).pack(anchor='w', padx=10, pady=(0, 10))
 
         tk.Button(
             win,
@@ -1859,10 +2674,11 @@ class App(tk.Tk):
         ).pack(pady=(0, 10))
 
     # 🔹 NUEVO: informe comparando TIPOS de error para UN método
-    def show_error_type_report(self, method_name, error_runs):
+    def show_error_type_report(self, method_name, error_runs, cache_info=None):
         """
         Muestra un informe comparando los tipos de error (abs, rel, cond)
         para UN solo método de raíces.
+        cache_info: estadísticas de la caché de f(x) (CachedFunction.cache_info()), opcional.
         """
         # Elegir el mejor: menor error final, luego menos iteraciones
         best = min(error_runs, key=lambda r: (r["final_error"], r["iterations"]))
@@ -1921,6 +2737,7 @@ class App(tk.Tk):
             f"- '{best['error_type']}' con error final ≈ {best['final_error']:.3e} "
             f"en {best['iterations']} iteraciones."
         )
+        msg += self._cache_info_text(cache_info)
 
         tk.Label(
             info_frame,
@@ -1950,14 +2767,7 @@ class App(tk.Tk):
             messagebox.showerror("Error", "No se encontró la función para graficar.")
             return
 
-        func_str = self.last_function_str
-
-        def f(x):
-            return eval(func_str, {
-                "np": np, "x": x, "math": math,
-                "sin": np.sin, "cos": np.cos, "tan": np.tan,
-                "exp": np.exp, "log": np.log, "sqrt": np.sqrt
-            })
+        f = compile_expression(self.last_function_str)
 
         table_data = result[-1] if isinstance(result, tuple) else result
         if not isinstance(table_data, list) or len(table_data) == 0:
@@ -1967,10 +2777,13 @@ class App(tk.Tk):
         x_col_map = {
             "Bisección": 3,
             "Regla Falsa": 5,
+            "Regla Falsa (Illinois)": 5,
+            "Regla Falsa (Anderson-Björck)": 5,
             "Newton": 1,
             "Secante": 2,
             "Punto Fijo": 1,
-            "Raíces Múltiples": 1
+            "Raíces Múltiples": 1,
+            "Chandrupatla": 5
         }
 
         if method_name not in x_col_map:
@@ -1987,7 +2800,8 @@ class App(tk.Tk):
             return
 
         # Intervalo para graficar
-        if method_name in ["Bisección", "Regla Falsa"] and \
+        if method_name in ["Bisección", "Regla Falsa", "Regla Falsa (Illinois)",
+                           "Regla Falsa (Anderson-Björck)", "Chandrupatla"] and \
         hasattr(self, 'last_a') and hasattr(self, 'last_b') and \
         self.last_a is not None and self.last_b is not None:
             a = self.last_a
@@ -2004,7 +2818,7 @@ class App(tk.Tk):
                 b = xmax + margen
 
         xs = np.linspace(a, b, 400)
-        ys = [f(x) for x in xs]
+        ys = f.evaluate_array(xs)
 
         win = tk.Toplevel(self)
         win.title(f"Gráfica - Método de {method_name}")
@@ -2015,7 +2829,7 @@ class App(tk.Tk):
         ax.plot(xs, ys, label='f(x)')
 
         try:
-            ax.scatter(x_aprox, [f(x) for x in x_aprox],
+            ax.scatter(x_aprox, f.evaluate_array(x_aprox),
                     color='red', marker='o', label='Aproximaciones x_n')
         except Exception:
             pass
@@ -1,9 +1,28 @@
+import math
+from itertools import repeat
+
 import numpy as np
 import ast
 try:
     from Python.gui_helpers import compute_spectral_radius
+    from Python.matrices import check_diagonal, get_diagonal, is_consistently_ordered, is_operator, is_sparse, lower_triangular_solver, prepare_matrix, strict_lower, strict_upper, with_diagonal
+    from Python.bandas import route_to_band
+    from Python.tareas import report_progress
+    from Python.trazas import IterationTrace
 except Exception:
     from gui_helpers import compute_spectral_radius
+    from matrices import check_diagonal, get_diagonal, is_consistently_ordered, is_operator, is_sparse, lower_triangular_solver, prepare_matrix, strict_lower, strict_upper, with_diagonal
+    from bandas import route_to_band
+    from tareas import report_progress
+    from trazas import IterationTrace
+
+# Búsqueda de w cuando no se puede usar la fórmula de Young: 'rounds' rondas
+# de 'points' valores, cada una alrededor del mejor w de la anterior
+OMEGA_SEARCH_ROUNDS = 3
+OMEGA_SEARCH_POINTS = 8
+# A partir de este tamaño la búsqueda reparte los w en un pool de procesos;
+# con matrices pequeñas arrancar los procesos cuesta más que la búsqueda
+OMEGA_POOL_MIN_SIZE = 2000
 
 def safe_divide(a, b):
     if b == 0:
@@ -22,59 +41,210 @@ def str_to_numpy_matrix(matrix_str):
         print(f"Error al convertir cadena a matriz numpy: {e}")
         return None
 
-def sor_method(A, b, x0, w, tolerance, max_iterations, error_type='rel', show_report=True, auto_compare=True):
+def sor_kernel(matrix_a, vector_b, initial_guess, w, tolerance, max_iterations, error_type='rel', on_iteration=None):
+    """
+    Núcleo vectorizado de SOR.
+
+    Cada barrido resuelve el sistema triangular inferior
+        (D + w·L) x_new = w·b + ((1 - w)·D - w·U) x_old
+    con una sustitución hacia adelante, que es exactamente la actualización
+    componente a componente de SOR escrita por matrices. A puede ser densa
+    (LAPACK), dispersa (CSR; el barrido cuesta O(nnz)) o un operador con
+    diagonal() y rows(start, stop) (ver matrices.py).
+
+        error_type   : 'rel' usa el error relativo; cualquier otro valor, el absoluto.
+        on_iteration : opcional, on_iteration(k, x, abs_err, rel_err) en cada barrido.
+
+    Devuelve (x, iteraciones, abs_err, rel_err) del último barrido.
+    """
+    A = prepare_matrix(matrix_a)
+    b = np.asarray(vector_b, dtype=np.float64)
+
+    diagonal = get_diagonal(A)
+    check_diagonal(diagonal, "SOR")
+
+    solve_lower = lower_triangular_solver(with_diagonal(w * strict_lower(A), diagonal))
+    upper = with_diagonal(-w * strict_upper(A), (1 - w) * diagonal)
+    wb = w * b
+
+    x = np.array(initial_guess, dtype=np.float64)
+    absolute_error = relative_error = float('inf')
+    iterations = 0
+
+    for iteration_count in range(max_iterations):
+        previous = x
+        x = solve_lower(upper @ previous + wb)
+
+        absolute_error = float(np.linalg.norm(x - previous))
+        denom = np.linalg.norm(x)
+        relative_error = float(absolute_error / denom) if denom != 0 else float('inf')
+        iterations = iteration_count + 1
+
+        if on_iteration is not None:
+            on_iteration(iteration_count, x, absolute_error, relative_error)
+
+        error = relative_error if error_type == 'rel' else absolute_error
+        if error < tolerance:
+            break
+
+    return x, iterations, absolute_error, relative_error
+
+
+def _sor_radius(matrix_a, w):
+    """rho(T_SOR(w)) aproximado (tarea de la búsqueda; nivel de módulo para el pool)."""
+    rho, _ = compute_spectral_radius(matrix_a, method='sor', omega=w, tolerance=1e-4, max_iterations=100)
+    return float('inf') if rho is None else rho
+
+
+def _search_omega(matrix_a, pool=None):
+    """
+    Minimiza rho(T_SOR(w)) en (0, 2): evalúa una malla de w (siempre con
+    w = 1, Gauss-Seidel) y la estrecha alrededor del mejor valor en cada
+    ronda. Devuelve (w, radios evaluados {w: rho}).
+    """
+    lower, upper = 0.05, 1.95
+    grid = np.append(np.linspace(lower, upper, OMEGA_SEARCH_POINTS), 1.0)
+    radii = {}
+    for _ in range(OMEGA_SEARCH_ROUNDS):
+        candidates = [float(w) for w in grid if float(w) not in radii]
+        if pool is not None:
+            values = list(pool.map(_sor_radius, repeat(matrix_a), candidates))
+        else:
+            values = [_sor_radius(matrix_a, w) for w in candidates]
+        radii.update(zip(candidates, values))
+        best = min(radii, key=radii.get)
+        step = (upper - lower) / (OMEGA_SEARCH_POINTS - 1)
+        lower, upper = max(0.01, best - step), min(1.99, best + step)
+        grid = np.linspace(lower, upper, OMEGA_SEARCH_POINTS)
+    return min(radii, key=radii.get), radii
+
+
+def optimal_omega(matrix_a):
+    """
+    Elige w para SOR.
+
+    Si A está consistentemente ordenada, es simétrica con diagonal positiva
+    (autovalores de Jacobi reales) y rho_J < 1, se usa la fórmula de Young
+        w* = 2 / (1 + sqrt(1 - rho_J^2)),  con rho(T_SOR(w*)) = w* - 1
+    y rho(T_GS) = rho_J^2. Si no, se busca el w que minimiza rho(T_SOR(w))
+    (ver _search_omega), en un pool de procesos para matrices grandes.
+
+    Devuelve un diccionario con 'omega', 'strategy' ('young' o 'search'),
+    'rho_sor' (con el w elegido), 'rho_gs' (w = 1), 'rho_jacobi' (o None)
+    y 'evaluated' (cuántos w se probaron).
+    """
+    if is_operator(matrix_a):
+        raise ValueError("w = 'auto' necesita la matriz A; con un operador indique w.")
+    A = prepare_matrix(matrix_a)
+    d = get_diagonal(A)
+    symmetric = (abs(A - A.T).max() == 0) if is_sparse(A) else np.array_equal(A, A.T)
+
+    if symmetric and np.all(d > 0) and is_consistently_ordered(A):
+        rho_j, _ = compute_spectral_radius(A, method='jacobi')
+        if rho_j is not None and rho_j < 1:
+            omega = 2.0 / (1.0 + math.sqrt(1.0 - rho_j ** 2))
+            return {'omega': omega, 'strategy': 'young', 'rho_sor': omega - 1.0,
+                    'rho_gs': rho_j ** 2, 'rho_jacobi': rho_j, 'evaluated': 0}
+
+    pool = None
+    if A.shape[0] >= OMEGA_POOL_MIN_SIZE:
+        try:
+            from Python.comparacion import create_pool
+        except Exception:
+            from comparacion import create_pool
+        pool = create_pool()
+    try:
+        omega, radii = _search_omega(A, pool)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return {'omega': omega, 'strategy': 'search', 'rho_sor': radii[omega],
+            'rho_gs': radii.get(1.0), 'rho_jacobi': None, 'evaluated': len(radii)}
+
+
+def _estimated_iterations(rho, tolerance):
+    """Barridos para reducir el error en un factor 'tolerance' con tasa rho: log(tol)/log(rho)."""
+    if rho is None or not 0 < rho < 1 or not 0 < tolerance < 1:
+        return None
+    return math.ceil(math.log(tolerance) / math.log(rho))
+
+
+def describe_omega_choice(choice, tolerance):
+    """Líneas del resumen con el w elegido y el ahorro estimado frente a Gauss-Seidel."""
+    if choice['strategy'] == 'young':
+        lines = [f"w elegido: {choice['omega']:.6f} (fórmula de Young, rho_J = {choice['rho_jacobi']:.6f})"]
+    else:
+        lines = [f"w elegido: {choice['omega']:.6f} (búsqueda adaptativa, {choice['evaluated']} valores de w)"]
+
+    k_sor = _estimated_iterations(choice['rho_sor'], tolerance)
+    k_gs = _estimated_iterations(choice['rho_gs'], tolerance)
+    if k_sor is not None and k_gs is not None:
+        lines.append(
+            f"Iteraciones estimadas: {k_sor} con w elegido, {k_gs} con w = 1 (Gauss-Seidel); "
+            f"ahorro ≈ {k_gs - k_sor} ({k_gs / k_sor:.1f}x)"
+        )
+    elif k_sor is not None:
+        lines.append(f"Iteraciones estimadas: {k_sor} con w elegido (Gauss-Seidel no converge)")
+    return tuple(lines)
+
+
+def sor_method(A, b, x0, w, tolerance, max_iterations, error_type='rel', show_report=True, auto_compare=True, trace='full', band='off'):
+    # trace: qué iteraciones guardar en la tabla ('full', 'errors', 'every:k' o 'last:N')
+    # si se solicita informe comparativo se delega a supCp2 (más abajo)
+    report = show_report and not is_operator(A)
+    # band='auto': si A es de banda, se resuelve de forma directa (bandas.route_to_band);
+    # con informe se itera igual, para que el informe tenga sus iteraciones
+    routed = None if report else route_to_band(A, b, band)
+    if routed is not None:
+        return routed
+    # w = 'auto': elegir w antes de iterar (ver optimal_omega)
+    omega_lines = ()
+    if isinstance(w, str) and w.strip().lower() == 'auto':
+        A = A if isinstance(A, np.ndarray) or is_sparse(A) or is_operator(A) else str_to_numpy_matrix(A)
+        choice = optimal_omega(A)
+        w = choice['omega']
+        omega_lines = describe_omega_choice(choice, tolerance)
+
     # si se solicita informe comparativo delegar a supCp2
-    if show_report:
+    if report:
+        result = None
         try:
             from Python.supCp2 import subSOR as ss
-            return ss.sor_method(A, b, x0, w, tolerance, max_iterations, error_type, show_report=True, auto_compare=auto_compare)
+            result = ss.sor_method(A, b, x0, w, tolerance, max_iterations, error_type, show_report=True, auto_compare=auto_compare)
         except Exception:
             try:
                 import supCp2.subSOR as ss
-                return ss.sor_method(A, b, x0, w, tolerance, max_iterations, error_type, show_report=True, auto_compare=auto_compare)
+                result = ss.sor_method(A, b, x0, w, tolerance, max_iterations, error_type, show_report=True, auto_compare=auto_compare)
             except Exception:
                 pass
-    matrix_a = A if isinstance(A, np.ndarray) else str_to_numpy_matrix(A)
+        if result is not None:
+            return ("\n".join((result[0],) + omega_lines),) + tuple(result[1:])
+    matrix_a = A if isinstance(A, np.ndarray) or is_sparse(A) or is_operator(A) else str_to_numpy_matrix(A)
     vector_b = b if isinstance(b, np.ndarray) else str_to_numpy_matrix(b)
     initial_guess = x0 if isinstance(x0, np.ndarray) else str_to_numpy_matrix(x0)
 
-    results_matrix = []
-    solution_vector = initial_guess.copy()
-
-    for iteration_count in range(max_iterations):
-        previous_solution = solution_vector.copy()
-
-        for i in range(matrix_a.shape[0]):
-            sigma = 0
-            for j in range(matrix_a.shape[1]):
-                if i != j:
-                    sigma += matrix_a[i, j] * solution_vector[j]
-
-            solution_vector[i] = (1 - w) * previous_solution[i] + (w / matrix_a[i, i]) * (vector_b[i] - sigma)
+    history = IterationTrace(trace, max_iterations)
 
-        absolute_error = np.linalg.norm(solution_vector - previous_solution)
-        denom = np.linalg.norm(solution_vector)
-        relative_error = safe_divide(absolute_error, denom) if denom != 0 else float('inf')
+    def record(iteration_count, solution_vector, absolute_error, relative_error):
+        history.record(iteration_count, solution_vector, absolute_error, relative_error)
+        report_progress(iteration_count, relative_error if error_type == "rela" else absolute_error)
 
-        if error_type == "rela":
-            error = relative_error
-        else:
-            error = absolute_error
-
-        results_matrix.append([iteration_count, solution_vector.tolist(), float(absolute_error), float(relative_error)])
-
-        if error < tolerance:
-            break
+    # error_type == "rela" usa el error relativo; cualquier otro valor, el absoluto
+    sor_kernel(
+        matrix_a, vector_b, initial_guess, w, tolerance, max_iterations,
+        error_type='rel' if error_type == "rela" else 'abs',
+        on_iteration=record
+    )
 
     # calcular radio espectral
-    rho, _ = compute_spectral_radius(matrix_a, method='sor', omega=w)
+    rho, _ = compute_spectral_radius(matrix_a, method='sor', omega=w, residual_history=history.absolute_errors())
     can_conv = False if rho is None else (rho < 1)
     summary = (
         f"Radio espectral: {rho:.6f}" if rho is not None else "Radio espectral: Desconocido",
-        f"Converge (rho<1)?: {'Sí' if can_conv else 'No'}",
-    )
+        f"Converge (rho<1)?: {'Desconocido' if rho is None else ('Sí' if can_conv else 'No')}",
+    ) + omega_lines
     summary_text = "\n".join(summary)
-    return (summary_text, results_matrix)
+    return (summary_text, history.rows())
 
 if __name__ == '__main__':
     # modo consola: pedir entradas y mostrar tabla en consola
@@ -0,0 +1,196 @@
+import inspect
+import math
+
+import numpy as np
+
+# Aislamiento de raíces por barrido en una malla de eval_grid puntos.
+# Se evalúa f de forma vectorizada sobre [a, b], se detectan los cambios de
+# signo y los mínimos locales de |f| cercanos a cero (raíces de multiplicidad
+# par, donde no hay cambio de signo) y luego se refina cada candidato.
+
+_GOLDEN = (math.sqrt(5.0) - 1.0) / 2.0
+
+# Valores de "kind" en find_all_roots para los subintervalos que no dieron una raíz propia
+FAILED_KIND = "el método falló"
+OUTSIDE_KIND = "fuera del subintervalo"
+
+
+def _evaluate_grid(f, xs):
+    """Evalúa f sobre la malla; usa la evaluación vectorizada si f la ofrece."""
+    if hasattr(f, "evaluate_array"):
+        return np.asarray(f.evaluate_array(xs), dtype=np.float64)
+    try:
+        ys = np.asarray(f(xs), dtype=np.float64)
+        if ys.shape == xs.shape:
+            return ys
+    except (TypeError, ValueError):
+        pass
+    return np.array([f(float(x)) for x in xs], dtype=np.float64)
+
+
+def isolate_roots(f, lower_bound, upper_bound, eval_grid=500):
+    """
+    Barre [a, b] con eval_grid puntos y devuelve los candidatos a raíz.
+
+    Devuelve:
+        (brackets, zeros, minima)
+        brackets : lista de (x_i, x_{i+1}) con cambio de signo.
+        zeros    : puntos de la malla donde f vale exactamente 0.
+        minima   : lista de (x_{i-1}, x_{i+1}) alrededor de mínimos locales
+                   de |f| sin cambio de signo (posibles raíces dobles).
+    """
+    a = float(lower_bound)
+    b = float(upper_bound)
+    if not a < b:
+        raise ValueError("El límite inferior debe ser menor que el superior.")
+
+    n = max(int(eval_grid), 3)
+    xs = np.linspace(a, b, n)
+    ys = _evaluate_grid(f, xs)
+
+    finite = np.isfinite(ys)
+    abs_y = np.abs(ys)
+
+    # cambios de signo estrictos entre puntos consecutivos
+    change = (ys[:-1] * ys[1:] < 0) & finite[:-1] & finite[1:]
+    brackets = [(xs[i], xs[i + 1]) for i in np.flatnonzero(change)]
+
+    zeros = [xs[i] for i in np.flatnonzero(ys == 0)]
+
+    # mínimos locales de |f| en puntos interiores, sin cambio de signo alrededor
+    inner = np.arange(1, n - 1)
+    is_min = (
+        finite[inner] & finite[inner - 1] & finite[inner + 1]
+        & (abs_y[inner] <= abs_y[inner - 1]) & (abs_y[inner] <= abs_y[inner + 1])
+        & ((abs_y[inner] < abs_y[inner - 1]) | (abs_y[inner] < abs_y[inner + 1]))
+        & (ys[inner] != 0)
+        & ~change[inner - 1] & ~change[inner]
+    )
+    minima = [(xs[i - 1], xs[i + 1]) for i in inner[is_min]]
+
+    return brackets, zeros, minima
+
+
+def _golden_min_abs(f, lo, hi, tolerance, max_iterations):
+    """Minimiza |f| en [lo, hi] por sección áurea. Devuelve (x, f(x), iteraciones)."""
+    c = hi - _GOLDEN * (hi - lo)
+    d = lo + _GOLDEN * (hi - lo)
+    f_c, f_d = f(c), f(d)
+    it = 0
+    while it < max_iterations and abs(hi - lo) > tolerance * max(1.0, abs(c)):
+        if abs(f_c) < abs(f_d):
+            hi, d, f_d = d, c, f_c
+            c = hi - _GOLDEN * (hi - lo)
+            f_c = f(c)
+        else:
+            lo, c, f_c = c, d, f_d
+            d = lo + _GOLDEN * (hi - lo)
+            f_d = f(d)
+        it += 1
+    x, f_x = (c, f_c) if abs(f_c) < abs(f_d) else (d, f_d)
+    return x, f_x, it
+
+
+def as_bracket_solver(func):
+    """
+    Adapta un método de raíces de la GUI a la firma de intervalo
+    solver(f, lo, hi, tol, max_it, error_type=...).
+
+    Los métodos de intervalo reciben [lo, hi] tal cual; los abiertos arrancan
+    desde el subintervalo (x0 = punto medio, x1 = hi), igual que en la
+    comparación automática. Devuelve None si el primer parámetro no es f.
+    """
+    params = list(inspect.signature(func).parameters)
+    if not params or params[0] != "f":
+        return None
+
+    def solver(f, lo, hi, tolerance, max_iterations, error_type="rel"):
+        args = [f]
+        for p in params[1:]:
+            if p in ("lower_bound", "a"):
+                args.append(lo)
+            elif p in ("upper_bound", "b"):
+                args.append(hi)
+            elif p == "x0":
+                args.append((lo + hi) / 2.0)
+            elif p == "x1":
+                args.append(hi)
+            elif p == "tolerance":
+                args.append(tolerance)
+            elif p in ("max_iterations", "n_iter", "iteraciones"):
+                args.append(max_iterations)
+            else:
+                break
+        kwargs = {}
+        if "error_type" in params:
+            kwargs["error_type"] = error_type
+        if "show_report" in params:
+            kwargs["show_report"] = False
+        if "auto_compare" in params:
+            kwargs["auto_compare"] = False
+        return func(*args, **kwargs)
+
+    return solver
+
+
+def find_all_roots(
+    f,
+    lower_bound,
+    upper_bound,
+    solver,
+    tolerance,
+    max_iterations,
+    error_type="rel",
+    eval_grid=500,
+    zero_tol=None
+):
+    """
+    Encuentra todas las raíces de f en [a, b].
+
+    Aísla los candidatos con isolate_roots() y aplica 'solver' (un método de
+    intervalo con la firma de biseccion: f, a, b, tol, max_it, error_type=...)
+    a cada subintervalo con cambio de signo. Los mínimos de |f| sin cambio de
+    signo se refinan con sección áurea y se aceptan como raíz si
+    |f(x)| <= zero_tol (por defecto, la tolerancia).
+
+    Un subintervalo donde el método falla (derivada nula en Newton, división
+    por cero, ...) no detiene el barrido: queda en la lista con root = None,
+    kind = FAILED_KIND y el mensaje en "error". Si un método abierto
+    converge fuera de su subintervalo, el resultado también se informa, con
+    kind = OUTSIDE_KIND (puede repetir una raíz de otro subintervalo).
+
+    Devuelve una lista de diccionarios ordenada por posición:
+        {"root", "f_root", "iterations", "kind", "interval", "error"}
+    """
+    if zero_tol is None:
+        zero_tol = tolerance
+
+    brackets, zeros, minima = isolate_roots(f, lower_bound, upper_bound, eval_grid)
+
+    roots = []
+    for x in zeros:
+        roots.append({"root": float(x), "f_root": 0.0, "iterations": 0,
+                      "kind": "punto de la malla", "interval": (float(x), float(x))})
+
+    for lo, hi in brackets:
+        try:
+            root, f_root, iterations, _ = solver(f, lo, hi, tolerance, max_iterations, error_type=error_type)
+            root, f_root = float(root), float(f_root)
+        except Exception as e:
+            roots.append({"root": None, "f_root": None, "iterations": None, "kind": FAILED_KIND,
+                          "interval": (float(lo), float(hi)), "error": str(e) or type(e).__name__})
+            continue
+        kind = "cambio de signo" if lo <= root <= hi else OUTSIDE_KIND
+        roots.append({"root": root, "f_root": f_root, "iterations": iterations,
+                      "kind": kind, "interval": (float(lo), float(hi))})
+
+    for lo, hi in minima:
+        x, f_x, iterations = _golden_min_abs(f, lo, hi, np.sqrt(np.finfo(float).eps), max_iterations)
+        if abs(f_x) <= zero_tol:
+            roots.append({"root": float(x), "f_root": float(f_x), "iterations": iterations,
+                          "kind": "mínimo de |f| (multiplicidad par)", "interval": (float(lo), float(hi))})
+
+    for r in roots:
+        r.setdefault("error", None)
+    roots.sort(key=lambda r: r["interval"][0] if r["root"] is None else r["root"])
+    return roots
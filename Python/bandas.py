@@ -0,0 +1,356 @@
+import numpy as np
+import ast
+import scipy.sparse as sp
+from scipy.linalg.lapack import dgbtrf, dgbtrs
+try:
+    from Python.matrices import is_operator, is_sparse, prepare_matrix
+except Exception:
+    from matrices import is_operator, is_sparse, prepare_matrix
+
+# Matrices de banda: A con kl subdiagonales y ku superdiagonales no nulas.
+# Se guardan como en LAPACK (formato 'ab'): ab[ku + i - j, j] = a_ij, un
+# arreglo de (kl + ku + 1) x n. La LU con pivoteo parcial de banda cuesta
+# O(n·kl·(kl + ku)) y el algoritmo de Thomas (tridiagonal) O(n), frente a
+# O(n³) de la LU densa o O(n²) por barrido de los métodos iterativos densos.
+
+# Modos de los métodos iterativos: 'off' itera siempre; 'auto' detecta la
+# banda de A y, si no es la matriz completa, resuelve con band_factor
+BAND_MODES = ("off", "auto")
+
+
+def str_to_numpy_matrix(matrix_str):
+    """
+    Convierte una cadena de texto que representa una matriz o vector en un objeto numpy array.
+    """
+    try:
+        matrix_list = ast.literal_eval(matrix_str)
+        matrix_np = np.array(matrix_list, dtype=np.float64)
+        return matrix_np
+    except Exception as e:
+        raise ValueError(f"Error al convertir cadena a matriz numpy: {e}")
+
+
+def bandwidth(A):
+    """(kl, ku): número de subdiagonales y superdiagonales con algún elemento no nulo."""
+    if isinstance(A, BandedMatrix):
+        return A.kl, A.ku
+    if is_sparse(A):
+        A = sp.coo_matrix(A)
+        A.eliminate_zeros()
+        rows, cols = A.row, A.col
+    else:
+        rows, cols = np.nonzero(np.asarray(A))
+    if rows.size == 0:
+        return 0, 0
+    offsets = cols.astype(np.int64) - rows.astype(np.int64)
+    return int(max(-offsets.min(), 0)), int(max(offsets.max(), 0))
+
+
+class BandedMatrix:
+    """
+    Matriz n x n de banda en formato LAPACK: ab[ku + i - j, j] = a_ij para
+    -ku <= i - j <= kl (los huecos de las esquinas de ab no se usan).
+
+    Tiene matvec(x) y shape, así que sirve como operador en los métodos que
+    aceptan A sin matriz (PCG, GMRES, BiCGSTAB).
+    """
+
+    def __init__(self, ab, kl, ku):
+        self.ab = np.asarray(ab, dtype=np.float64)
+        self.kl = int(kl)
+        self.ku = int(ku)
+        if self.ab.shape[0] != self.kl + self.ku + 1:
+            raise ValueError(f"ab debe tener kl + ku + 1 = {self.kl + self.ku + 1} filas (tiene {self.ab.shape[0]}).")
+
+    @classmethod
+    def from_matrix(cls, A, kl=None, ku=None):
+        """Banda de A (densa o dispersa); kl y ku se detectan si no se dan."""
+        A = prepare_matrix(A)
+        if kl is None or ku is None:
+            detected = bandwidth(A)
+            kl = detected[0] if kl is None else kl
+            ku = detected[1] if ku is None else ku
+        n = A.shape[0]
+        ab = np.zeros((kl + ku + 1, n))
+        for d in range(-kl, ku + 1):
+            # diagonal d (a_{i, i+d}) en la fila ku - d, columnas max(d, 0) ...
+            values = A.diagonal(d) if is_sparse(A) else np.diagonal(A, d)
+            ab[ku - d, max(d, 0):max(d, 0) + values.size] = values
+        return cls(ab, kl, ku)
+
+    @property
+    def n(self):
+        return self.ab.shape[1]
+
+    @property
+    def shape(self):
+        return (self.n, self.n)
+
+    def _diagonals(self):
+        """(d, índices i, valores a_{i, i+d}) de cada diagonal de la banda."""
+        n = self.n
+        for d in range(-self.kl, self.ku + 1):
+            start = max(-d, 0)
+            stop = n - max(d, 0)
+            yield d, start, stop, self.ab[self.ku - d, start + d:stop + d]
+
+    def diagonal(self):
+        return self.ab[self.ku].copy()
+
+    def matvec(self, x):
+        """A·x en O(n·(kl + ku + 1)); x puede tener varias columnas."""
+        x = np.asarray(x, dtype=np.float64)
+        y = np.zeros(x.shape)
+        for d, start, stop, values in self._diagonals():
+            if x.ndim == 1:
+                y[start:stop] += values * x[start + d:stop + d]
+            else:
+                y[start:stop] += values[:, None] * x[start + d:stop + d]
+        return y
+
+    def __matmul__(self, x):
+        return self.matvec(x)
+
+    def toarray(self):
+        A = np.zeros(self.shape)
+        for d, start, stop, values in self._diagonals():
+            A[np.arange(start, stop), np.arange(start, stop) + d] = values
+        return A
+
+    def tocsr(self):
+        offsets, diagonals = [], []
+        for d, start, stop, values in self._diagonals():
+            offsets.append(d)
+            diagonals.append(values)
+        return sp.diags(diagonals, offsets, shape=self.shape, format='csr')
+
+
+class BandLUFactorization:
+    """P·A = L·U de una matriz de banda (LAPACK dgbtrf); U tiene kl + ku superdiagonales."""
+
+    kind = "band_lu"
+
+    def __init__(self, lu, pivots, kl, ku):
+        self.lu = lu
+        self.pivots = pivots
+        self.kl = kl
+        self.ku = ku
+
+    def solve(self, b):
+        """x con A·x = b en O(n·(2·kl + ku)); b puede tener varias columnas."""
+        b = np.asarray(b, dtype=np.float64)
+        x, info = dgbtrs(self.lu, self.kl, self.ku, b.reshape(b.shape[0], -1), self.pivots)
+        if info != 0:
+            raise ValueError(f"Error de LAPACK al resolver el sistema de banda (info = {info}).")
+        return x.reshape(b.shape)
+
+
+def band_lu_factor(A):
+    """
+    LU con pivoteo parcial de una matriz de banda en O(n·kl·(kl + ku)).
+    A puede ser un BandedMatrix o una matriz (se detecta su banda).
+    Lanza ValueError si A es singular.
+    """
+    banded = A if isinstance(A, BandedMatrix) else BandedMatrix.from_matrix(A)
+    kl, ku = banded.kl, banded.ku
+    # dgbtrf necesita kl filas más arriba para el relleno que produce el pivoteo
+    ab = np.zeros((2 * kl + ku + 1, banded.n))
+    ab[kl:] = banded.ab
+    lu, pivots, info = dgbtrf(ab, kl, ku, overwrite_ab=1)
+    if info > 0:
+        raise ValueError("El sistema no tiene solución única (A es singular).")
+    if info < 0:
+        raise ValueError(f"Error de LAPACK al factorizar la matriz de banda (info = {info}).")
+    return BandLUFactorization(lu, pivots, kl, ku)
+
+
+class ThomasFactorization:
+    """
+    Factorización de Thomas de una tridiagonal: A = L·U con L bidiagonal de
+    multiplicadores m_i y U bidiagonal con diagonal w_i y superdiagonal c_i.
+    """
+
+    kind = "thomas"
+
+    def __init__(self, multipliers, pivots, upper):
+        self.multipliers = multipliers
+        self.pivots = pivots
+        self.upper = upper
+
+    def solve(self, b):
+        """x con A·x = b en O(n); b puede tener varias columnas."""
+        b = np.asarray(b, dtype=np.float64)
+        n = b.shape[0]
+        m, w, c = self.multipliers, self.pivots, self.upper
+        if b.ndim > 1:
+            x = np.array(b)
+            for i in range(1, n):
+                x[i] -= m[i] * x[i - 1]
+            x[n - 1] /= w[n - 1]
+            for i in range(n - 2, -1, -1):
+                x[i] = (x[i] - c[i] * x[i + 1]) / w[i]
+            return x
+
+        # un solo b: el barrido con floats de Python es mucho más rápido
+        # que indexar un arreglo de NumPy elemento a elemento
+        y = b.tolist()
+        for i in range(1, n):
+            y[i] -= m[i] * y[i - 1]
+        y[n - 1] /= w[n - 1]
+        for i in range(n - 2, -1, -1):
+            y[i] = (y[i] - c[i] * y[i + 1]) / w[i]
+        return np.array(y)
+
+
+def thomas_factor(A):
+    """
+    Algoritmo de Thomas (eliminación gaussiana sin pivoteo de una
+    tridiagonal) en O(n). Es estable si A es diagonalmente dominante o
+    simétrica definida positiva, pero no lo comprueba: band_factor lo
+    verifica antes de usarlo. Lanza ZeroDivisionError si aparece un pivote
+    cero (use entonces band_lu_factor).
+    """
+    banded = A if isinstance(A, BandedMatrix) else BandedMatrix.from_matrix(A)
+    if banded.kl > 1 or banded.ku > 1:
+        raise ValueError(f"Thomas necesita una matriz tridiagonal (kl = {banded.kl}, ku = {banded.ku}).")
+    n = banded.n
+    lower = banded.ab[banded.ku + 1].tolist() if banded.kl == 1 else [0.0] * n   # a_{i+1, i} en la columna i
+    diagonal = banded.ab[banded.ku].tolist()
+    upper = banded.ab[0, 1:].tolist() + [0.0] if banded.ku == 1 else [0.0] * n   # a_{i, i+1}
+
+    multipliers = [0.0] * n
+    pivots = [0.0] * n
+    pivots[0] = diagonal[0]
+    for i in range(1, n):
+        if pivots[i - 1] == 0:
+            raise ZeroDivisionError(f"Pivote cero en la fila {i} del algoritmo de Thomas.")
+        multipliers[i] = lower[i - 1] / pivots[i - 1]
+        pivots[i] = diagonal[i] - multipliers[i] * upper[i - 1]
+    if pivots[n - 1] == 0:
+        raise ZeroDivisionError(f"Pivote cero en la fila {n} del algoritmo de Thomas.")
+    return ThomasFactorization(multipliers, pivots, upper)
+
+
+def thomas_is_stable(banded):
+    """
+    True si A tridiagonal es diagonalmente dominante por filas o por
+    columnas, el caso en que Thomas (sin pivoteo) es estable.
+    """
+    n = banded.n
+    diagonal = np.abs(banded.ab[banded.ku])
+    upper = np.zeros(n)   # |a_{i, i+1}| en la posición i
+    lower = np.zeros(n)   # |a_{i+1, i}| en la posición i
+    if banded.ku == 1:
+        upper[:-1] = np.abs(banded.ab[0, 1:])
+    if banded.kl == 1:
+        lower[:-1] = np.abs(banded.ab[banded.ku + 1, :-1])
+    rows = np.all(diagonal >= upper + np.concatenate([[0.0], lower[:-1]]))
+    columns = np.all(diagonal >= lower + np.concatenate([[0.0], upper[:-1]]))
+    return bool(rows or columns)
+
+
+def band_factor(A):
+    """
+    Factorización de A según su banda: Thomas si es tridiagonal y Thomas es
+    estable (diagonal dominante, o simétrica con todos los pivotes
+    positivos, es decir, definida positiva); LU de banda con pivoteo
+    parcial en cualquier otro caso.
+    """
+    banded = A if isinstance(A, BandedMatrix) else BandedMatrix.from_matrix(A)
+    if banded.kl <= 1 and banded.ku <= 1:
+        dominant = thomas_is_stable(banded)
+        symmetric = banded.kl == banded.ku and (banded.kl == 0 or np.array_equal(banded.ab[0, 1:], banded.ab[2, :-1]))
+        if dominant or symmetric:
+            try:
+                factors = thomas_factor(banded)
+                if dominant or all(w > 0 for w in factors.pivots):
+                    return factors
+            except ZeroDivisionError:
+                pass
+    return band_lu_factor(banded)
+
+
+def is_banded(kl, ku, n):
+    """
+    True si la banda es claramente más angosta que la matriz (a lo sumo la
+    mitad de las columnas). Con una banda más ancha, LU de banda cuesta casi
+    O(n³) y ocupa más que la matriz densa, así que conviene iterar.
+    Las tridiagonales (y bidiagonales) de n >= 3 siempre cuentan: Thomas o
+    LU de banda son O(n) aunque n sea chico.
+    """
+    if kl <= 1 and ku <= 1 and n >= 3:
+        return True
+    return kl + ku + 1 <= n // 2
+
+
+def wants_band(band):
+    """Interpreta el parámetro 'band' de los métodos iterativos ('off'/'auto', o bool)."""
+    if isinstance(band, bool):
+        return band
+    text = str(band).strip().lower()
+    if text in ("auto", "on", "true", "si", "sí", "1"):
+        return True
+    if text in ("off", "false", "no", "0", ""):
+        return False
+    raise ValueError(f"Modo de banda desconocido: '{band}'. Use {', '.join(BAND_MODES)}.")
+
+
+def band_method(A, b):
+    """
+    Resuelve A·x = b con la factorización de banda. Devuelve
+    (summary_text, results_matrix) con una sola fila [0, x, residuo,
+    residuo relativo], como los métodos iterativos.
+    """
+    matrix_a = A if isinstance(A, (np.ndarray, BandedMatrix)) or is_sparse(A) else str_to_numpy_matrix(A)
+    vector_b = b if isinstance(b, np.ndarray) else str_to_numpy_matrix(b)
+    banded = matrix_a if isinstance(matrix_a, BandedMatrix) else BandedMatrix.from_matrix(matrix_a)
+
+    factors = band_factor(banded)
+    x = factors.solve(vector_b)
+    residual = np.asarray(vector_b, dtype=np.float64) - banded.matvec(x)
+    absolute_error = np.linalg.norm(residual, axis=0)
+    norm_b = np.linalg.norm(vector_b, axis=0)
+    relative_error = np.divide(absolute_error, norm_b, out=np.full_like(absolute_error, np.inf), where=norm_b != 0)
+
+    n, kl, ku = banded.n, banded.kl, banded.ku
+    if factors.kind == "thomas":
+        how = "algoritmo de Thomas, O(n)"
+    else:
+        how = "LU de banda con pivoteo parcial, O(n·kl·(kl + ku))"
+    summary = (
+        f"Matriz de banda: n = {n}, kl = {kl}, ku = {ku}",
+        f"Resuelta con {how}",
+        f"Residuo ||b - A·x|| = {np.max(absolute_error):.6e}",
+    )
+    results_matrix = [[0, x, absolute_error.tolist(), relative_error.tolist()]]
+    summary_text = "\n".join(summary)
+    return (summary_text, results_matrix)
+
+
+def route_to_band(A, b, band):
+    """
+    Para los métodos iterativos: si se pidió (band='auto') y A es de banda,
+    devuelve el resultado de band_method; si no, None (y el método itera).
+    """
+    if not wants_band(band):
+        return None
+    if is_operator(A) and not isinstance(A, BandedMatrix):
+        # sin la matriz no se puede detectar la banda: se itera
+        return None
+    A = A if isinstance(A, (np.ndarray, BandedMatrix)) or is_sparse(A) else str_to_numpy_matrix(A)
+    b = b if isinstance(b, np.ndarray) else str_to_numpy_matrix(b)
+    kl, ku = bandwidth(A)
+    if not is_banded(kl, ku, A.shape[0]):
+        return None
+    summary_text, results_matrix = band_method(A, b)
+    return ("Se detectó una matriz de banda: se resolvió de forma directa en lugar de iterar\n" + summary_text, results_matrix)
+
+
+if __name__ == '__main__':
+    # modo consola: pedir entradas y mostrar la solución
+    matrix_a_str = input("Ingresa la matriz A (e.g., [[4,1,0],[1,4,1],[0,1,4]]): ")
+    vector_b_str = input("Ingresa el vector b (e.g., [1,2,3]): ")
+
+    summary, table = band_method(matrix_a_str, vector_b_str)
+    print(summary)
+    print("x =", table[0][1])
@@ -0,0 +1,171 @@
+import numpy as np
+import ast
+try:
+    from Python.matrices import is_operator, is_sparse, prepare_matrix
+    from Python.precondicionadores import PRECONDITIONER_NAMES, build_preconditioner, precondition_system
+    from Python.trazas import IterationTrace, progress_recorder, residual_summary
+except Exception:
+    from matrices import is_operator, is_sparse, prepare_matrix
+    from precondicionadores import PRECONDITIONER_NAMES, build_preconditioner, precondition_system
+    from trazas import IterationTrace, progress_recorder, residual_summary
+
+# BiCGSTAB (gradiente biconjugado estabilizado) para sistemas no simétricos.
+# A puede ser densa, dispersa (scipy.sparse) o un operador sin matriz
+# (un objeto con matvec(v) y shape, como scipy.sparse.linalg.LinearOperator).
+
+# Precondicionadores admitidos: los de barrido de Gauss-Seidel / SOR y sus variantes
+PRECONDITIONERS = ("none", "jacobi", "gauss_seidel", "sor", "ssor")
+
+
+def str_to_numpy_matrix(matrix_str):
+    """
+    Convierte una cadena de texto que representa una matriz o vector en un objeto numpy array.
+    """
+    try:
+        matrix_list = ast.literal_eval(matrix_str)
+        matrix_np = np.array(matrix_list, dtype=np.float64)
+        return matrix_np
+    except Exception as e:
+        raise ValueError(f"Error al convertir cadena a matriz numpy: {e}")
+
+
+def bicgstab_kernel(matrix_a, vector_b, initial_guess, tolerance, max_iterations, error_type='rel', preconditioner='none', side='right', w=1.0, on_iteration=None):
+    """
+    BiCGSTAB de van der Vorst. Cada iteración hace dos productos por A y dos
+    aplicaciones de M⁻¹, con memoria fija (no guarda una base como GMRES).
+
+        preconditioner : 'none', 'jacobi', 'gauss_seidel', 'sor' (con factor w) o 'ssor'.
+        side           : 'right' (el error es el residuo verdadero ||b - A·x_k||)
+                         o 'left' (el error es el residuo precondicionado ||M⁻¹(b - A·x_k)||).
+        error_type     : 'rel' divide el residuo entre ||b|| (o ||M⁻¹b||); otro valor usa el absoluto.
+        on_iteration   : opcional, on_iteration(k, x_k, abs_err, rel_err) en cada iteración.
+
+    Devuelve (x, iteraciones, abs_err, rel_err) de la última iteración.
+    Lanza ValueError si el método se interrumpe (ρ = 0, r̂·v = 0 o ω = 0).
+    """
+    if is_operator(matrix_a):
+        A = matrix_a
+        matvec = matrix_a.matvec
+    else:
+        A = prepare_matrix(matrix_a)
+        matvec = lambda v: A @ v
+    apply_m = build_preconditioner(A, preconditioner, omega=w, allowed=PRECONDITIONERS)
+
+    b = np.asarray(vector_b, dtype=np.float64)
+    x = np.array(initial_guess, dtype=np.float64)
+    op, apply_right, rhs = precondition_system(matvec, apply_m, b, side)
+    # 'left': se itera sobre M⁻¹A y el residuo es el precondicionado.
+    # 'right': BiCGSTAB precondicionado usa A y pasa cada dirección por M⁻¹
+    # antes de multiplicar y de sumarla a x, así que r es el residuo verdadero.
+    system = op if str(side).strip().lower() == "left" else matvec
+    r = rhs - system(x)
+    norm_rhs = np.linalg.norm(rhs)
+
+    absolute_error = float(np.linalg.norm(r))
+    relative_error = absolute_error / norm_rhs if norm_rhs != 0 else float('inf')
+    iterations = 0
+    if absolute_error == 0:
+        return x, iterations, 0.0, 0.0
+
+    r_hat = r.copy()
+    rho = alpha = omega = 1.0
+    v = np.zeros_like(r)
+    p = np.zeros_like(r)
+
+    for iteration_count in range(max_iterations):
+        rho_new = float(r_hat @ r)
+        if rho_new == 0:
+            raise ValueError("BiCGSTAB se interrumpió (r̂·r = 0); pruebe con GMRES u otro x0.")
+        beta = (rho_new / rho) * (alpha / omega)
+        p = r + beta * (p - omega * v)
+
+        p_hat = apply_right(p)
+        v = system(p_hat)
+        denom = float(r_hat @ v)
+        if denom == 0:
+            raise ValueError("BiCGSTAB se interrumpió (r̂·v = 0); pruebe con GMRES u otro x0.")
+        alpha = rho_new / denom
+        s = r - alpha * v
+
+        iterations = iteration_count + 1
+        norm_s = float(np.linalg.norm(s))
+        relative_s = float(norm_s / norm_rhs) if norm_rhs != 0 else float('inf')
+        if (relative_s if error_type == 'rel' else norm_s) < tolerance or norm_s == 0:
+            # convergió a mitad de iteración: basta el paso de BiCG
+            x = x + alpha * p_hat
+            absolute_error, relative_error = norm_s, relative_s
+            if on_iteration is not None:
+                on_iteration(iteration_count, x, absolute_error, relative_error)
+            break
+
+        s_hat = apply_right(s)
+        t = system(s_hat)
+        tt = float(t @ t)
+        omega = float(t @ s) / tt if tt != 0 else 0.0
+        if omega == 0:
+            raise ValueError("BiCGSTAB se interrumpió (ω = 0); pruebe con GMRES u otro x0.")
+        x = x + alpha * p_hat + omega * s_hat
+        r = s - omega * t
+        rho = rho_new
+
+        absolute_error = float(np.linalg.norm(r))
+        relative_error = float(absolute_error / norm_rhs) if norm_rhs != 0 else float('inf')
+
+        if on_iteration is not None:
+            on_iteration(iteration_count, x, absolute_error, relative_error)
+
+        error = relative_error if error_type == 'rel' else absolute_error
+        if error < tolerance or absolute_error == 0:
+            break
+
+    return x, iterations, absolute_error, relative_error
+
+
+def bicgstab_method(A, b, x0, tolerance, max_iterations, preconditioner='gauss_seidel', side='right', w=1.0, error_type='rel', trace='full'):
+    """
+    BiCGSTAB compatible con la GUI. Devuelve (summary_text, results_matrix),
+    con filas [k, x_k, residuo, residuo relativo].
+    trace: qué iteraciones guardar ('full', 'errors', 'every:k' o 'last:N').
+    """
+    matrix_a = A if isinstance(A, np.ndarray) or is_sparse(A) or is_operator(A) else str_to_numpy_matrix(A)
+    vector_b = b if isinstance(b, np.ndarray) else str_to_numpy_matrix(b)
+    initial_guess = x0 if isinstance(x0, np.ndarray) else str_to_numpy_matrix(x0)
+    history = IterationTrace(trace, max_iterations)
+    record = progress_recorder(history, error_type)
+
+    kernel_et = 'rel' if error_type in ("rel", "rela") else 'abs'
+    _, iterations, absolute_error, relative_error = bicgstab_kernel(
+        matrix_a, vector_b, initial_guess, tolerance, max_iterations,
+        error_type=kernel_et, preconditioner=preconditioner, side=side, w=float(w), on_iteration=record
+    )
+
+    kind = str(preconditioner).strip().lower()
+    side_text = "izquierda" if str(side).strip().lower() == "left" else "derecha"
+    residual_lines, _ = residual_summary(
+        absolute_error, relative_error, iterations, tolerance, kernel_et,
+        label=f"Residuo final{' precondicionado' if side_text == 'izquierda' else ''}"
+    )
+    summary = (
+        f"Precondicionador: {PRECONDITIONER_NAMES.get(kind, kind)}{f' (w = {float(w)})' if kind in ('sor', 'ssor') else ''}, por la {side_text}",
+    ) + residual_lines
+    summary_text = "\n".join(summary)
+    return (summary_text, history.rows())
+
+
+if __name__ == '__main__':
+    # modo consola: pedir entradas y mostrar tabla en consola
+    matrix_a_str = input("Ingresa la matriz A (e.g., [[4,1],[1,3]]): ")
+    vector_b_str = input("Ingresa el vector b (e.g., [1,2]): ")
+    initial_guess_str = input("Introduzca la estimación inicial x0 (e.g., [0,0]): ")
+    tolerance = float(input("Ingresa la tolerancia: "))
+    max_iterations = int(input("Ingresa el número máximo de iteraciones: "))
+    preconditioner = input(f"Ingresa el precondicionador ({', '.join(PRECONDITIONERS)}): ").strip() or 'gauss_seidel'
+
+    summary, table = bicgstab_method(matrix_a_str, vector_b_str, initial_guess_str, tolerance, max_iterations, preconditioner)
+    print(summary)
+    try:
+        from tabulate import tabulate
+        print(tabulate(table, headers=["Iteración", "Solución", "Residuo absoluto", "Residuo relativo"]))
+    except Exception:
+        for row in table:
+            print(row)
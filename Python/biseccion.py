@@ -1,4 +1,10 @@
 import numpy as np
+try:
+    from Python.criterios import ALL_ERRORS, MultiCriterionRun, step_error
+    from Python.tareas import report_progress
+except Exception:
+    from criterios import ALL_ERRORS, MultiCriterionRun, step_error
+    from tareas import report_progress
 
 def biseccion(
     f,
@@ -20,7 +26,10 @@ def biseccion(
         upper_bound   : límite superior (b).
         tolerance     : tolerancia deseada.
         max_iterations: máximo de iteraciones.
-        error_type    : 'abs', 'rel' o 'cond'.
+        error_type    : 'abs', 'rel' o 'cond'. Con 'all' se calculan los tres
+                        criterios en una sola corrida y se devuelve un dict
+                        {tipo: (raiz, f(raiz), iteraciones, tabla)} con la salida
+                        que habría dado cada criterio.
         show_report, eval_grid, auto_compare: ignorados (solo compatibilidad).
 
     Devuelve:
@@ -40,29 +49,21 @@ def biseccion(
         raise ValueError("f(a) y f(b) deben tener signos opuestos.")
 
     matriz = []
+    multi = MultiCriterionRun(tolerance, inclusive=True) if error_type == ALL_ERRORS else None
 
     # Primer punto medio
     pm = (a + b) / 2.0
     f_pm = f(pm)
 
-    # Error inicial (longitud del intervalo /2, por ejemplo)
-    if error_type == "abs":
-        error = abs(b - a)
-    elif error_type == "rel":
-        if pm != 0:
-            error = abs((b - a) / pm)
-        else:
-            error = abs(b - a)
-    elif error_type == "cond":
-        # por ejemplo, basado en el residuo |f(pm)|
-        error = abs(f_pm)
-    else:
-        error = abs(b - a)
+    # Error inicial: longitud del intervalo (o residuo |f(pm)| para 'cond')
+    error = step_error(error_type, b - a, pm, f_pm)
 
     iter_count = 0
     matriz.append([iter_count, a, f_a, pm, f_pm, b, f_b, error])
+    if multi is not None:
+        multi.record(b - a, pm, f_pm, root=pm, f_root=f_pm)
 
-    while iter_count < max_iterations and error > tolerance:
+    while iter_count < max_iterations and (error > tolerance if multi is None else not multi.done()):
         # Elegir subintervalo donde cambia el signo
         if f_a * f_pm < 0:
             b = pm
@@ -76,26 +77,128 @@ def biseccion(
         f_pm = f(pm)
 
         # Cálculo del error según tipo
-        if error_type == "abs":
-            error = abs(pm - pm_prev)
-        elif error_type == "rel":
-            if pm != 0:
-                error = abs((pm - pm_prev) / pm)
-            else:
-                error = abs(pm - pm_prev)
-        elif error_type == "cond":
-            error = abs(f_pm)
-        else:
-            error = abs(pm - pm_prev)
+        error = step_error(error_type, pm - pm_prev, pm, f_pm)
 
         iter_count += 1
         matriz.append([iter_count, a, f_a, pm, f_pm, b, f_b, error])
+        report_progress(iter_count, error)
 
-        if error <= tolerance:
+        if multi is not None:
+            multi.record(pm - pm_prev, pm, f_pm, root=pm, f_root=f_pm)
+        elif error <= tolerance:
             break
 
     root = pm
     f_root = f_pm
     iterations = len(matriz)
 
+    if multi is not None:
+        return multi.results(matriz, 7, root, f_root, f)
+
     return root, f_root, iterations, matriz
+
+
+def _evaluate_batch(f, x):
+    """Evalúa f sobre un arreglo; usa la evaluación vectorizada si f la ofrece."""
+    if hasattr(f, "evaluate_array"):
+        return f.evaluate_array(x)
+    try:
+        y = np.asarray(f(x), dtype=np.float64)
+        if y.shape == x.shape:
+            return y
+    except (TypeError, ValueError):
+        pass
+    return np.array([f(float(v)) for v in x], dtype=np.float64)
+
+
+def _batch_error(error_type, delta, pm, f_pm):
+    """Mismas reglas de error que biseccion(), aplicadas carril por carril."""
+    if error_type == "rel":
+        safe_pm = np.where(pm != 0, pm, 1.0)
+        return np.where(pm != 0, np.abs(delta / safe_pm), np.abs(delta))
+    if error_type == "cond":
+        return np.abs(f_pm)
+    # 'abs' y cualquier otro valor
+    return np.abs(delta)
+
+
+def biseccion_lotes(
+    f,
+    lower_bounds,
+    upper_bounds,
+    tolerance,
+    max_iterations,
+    error_type="rel"      # 'abs', 'rel' o 'cond'
+):
+    """
+    Bisección vectorizada sobre muchos intervalos [a_i, b_i] a la vez.
+
+    Todos los intervalos se parten juntos con máscaras de NumPy; cada carril
+    se detiene por su cuenta cuando su error alcanza la tolerancia o llega
+    a max_iterations. Los errores se calculan igual que en biseccion().
+
+    Parámetros:
+        f             : función f(x) que acepte arreglos (p. ej. la compilada por la GUI).
+        lower_bounds  : arreglo de límites inferiores.
+        upper_bounds  : arreglo de límites superiores (misma forma, o difundible).
+        tolerance     : tolerancia deseada.
+        max_iterations: máximo de iteraciones por carril.
+        error_type    : 'abs', 'rel' o 'cond'.
+
+    Devuelve:
+        (raices, f(raices), iteraciones, errores), arreglos con la forma de los límites.
+        'iteraciones' cuenta filas como biseccion() (iteración inicial incluida).
+    """
+
+    a, b = np.broadcast_arrays(
+        np.asarray(lower_bounds, dtype=np.float64),
+        np.asarray(upper_bounds, dtype=np.float64)
+    )
+    shape = a.shape
+    a = a.ravel().copy()
+    b = b.ravel().copy()
+
+    f_a = _evaluate_batch(f, a)
+    f_b = _evaluate_batch(f, b)
+
+    bad = np.flatnonzero(f_a * f_b >= 0)
+    if bad.size:
+        raise ValueError(
+            f"f(a) y f(b) deben tener signos opuestos (intervalos inválidos: {bad[:10].tolist()})."
+        )
+
+    pm = (a + b) / 2.0
+    f_pm = _evaluate_batch(f, pm)
+    error = _batch_error(error_type, b - a, pm, f_pm)
+
+    iter_count = np.zeros(a.shape, dtype=np.int64)
+    active = (iter_count < max_iterations) & (error > tolerance)
+
+    while active.any():
+        idx = np.flatnonzero(active)
+        a_i, b_i = a[idx], b[idx]
+        f_a_i, f_pm_i = f_a[idx], f_pm[idx]
+
+        # Elegir subintervalo donde cambia el signo; f(pm) ya es conocido
+        left = f_a_i * f_pm_i < 0
+        b_i = np.where(left, pm[idx], b_i)
+        a_i = np.where(left, a_i, pm[idx])
+        f_a_i = np.where(left, f_a_i, f_pm_i)
+
+        pm_prev = pm[idx]
+        pm_i = (a_i + b_i) / 2.0
+        f_pm_i = _evaluate_batch(f, pm_i)
+
+        a[idx], b[idx], f_a[idx] = a_i, b_i, f_a_i
+        pm[idx], f_pm[idx] = pm_i, f_pm_i
+        error[idx] = _batch_error(error_type, pm_i - pm_prev, pm_i, f_pm_i)
+        iter_count[idx] += 1
+
+        active[idx] = (iter_count[idx] < max_iterations) & (error[idx] > tolerance)
+
+    return (
+        pm.reshape(shape),
+        f_pm.reshape(shape),
+        (iter_count + 1).reshape(shape),
+        error.reshape(shape),
+    )
@@ -0,0 +1,119 @@
+import numpy as np
+try:
+    from Python.criterios import ALL_ERRORS, MultiCriterionRun, step_error
+    from Python.tareas import report_progress
+except Exception:
+    from criterios import ALL_ERRORS, MultiCriterionRun, step_error
+    from tareas import report_progress
+
+def chandrupatla_method(
+    f,
+    lower_bound,
+    upper_bound,
+    tolerance,
+    max_iterations,
+    error_type="rel",    # 'abs', 'rel' o 'cond'
+    show_report=True,
+    eval_grid=500,
+    auto_compare=False
+):
+    """
+    Método de Chandrupatla (variante de Brent) compatible con la GUI.
+
+    Usa interpolación cuadrática inversa cuando los tres últimos puntos la
+    hacen confiable y bisección en caso contrario, manteniendo siempre un
+    intervalo con cambio de signo. Converge casi como la secante en raíces
+    simples, no se estanca como la regla falsa en funciones convexas y en
+    raíces múltiples no es más lento que la bisección.
+
+    Parámetros:
+        f             : función f(x) ya construida por la interfaz.
+        lower_bound   : límite inferior (a).
+        upper_bound   : límite superior (b).
+        tolerance     : tolerancia deseada.
+        max_iterations: máximo de iteraciones.
+        error_type    : 'abs', 'rel' o 'cond'. Con 'all' se calculan los tres
+                        criterios en una sola corrida y se devuelve un dict
+                        {tipo: (raiz, f(raiz), iteraciones, tabla)} con la salida
+                        que habría dado cada criterio.
+        show_report, eval_grid, auto_compare: ignorados (para compatibilidad).
+
+    Devuelve:
+        (raiz, f(raiz), iteraciones, tabla)
+
+    Tabla (por fila), mismo formato que la regla falsa:
+        [Iter, A, F(A), B, F(B), Xr, F(Xr), Error]
+        donde [A, B] es el intervalo con cambio de signo tras el paso y Xr el
+        extremo con menor |f|. El error usa el ancho del intervalo (que sí
+        acota la raíz); 'cond' usa el residuo |f(Xr)|.
+    """
+
+    a = float(lower_bound)
+    b = float(upper_bound)
+
+    f_a = f(a)
+    f_b = f(b)
+
+    if f_a * f_b >= 0:
+        raise ValueError("f(a) y f(b) deben tener signos opuestos.")
+
+    eps = np.finfo(float).eps
+
+    # a: último punto evaluado, b: extremo opuesto (f(a)·f(b) < 0), c: punto descartado
+    c, f_c = a, f_a
+    t = 0.5
+
+    iteration_data = []
+    multi = MultiCriterionRun(tolerance) if error_type == ALL_ERRORS else None
+
+    for k in range(int(max_iterations)):
+        xt = a + t * (b - a)
+        f_t = f(xt)
+
+        # conservar el cambio de signo entre a y b
+        if np.sign(f_t) == np.sign(f_a):
+            c, f_c = a, f_a
+        else:
+            c, f_c = b, f_b
+            b, f_b = a, f_a
+        a, f_a = xt, f_t
+
+        xr, f_xr = (a, f_a) if abs(f_a) < abs(f_b) else (b, f_b)
+
+        error = step_error(error_type, b - a, xr, f_xr)
+
+        lo, hi = min(a, b), max(a, b)
+        f_lo, f_hi = (f_a, f_b) if lo == a else (f_b, f_a)
+        iteration_data.append([k, lo, f_lo, hi, f_hi, xr, f_xr, error])
+        report_progress(k, error)
+
+        if multi is not None:
+            multi.record(b - a, xr, f_xr, root=xr, f_root=f_xr)
+            if multi.done():
+                break
+        elif error < tolerance:
+            break
+
+        # el intervalo ya no se puede reducir en aritmética de punto flotante
+        t_lim = 2.0 * eps * abs(xr) / abs(b - c) if b != c else 1.0
+        if f_xr == 0 or t_lim > 0.5:
+            break
+
+        # ¿es confiable la interpolación cuadrática inversa por a, b, c?
+        xi = (a - b) / (c - b)
+        phi = (f_a - f_b) / (f_c - f_b)
+        if phi ** 2 < xi and (1.0 - phi) ** 2 < 1.0 - xi:
+            t = (f_a / (f_b - f_a) * f_c / (f_b - f_c)
+                 + (c - a) / (b - a) * f_a / (f_c - f_a) * f_b / (f_c - f_b))
+        else:
+            t = 0.5
+        t = min(1.0 - t_lim, max(t_lim, t))
+
+    root = xr
+    f_root = f_xr
+    iterations = len(iteration_data)
+
+    if multi is not None:
+        return multi.results(iteration_data, 7, root, f_root, f)
+
+    return root, f_root, iterations, iteration_data
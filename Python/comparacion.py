@@ -0,0 +1,200 @@
+import importlib
+import inspect
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from Python.expresion import compile_expression, CachedFunction
+except Exception:
+    from expresion import compile_expression, CachedFunction
+
+# Comparación automática de los métodos de raíces en un pool de procesos.
+# Cada proceso reconstruye f(x) a partir de la cadena (las funciones
+# compiladas no viajan entre procesos) y devuelve solo el resumen de la
+# corrida, en el mismo formato que App.build_run_summary.
+
+SKIP_PARAMS = {'show_report', 'eval_grid', 'auto_compare', 'error_type', 'variant', 'workers'}
+
+# Columna de la aproximación y del error en la tabla de cada método:
+# Bisección:        [Iter, A, F(A), Pm, F(Pm), B, F(B), Error]
+# Regla Falsa:      [Iter, A, F(A), B, F(B), Xr, F(Xr), Error]
+# Chandrupatla:     [Iter, A, F(A), B, F(B), Xr, F(Xr), Error]
+# Newton:           [Iter, x, f(x), f'(x), Error]
+# Secante:          [Iter, x_{i-1}, x_i, f(x_i), Error]
+# Punto Fijo:       [Iter, x, g(x), Error]
+# Raíces Múltiples: [Iter, x, f(x), f'(x), f''(x), Error]
+X_COLUMNS = {
+    "Bisección": 3,        # Pm
+    "Regla Falsa": 5,      # Xr
+    "Regla Falsa (Illinois)": 5,
+    "Regla Falsa (Anderson-Björck)": 5,
+    "Newton": 1,           # x
+    "Secante": 2,          # x_i
+    "Punto Fijo": 1,       # x
+    "Raíces Múltiples": 1, # x
+    "Chandrupatla": 5      # Xr
+}
+
+ERROR_COLUMNS = {
+    "Bisección": 7,        # Error Abs.
+    "Regla Falsa": 7,      # Error
+    "Regla Falsa (Illinois)": 7,
+    "Regla Falsa (Anderson-Björck)": 7,
+    "Newton": 4,           # Error
+    "Secante": 4,          # Error
+    "Punto Fijo": 3,       # Error
+    "Raíces Múltiples": 5, # Error
+    "Chandrupatla": 7      # Error
+}
+
+
+def summarize_run(method_name, result, error_type):
+    """
+    Extrae un resumen de la ejecución de un método de raíces:
+    raíz aproximada, número de iteraciones y error final.
+    Supone que el último elemento de la tupla 'result' es la tabla de iteraciones.
+    Devuelve None si la tabla no tiene el formato esperado.
+    """
+    table_data = result[-1] if isinstance(result, tuple) else result
+
+    if not isinstance(table_data, list) or not table_data:
+        return None
+
+    last_row = table_data[-1]
+    if not isinstance(last_row, (list, tuple)):
+        return None
+
+    n_cols = len(last_row)
+
+    # Valores por defecto (plan B) si algo falla:
+    # - raíz ≈ columna 1 (la segunda)
+    # - error ≈ última columna
+    default_x_col = 1 if n_cols > 1 else 0
+    default_err_col = n_cols - 1
+
+    x_col = X_COLUMNS.get(method_name, default_x_col)
+    err_col = ERROR_COLUMNS.get(method_name, default_err_col)
+
+    # Asegurar que están dentro de rango; si no, usar plan B
+    if x_col >= n_cols:
+        x_col = default_x_col
+    if err_col >= n_cols:
+        err_col = default_err_col
+
+    try:
+        approx_root = float(last_row[x_col])
+    except Exception:
+        try:
+            approx_root = float(last_row[default_x_col])
+        except Exception:
+            return None
+
+    try:
+        final_error = abs(float(last_row[err_col]))
+    except Exception:
+        try:
+            final_error = abs(float(last_row[default_err_col]))
+        except Exception:
+            return None
+
+    return {
+        "method": method_name,
+        "root": approx_root,
+        "iterations": len(table_data),
+        "final_error": final_error,
+        "error_type": error_type
+    }
+
+
+def build_method_call(func, f, a, b, tol, max_iter, error_type, eval_grid):
+    """
+    Arma (args, kwargs) para llamar a un método de raíces con f(x), el
+    intervalo [a, b], la tolerancia y las iteraciones de la comparación,
+    sin informes ni comparación anidada.
+    """
+    sig = inspect.signature(func)
+    core_params = [p for p in sig.parameters if p not in SKIP_PARAMS]
+
+    args = []
+    kwargs = {}
+
+    # Si el primer parámetro es f, lo agregamos
+    idx = 0
+    if core_params and core_params[0] == 'f':
+        args.append(f)
+        idx = 1
+
+    # Construir argumentos según nombre de parámetro
+    for p in core_params[idx:]:
+        if p in ('lower_bound', 'a'):
+            args.append(a)
+        elif p in ('upper_bound', 'b'):
+            args.append(b)
+        elif p in ('x0', 'x_inicial', 'x_ini'):
+            args.append((a + b) / 2.0)
+        elif p in ('x1', 'x_inicial2', 'x1_ini'):
+            args.append(b)
+        elif p == 'tolerance':
+            args.append(tol)
+        elif p in ('max_iterations', 'n_iter', 'iteraciones'):
+            args.append(max_iter)
+        else:
+            # Fallback: usar el punto medio del intervalo
+            args.append((a + b) / 2.0)
+
+    # Parámetros opcionales por kwargs
+    if 'error_type' in sig.parameters:
+        kwargs['error_type'] = error_type
+    if 'show_report' in sig.parameters:
+        kwargs['show_report'] = False  # no queremos más ventanas
+    if 'eval_grid' in sig.parameters:
+        try:
+            kwargs['eval_grid'] = int(eval_grid)
+        except Exception:
+            kwargs['eval_grid'] = 500
+    if 'auto_compare' in sig.parameters:
+        kwargs['auto_compare'] = False
+
+    return args, kwargs
+
+
+def run_root_method(method_name, module_name, function_name, f_str, a, b, tol, max_iter, error_type, eval_grid, f=None, seed=None):
+    """
+    Ejecuta un método de raíces y devuelve (resumen, cache_info, valores).
+
+    Es la tarea de cada proceso del pool: importa el método, reconstruye f
+    desde f_str (salvo que se pase f, en la ejecución dentro del mismo
+    proceso) y resume la corrida con summarize_run(). 'seed' es
+    CachedFunction.export() de la caché de la sesión: el proceso arranca con
+    esos valores de f(x) en lugar de con la caché vacía, y devuelve en
+    'valores' su propio export() para que la sesión lo incorpore con
+    merge() (None si se pasó f). cache_info son las estadísticas de la
+    caché de f(x) usada, o None.
+    """
+    module = importlib.import_module(module_name)
+    func = getattr(module, function_name)
+
+    worker_cache = f is None
+    if worker_cache:
+        f = CachedFunction(compile_expression(f_str))
+        f.merge(seed)
+
+    args, kwargs = build_method_call(func, f, a, b, tol, max_iter, error_type, eval_grid)
+    result = func(*args, **kwargs)
+    summary = summarize_run(method_name, result, error_type)
+    cache_info = f.cache_info() if isinstance(f, CachedFunction) else None
+    entries = f.export() if worker_cache else None
+    return summary, cache_info, entries
+
+
+def create_pool(max_workers=None):
+    """
+    Crea el pool de procesos de la comparación. Se usa 'spawn' para que los
+    procesos no hereden el estado de Tk de la GUI. Devuelve None si no se
+    puede crear (la comparación se hace entonces en el mismo proceso).
+    """
+    try:
+        context = multiprocessing.get_context("spawn")
+        return ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+    except Exception:
+        return None
@@ -0,0 +1,100 @@
+# Criterios de parada comunes a los métodos de raíces (Capítulo 1).
+
+ERROR_TYPES = ("abs", "rel", "cond")
+
+# Valor de error_type que pide calcular los tres criterios en una sola corrida
+ALL_ERRORS = "all"
+
+
+def step_error(error_type, delta, x_new, residual):
+    """
+    Error de una iteración según el tipo pedido.
+
+        delta    : cambio entre aproximaciones (o longitud de intervalo).
+        x_new    : aproximación nueva (se usa para el error relativo).
+        residual : cantidad que mide el criterio 'cond' (por ejemplo f(x)).
+
+    'abs' -> |delta|, 'rel' -> |delta / x_new| (o |delta| si x_new = 0),
+    'cond' -> |residual|; cualquier otro valor usa el error absoluto.
+    """
+    if error_type == "rel":
+        if x_new != 0:
+            return abs(delta / x_new)
+        return abs(delta)
+    if error_type == "cond":
+        return abs(residual)
+    return abs(delta)
+
+
+class MultiCriterionRun:
+    """
+    Sigue los tres criterios (abs, rel, cond) durante una única corrida.
+
+    Como las iteraciones de los métodos no dependen del criterio de parada,
+    basta con una corrida que continúe hasta que los tres se cumplan y
+    anotar en qué fila se habría detenido cada uno.
+
+        inclusive : True si el método para con error <= tol (bisección),
+                    False si para con error < tol (el resto).
+    """
+
+    def __init__(self, tolerance, inclusive=False):
+        self.tolerance = tolerance
+        self.inclusive = inclusive
+        self.errors = []
+        self.stops = {et: None for et in ERROR_TYPES}
+
+    def _met(self, error):
+        return error <= self.tolerance if self.inclusive else error < self.tolerance
+
+    def record(self, delta, x_new, residual, root, f_root=None):
+        """
+        Anota los tres errores de la fila actual. root / f_root son los valores
+        que devolvería el método si se detuviera en esta fila (f_root=None se
+        evalúa al final solo si hace falta).
+        """
+        errors = {et: step_error(et, delta, x_new, residual) for et in ERROR_TYPES}
+        row = len(self.errors)
+        self.errors.append(errors)
+        for et in ERROR_TYPES:
+            if self.stops[et] is None and self._met(errors[et]):
+                self.stops[et] = (row, root, f_root)
+        return errors
+
+    def record_failure(self):
+        """Fila con error infinito (denominador nulo): ningún criterio se cumple."""
+        inf = float("inf")
+        self.errors.append({et: inf for et in ERROR_TYPES})
+
+    def done(self):
+        return all(stop is not None for stop in self.stops.values())
+
+    def stop_iterations(self):
+        """Iteración (número de filas) en la que se detendría cada criterio; None si no se cumple."""
+        return {et: (None if stop is None else stop[0] + 1) for et, stop in self.stops.items()}
+
+    def results(self, table, err_col, root, f_root, f):
+        """
+        Construye, para cada criterio, la salida que habría dado el método con
+        ese error_type: (raiz, f(raiz), iteraciones, tabla). La tabla se corta
+        en la fila de parada y su columna de error usa ese criterio.
+        root / f_root son el resultado final de la corrida (para criterios que
+        no se cumplieron).
+        """
+        out = {}
+        for et in ERROR_TYPES:
+            stop = self.stops[et]
+            if stop is None:
+                n_rows, et_root, et_f_root = len(table), root, f_root
+            else:
+                n_rows, et_root, et_f_root = stop[0] + 1, stop[1], stop[2]
+                if et_f_root is None:
+                    et_f_root = f(et_root)
+
+            rows = []
+            for i, row in enumerate(table[:n_rows]):
+                new_row = list(row)
+                new_row[err_col] = self.errors[i][et]
+                rows.append(new_row)
+            out[et] = (et_root, et_f_root, n_rows, rows)
+        return out
@@ -0,0 +1,207 @@
+import math
+
+import numpy as np
+
+# Diferenciación automática en modo directo de segundo orden.
+# Un Jet guarda (f, f', f'') de una cantidad respecto a x; al evaluar la
+# expresión con x = Jet(x0, 1, 0) se obtienen f(x0), f'(x0) y f''(x0) en una
+# sola pasada y sin error de truncamiento.
+
+
+def _chain(u, f0, f1, f2):
+    """Regla de la cadena de segundo orden para phi(u): (phi, phi'·u', phi''·u'^2 + phi'·u'')."""
+    return Jet(f0, f1 * u.d1, f2 * u.d1 * u.d1 + f1 * u.d2)
+
+
+def _jet_pow_const(u, n):
+    v = u.value
+    if n == 0:
+        return Jet(np.ones_like(v), np.zeros_like(v), np.zeros_like(v))
+    if n == 1:
+        return u
+    f0 = np.power(v, n)
+    f1 = n * np.power(v, n - 1)
+    f2 = n * (n - 1) * np.power(v, n - 2) if n != 2 else 2.0 + 0 * v
+    return _chain(u, f0, f1, f2)
+
+
+# Funciones elementales: ufunc -> (phi, phi', phi'') evaluadas en v
+_UNARY = {
+    np.sin: lambda v: (np.sin(v), np.cos(v), -np.sin(v)),
+    np.cos: lambda v: (np.cos(v), -np.sin(v), -np.cos(v)),
+    np.tan: lambda v: (np.tan(v), 1.0 / np.cos(v) ** 2, 2.0 * np.tan(v) / np.cos(v) ** 2),
+    np.exp: lambda v: (np.exp(v), np.exp(v), np.exp(v)),
+    np.expm1: lambda v: (np.expm1(v), np.exp(v), np.exp(v)),
+    np.log: lambda v: (np.log(v), 1.0 / v, -1.0 / v ** 2),
+    np.log1p: lambda v: (np.log1p(v), 1.0 / (1.0 + v), -1.0 / (1.0 + v) ** 2),
+    np.log10: lambda v: (np.log10(v), 1.0 / (v * np.log(10.0)), -1.0 / (v ** 2 * np.log(10.0))),
+    np.log2: lambda v: (np.log2(v), 1.0 / (v * np.log(2.0)), -1.0 / (v ** 2 * np.log(2.0))),
+    np.sqrt: lambda v: (np.sqrt(v), 0.5 / np.sqrt(v), -0.25 / (v * np.sqrt(v))),
+    np.cbrt: lambda v: (np.cbrt(v), 1.0 / (3.0 * np.cbrt(v) ** 2), -2.0 / (9.0 * v * np.cbrt(v) ** 2)),
+    np.arcsin: lambda v: (np.arcsin(v), 1.0 / np.sqrt(1 - v ** 2), v / (1 - v ** 2) ** 1.5),
+    np.arccos: lambda v: (np.arccos(v), -1.0 / np.sqrt(1 - v ** 2), -v / (1 - v ** 2) ** 1.5),
+    np.arctan: lambda v: (np.arctan(v), 1.0 / (1 + v ** 2), -2.0 * v / (1 + v ** 2) ** 2),
+    np.sinh: lambda v: (np.sinh(v), np.cosh(v), np.sinh(v)),
+    np.cosh: lambda v: (np.cosh(v), np.sinh(v), np.cosh(v)),
+    np.tanh: lambda v: (np.tanh(v), 1.0 / np.cosh(v) ** 2, -2.0 * np.tanh(v) / np.cosh(v) ** 2),
+    np.absolute: lambda v: (np.abs(v), np.sign(v), 0.0 * v),
+    np.sign: lambda v: (np.sign(v), 0.0 * v, 0.0 * v),
+    np.square: lambda v: (v * v, 2.0 * v, 2.0 + 0.0 * v),
+    np.reciprocal: lambda v: (1.0 / v, -1.0 / v ** 2, 2.0 / v ** 3),
+}
+
+# Equivalencias math.<nombre> -> ufunc de NumPy
+_MATH_TO_NUMPY = {
+    "sin": np.sin, "cos": np.cos, "tan": np.tan, "exp": np.exp, "expm1": np.expm1,
+    "log": np.log, "log1p": np.log1p, "log10": np.log10, "log2": np.log2,
+    "sqrt": np.sqrt, "cbrt": np.cbrt, "asin": np.arcsin, "acos": np.arccos,
+    "atan": np.arctan, "sinh": np.sinh, "cosh": np.cosh, "tanh": np.tanh,
+    "fabs": np.absolute,
+}
+
+
+class Jet:
+    """Número hiper-dual truncado: valor, primera y segunda derivada."""
+
+    __slots__ = ("value", "d1", "d2")
+
+    def __init__(self, value, d1=0.0, d2=0.0):
+        self.value = value
+        self.d1 = d1
+        self.d2 = d2
+
+    @staticmethod
+    def variable(x):
+        """Jet de la variable independiente en x (x' = 1, x'' = 0)."""
+        return Jet(np.float64(x), 1.0, 0.0)
+
+    @staticmethod
+    def _lift(other):
+        if isinstance(other, Jet):
+            return other
+        return Jet(other, 0.0, 0.0)
+
+    # --- aritmética ---
+    def __add__(self, other):
+        o = Jet._lift(other)
+        return Jet(self.value + o.value, self.d1 + o.d1, self.d2 + o.d2)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        o = Jet._lift(other)
+        return Jet(self.value - o.value, self.d1 - o.d1, self.d2 - o.d2)
+
+    def __rsub__(self, other):
+        return Jet._lift(other) - self
+
+    def __mul__(self, other):
+        o = Jet._lift(other)
+        return Jet(
+            self.value * o.value,
+            self.value * o.d1 + self.d1 * o.value,
+            self.value * o.d2 + 2.0 * self.d1 * o.d1 + self.d2 * o.value,
+        )
+
+    __rmul__ = __mul__
+
+    def _reciprocal(self):
+        v = self.value
+        return _chain(self, 1.0 / v, -1.0 / v ** 2, 2.0 / v ** 3)
+
+    def __truediv__(self, other):
+        if not isinstance(other, Jet):
+            return Jet(self.value / other, self.d1 / other, self.d2 / other)
+        return self * other._reciprocal()
+
+    def __rtruediv__(self, other):
+        return Jet._lift(other) * self._reciprocal()
+
+    def __pow__(self, other):
+        if isinstance(other, Jet):
+            # u^w = exp(w·log u)
+            return np.exp(other * np.log(self))
+        return _jet_pow_const(self, other)
+
+    def __rpow__(self, other):
+        # c^u = exp(u·ln c)
+        f0 = np.power(other, self.value)
+        ln_c = np.log(other)
+        return _chain(self, f0, f0 * ln_c, f0 * ln_c * ln_c)
+
+    def __neg__(self):
+        return Jet(-self.value, -self.d1, -self.d2)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return np.absolute(self)
+
+    # --- comparaciones (sobre el valor) ---
+    def __lt__(self, other):
+        return self.value < Jet._lift(other).value
+
+    def __le__(self, other):
+        return self.value <= Jet._lift(other).value
+
+    def __gt__(self, other):
+        return self.value > Jet._lift(other).value
+
+    def __ge__(self, other):
+        return self.value >= Jet._lift(other).value
+
+    # --- integración con ufuncs de NumPy (np.sin(jet), np.float64 * jet, ...) ---
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method != "__call__" or kwargs:
+            return NotImplemented
+        if len(inputs) == 1 and ufunc in _UNARY:
+            u = inputs[0]
+            return _chain(u, *_UNARY[ufunc](u.value))
+        if ufunc is np.negative:
+            return -inputs[0]
+        if ufunc is np.positive:
+            return inputs[0]
+        if len(inputs) == 2:
+            a, b = inputs
+            if ufunc is np.add:
+                return Jet._lift(a) + b
+            if ufunc is np.subtract:
+                return Jet._lift(a) - b
+            if ufunc is np.multiply:
+                return Jet._lift(a) * b
+            if ufunc is np.true_divide:
+                return Jet._lift(a) / b
+            if ufunc is np.power:
+                return Jet._lift(a) ** b
+        return NotImplemented
+
+    def __repr__(self):
+        return f"Jet({self.value!r}, {self.d1!r}, {self.d2!r})"
+
+
+class _JetMath:
+    """Sustituto de 'math' que acepta Jets (delegando en las ufuncs equivalentes)."""
+
+    def __getattr__(self, name):
+        target = getattr(math, name)
+        ufunc = _MATH_TO_NUMPY.get(name)
+        if ufunc is None or not callable(target):
+            return target
+
+        def wrapper(v, _target=target, _ufunc=ufunc):
+            if isinstance(v, Jet):
+                return _ufunc(v)
+            return _target(v)
+
+        return wrapper
+
+
+JET_MATH = _JetMath()
+
+
+def jet_components(value):
+    """Devuelve (f, f', f'') de un resultado; las constantes tienen derivadas nulas."""
+    if isinstance(value, Jet):
+        return value.value, value.d1, value.d2
+    return value, 0.0, 0.0
@@ -0,0 +1,590 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import ast
+from scipy.linalg import ldl, solve_banded
+try:
+    from Python.matrices import check_diagonal, is_sparse, prepare_matrix, working_dtype
+except Exception:
+    from matrices import check_diagonal, is_sparse, prepare_matrix, working_dtype
+
+# Métodos directos (versión de Matlab/LU.m, GaussPiv.m, pivLU.m, pivtot.m,
+# sustpro.m y sustreg.m): factorización P·A·Q = L·U sin pivoteo, con
+# pivoteo parcial (por filas) o total (filas y columnas), y sustitución
+# hacia adelante y hacia atrás.
+#
+# Para A simétrica definida positiva, Cholesky con el factor guardado
+# empaquetado: solo el triángulo inferior, n·(n + 1)/2 números; para A
+# simétrica indefinida, LDLᵀ con pivoteo de Bunch-Kaufman.
+#
+# Las factorizaciones se guardan en una caché indexada por el contenido de A:
+# resolver otra vez con un b nuevo cuesta O(n²) en lugar de O(n³).
+#
+# Todo se calcula en float64, salvo que A llegue en float32: entonces los
+# factores y las sustituciones se quedan en float32 (la mitad de memoria y de
+# tráfico), como necesita el refinamiento de precisión mixta (refinamiento.py).
+
+PIVOTING = ("none", "partial", "total")
+
+PIVOTING_NAMES = {
+    "none": "sin pivoteo",
+    "partial": "pivoteo parcial",
+    "total": "pivoteo total",
+}
+
+# Columnas por bloque: el panel se factoriza columna a columna y el resto de
+# la matriz se actualiza con un solo producto de matrices por bloque
+BLOCK_SIZE = 64
+
+# Factorizaciones que conserva la caché (se descarta la menos usada)
+CACHE_SIZE = 8
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def str_to_numpy_matrix(matrix_str):
+    """
+    Convierte una cadena de texto que representa una matriz o vector en un objeto numpy array.
+    """
+    try:
+        matrix_list = ast.literal_eval(matrix_str)
+        matrix_np = np.array(matrix_list, dtype=np.float64)
+        return matrix_np
+    except Exception as e:
+        raise ValueError(f"Error al convertir cadena a matriz numpy: {e}")
+
+
+def _as_dense(A):
+    A = prepare_matrix(A, working_dtype(A))
+    A = A.toarray() if is_sparse(A) else A
+    if A.ndim != 2 or A.shape[0] != A.shape[1]:
+        raise ValueError(f"La matriz debe ser cuadrada (se recibió {A.shape}).")
+    return A
+
+
+def forward_substitution(L, b, unit_diagonal=False, block_size=BLOCK_SIZE):
+    """
+    Resuelve L·x = b con L triangular inferior (sustpro.m). b puede ser un
+    vector o una matriz con un término independiente por columna.
+
+    Por bloques de 'block_size' filas: dentro del bloque fila a fila y, al
+    terminarlo, las filas siguientes se actualizan con un producto L21·x1.
+    unit_diagonal=True supone diagonal de unos (el factor L de LU).
+    """
+    L = np.asarray(L, dtype=working_dtype(L))
+    x = np.array(b, dtype=L.dtype)
+    n = L.shape[0]
+    if not unit_diagonal:
+        check_diagonal(np.diag(L), "la sustitución hacia adelante")
+
+    for k0 in range(0, n, block_size):
+        k1 = min(k0 + block_size, n)
+        for i in range(k0, k1):
+            if i > k0:
+                x[i] -= L[i, k0:i] @ x[k0:i]
+            if not unit_diagonal:
+                x[i] /= L[i, i]
+        if k1 < n:
+            x[k1:] -= L[k1:, k0:k1] @ x[k0:k1]
+    return x
+
+
+def back_substitution(U, b, unit_diagonal=False, block_size=BLOCK_SIZE):
+    """
+    Resuelve U·x = b con U triangular superior (sustreg.m), por bloques
+    desde la última fila; como forward_substitution.
+    """
+    U = np.asarray(U, dtype=working_dtype(U))
+    x = np.array(b, dtype=U.dtype)
+    n = U.shape[0]
+    if not unit_diagonal:
+        check_diagonal(np.diag(U), "la sustitución hacia atrás")
+
+    for k1 in range(n, 0, -block_size):
+        k0 = max(k1 - block_size, 0)
+        for i in range(k1 - 1, k0 - 1, -1):
+            if i < k1 - 1:
+                x[i] -= U[i, i + 1:k1] @ x[i + 1:k1]
+            if not unit_diagonal:
+                x[i] /= U[i, i]
+        if k0 > 0:
+            x[:k0] -= U[:k0, k0:k1] @ x[k0:k1]
+    return x
+
+
+class LUFactorization:
+    """
+    P·A·Q = L·U guardada como en LAPACK: L (diagonal de unos, sin guardar) y
+    U comparten el arreglo 'lu'; P y Q son las permutaciones 'row_perm' y
+    'col_perm' (la fila i de P·A es la fila row_perm[i] de A).
+    """
+
+    def __init__(self, lu, row_perm, col_perm, pivoting):
+        self.lu = lu
+        self.row_perm = row_perm
+        self.col_perm = col_perm
+        self.pivoting = pivoting
+
+    @property
+    def n(self):
+        return self.lu.shape[0]
+
+    @property
+    def L(self):
+        return np.tril(self.lu, -1) + np.eye(self.n, dtype=self.lu.dtype)
+
+    @property
+    def U(self):
+        return np.triu(self.lu)
+
+    def solve(self, b):
+        """x con A·x = b, en O(n²) por término independiente (en la precisión del factor)."""
+        b = np.asarray(b, dtype=self.lu.dtype)
+        y = forward_substitution(self.lu, b[self.row_perm], unit_diagonal=True)
+        y = back_substitution(self.lu, y)
+        x = np.empty_like(y)
+        x[self.col_perm] = y
+        return x
+
+    def determinant(self):
+        """det(A) = signo(P)·signo(Q)·prod(diag(U))."""
+        sign = _permutation_sign(self.row_perm) * _permutation_sign(self.col_perm)
+        return float(sign * np.prod(np.diag(self.lu)))
+
+
+def _permutation_sign(perm):
+    perm = np.asarray(perm)
+    seen = np.zeros(perm.size, dtype=bool)
+    sign = 1
+    for start in range(perm.size):
+        if seen[start]:
+            continue
+        length = 0
+        j = start
+        while not seen[j]:
+            seen[j] = True
+            j = perm[j]
+            length += 1
+        if length % 2 == 0:
+            sign = -sign
+    return sign
+
+
+def _swap_rows(a, perm, i, j):
+    if i != j:
+        a[[i, j]] = a[[j, i]]
+        perm[[i, j]] = perm[[j, i]]
+
+
+def _lu_blocked(a, row_perm, pivot, block_size):
+    """LU por bloques de columnas, en el sitio, con o sin pivoteo parcial."""
+    n = a.shape[0]
+    for k0 in range(0, n, block_size):
+        k1 = min(k0 + block_size, n)
+        # panel: eliminación columna a columna (LU.m con pivLU.m), solo en
+        # las columnas del bloque; los intercambios mueven la fila completa
+        for k in range(k0, k1):
+            if pivot:
+                _swap_rows(a, row_perm, k, k + int(np.argmax(np.abs(a[k:, k]))))
+                if a[k, k] == 0:
+                    raise ValueError("El sistema no tiene solución única (A es singular).")
+            elif a[k, k] == 0:
+                raise ZeroDivisionError(f"Pivote cero en la fila {k + 1}; use pivoteo parcial o total.")
+            a[k + 1:, k] /= a[k, k]
+            a[k + 1:, k + 1:k1] -= np.outer(a[k + 1:, k], a[k, k + 1:k1])
+        if k1 < n:
+            # U12 = L11⁻¹·A12 y actualización A22 -= L21·U12
+            a[k0:k1, k1:] = forward_substitution(a[k0:k1, k0:k1], a[k0:k1, k1:], unit_diagonal=True)
+            a[k1:, k1:] -= a[k1:, k0:k1] @ a[k0:k1, k1:]
+
+
+def _lu_total(a, row_perm, col_perm):
+    """
+    LU con pivoteo total (GaussPiv.m con pivtot.m). La búsqueda del pivote
+    necesita toda la submatriz restante actualizada, así que no se agrupa
+    por bloques: cada paso es una actualización de rango uno vectorizada.
+    """
+    n = a.shape[0]
+    for k in range(n):
+        block = np.abs(a[k:, k:])
+        index = int(np.argmax(block))
+        if block.flat[index] == 0:
+            raise ValueError("El sistema no tiene solución única (A es singular).")
+        r, c = divmod(index, n - k)
+        _swap_rows(a, row_perm, k, k + r)
+        if c:
+            a[:, [k, k + c]] = a[:, [k + c, k]]
+            col_perm[[k, k + c]] = col_perm[[k + c, k]]
+        a[k + 1:, k] /= a[k, k]
+        a[k + 1:, k + 1:] -= np.outer(a[k + 1:, k], a[k, k + 1:])
+
+
+def lu_factor(A, pivoting="partial", block_size=BLOCK_SIZE):
+    """
+    Factoriza P·A·Q = L·U.
+
+        pivoting : 'none' (LU.m con Piv=0), 'partial' (pivoteo por filas) o
+                   'total' (filas y columnas).
+    Devuelve un LUFactorization. Lanza ValueError si A es singular y
+    ZeroDivisionError si sin pivoteo aparece un pivote cero.
+    """
+    pivoting = str(pivoting).strip().lower()
+    if pivoting not in PIVOTING:
+        raise ValueError(f"Pivoteo desconocido: '{pivoting}'. Use {', '.join(PIVOTING)}.")
+    a = np.array(_as_dense(A))
+    n = a.shape[0]
+    row_perm = np.arange(n)
+    col_perm = np.arange(n)
+    if pivoting == "total":
+        _lu_total(a, row_perm, col_perm)
+    else:
+        _lu_blocked(a, row_perm, pivoting == "partial", int(block_size))
+    return LUFactorization(a, row_perm, col_perm, pivoting)
+
+
+def matrix_key(A):
+    """Huella del contenido de A (forma, tipo y bytes) para la caché."""
+    A = np.ascontiguousarray(A)
+    digest = hashlib.blake2b(A.view(np.uint8), digest_size=16)
+    digest.update(str((A.shape, A.dtype.str)).encode())
+    return digest.hexdigest()
+
+
+def cached_factorization(A, pivoting="partial", factor=None):
+    """
+    Factorización de A desde la caché o, si no está, calculada con
+    factor(A, pivoting) (lu_factor por defecto) y guardada.
+    Devuelve (factorización, True si venía de la caché).
+    """
+    factor = lu_factor if factor is None else factor
+    A = _as_dense(A)
+    key = (matrix_key(A), str(pivoting).strip().lower(), getattr(factor, "__name__", repr(factor)))
+    with _cache_lock:
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key], True
+    factors = factor(A, pivoting)
+    with _cache_lock:
+        _cache[key] = factors
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return factors, False
+
+
+def clear_factorization_cache():
+    with _cache_lock:
+        _cache.clear()
+
+
+def lu_solve(A, b, pivoting="partial"):
+    """x con A·x = b usando (y reutilizando) la factorización LU de A."""
+    factors, _ = cached_factorization(A, pivoting)
+    return factors.solve(b)
+
+
+def is_symmetric(A, tolerance=1e-12):
+    """True si |a_ij - a_ji| <= tolerance·max|a_ij| para todo i, j."""
+    A = _as_dense(A)
+    scale = np.max(np.abs(A)) if A.size else 0.0
+    return bool(np.all(np.abs(A - A.T) <= tolerance * scale))
+
+
+def _packed_start(i):
+    """Posición de a_i0 en el almacenamiento empaquetado por filas (L11, L21, L22, L31, ...)."""
+    return i * (i + 1) // 2
+
+
+class SymmetricFactorization:
+    """
+    Cholesky A = L·Lᵀ. Solo se guarda el triángulo inferior, empaquetado
+    por filas en 'packed' (n·(n + 1)/2 números): la fila i ocupa
+    packed[i·(i + 1)/2 : i·(i + 1)/2 + i + 1].
+    """
+
+    kind = "cholesky"
+
+    def __init__(self, packed, n):
+        self.packed = packed
+        self.n = n
+
+    @property
+    def L(self):
+        L = np.zeros((self.n, self.n), dtype=self.packed.dtype)
+        L[np.tril_indices(self.n)] = self.packed
+        return L
+
+    def _diagonal(self):
+        return self.packed[_packed_start(np.arange(self.n)) + np.arange(self.n)]
+
+    def solve(self, b):
+        """
+        x con A·x = b: L·y = b hacia adelante y Lᵀ·x = y hacia atrás, leyendo
+        solo filas contiguas del triángulo empaquetado. b puede tener varias
+        columnas.
+        """
+        x = np.array(b, dtype=self.packed.dtype)
+        packed = self.packed
+        for i in range(self.n):
+            row = packed[_packed_start(i):_packed_start(i) + i + 1]
+            if i:
+                x[i] -= row[:i] @ x[:i]
+            x[i] /= row[i]
+        # Lᵀ·x = y por columnas de Lᵀ, que son las filas de L
+        for i in range(self.n - 1, -1, -1):
+            row = packed[_packed_start(i):_packed_start(i) + i + 1]
+            x[i] /= row[i]
+            if i:
+                x[:i] -= np.multiply.outer(row[:i], x[i])
+        return x
+
+    def determinant(self):
+        """det(A) = prod(diag(L))²."""
+        d = self._diagonal()
+        return float(np.prod(d * d))
+
+
+class PivotedLDLFactorization:
+    """
+    P·A·Pᵀ = L·D·Lᵀ con el pivoteo simétrico de Bunch-Kaufman
+    (scipy.linalg.ldl, LAPACK sytrf): L triangular inferior con unos en la
+    diagonal y D diagonal por bloques de 1x1 y 2x2. Es la factorización
+    estable para A simétrica indefinida; la fila i de P·A es la fila
+    perm[i] de A.
+    """
+
+    kind = "ldlt"
+
+    def __init__(self, lower, blocks, perm):
+        self.lower = lower
+        self.blocks = blocks
+        self.perm = perm
+
+    @property
+    def n(self):
+        return self.lower.shape[0]
+
+    @property
+    def L(self):
+        return self.lower
+
+    @property
+    def D(self):
+        """D completa (tridiagonal: bloques de 1x1 y 2x2)."""
+        return self.blocks
+
+    def solve(self, b):
+        """x con A·x = b: L·y = P·b, D·z = y, Lᵀ·w = z y x = Pᵀ·w."""
+        b = np.asarray(b, dtype=self.lower.dtype)
+        y = forward_substitution(self.lower, b[self.perm], unit_diagonal=True)
+        # D es tridiagonal: se resuelve en O(n) como matriz de banda
+        bands = np.zeros((3, self.n), dtype=self.blocks.dtype)
+        bands[0, 1:] = np.diag(self.blocks, 1)
+        bands[1] = np.diag(self.blocks)
+        bands[2, :-1] = np.diag(self.blocks, -1)
+        z = solve_banded((1, 1), bands, y, check_finite=False)
+        w = back_substitution(self.lower.T, z, unit_diagonal=True)
+        x = np.empty_like(w)
+        x[self.perm] = w
+        return x
+
+    def _block_determinants(self):
+        """Determinante de cada bloque de 1x1 o 2x2 de D."""
+        D = self.blocks.astype(np.float64)
+        dets = []
+        i = 0
+        while i < self.n:
+            if i + 1 < self.n and D[i + 1, i] != 0:
+                dets.append(D[i, i] * D[i + 1, i + 1] - D[i, i + 1] * D[i + 1, i])
+                i += 2
+            else:
+                dets.append(D[i, i])
+                i += 1
+        return np.array(dets)
+
+    def determinant(self):
+        """det(A) = det(D), producto de los determinantes de sus bloques."""
+        return float(np.prod(self._block_determinants()))
+
+
+def _ldlt_blocked(a, block_size):
+    """
+    LDLᵀ por bloques de columnas, en el sitio, sin pivoteo; solo se lee y
+    actualiza el triángulo inferior (la mitad de operaciones que LU).
+    Deja L (sin su diagonal de unos) bajo la diagonal y D en la diagonal.
+
+    Sin pivoteo la eliminación solo es estable si todos los pivotes son
+    positivos (A definida positiva); al primer pivote <= 0 se detiene y
+    devuelve su fila. Devuelve None si todos fueron positivos.
+    """
+    n = a.shape[0]
+    for k0 in range(0, n, block_size):
+        k1 = min(k0 + block_size, n)
+        # bloque diagonal: eliminación columna a columna
+        for k in range(k0, k1):
+            if not a[k, k] > 0:
+                return k
+            column = a[k + 1:k1, k].copy()
+            a[k + 1:k1, k] /= a[k, k]
+            a[k + 1:k1, k + 1:k1] -= np.outer(a[k + 1:k1, k], column)
+        if k1 < n:
+            # W21 = L21·D1 resuelve L11·W21ᵀ = A21ᵀ; luego A22 -= L21·W21ᵀ
+            W21 = forward_substitution(a[k0:k1, k0:k1], a[k1:, k0:k1].T, unit_diagonal=True).T
+            L21 = W21 / np.diag(a)[k0:k1]
+            a[k1:, k0:k1] = L21
+            # solo los bloques del triángulo inferior de A22
+            for j0 in range(k1, n, block_size):
+                j1 = min(j0 + block_size, n)
+                a[j0:, j0:j1] -= L21[j0 - k1:] @ W21[j0 - k1:j1 - k1].T
+    return None
+
+
+def symmetric_factor(A, pivoting=None, block_size=BLOCK_SIZE):
+    """
+    Factoriza A simétrica: Cholesky A = L·Lᵀ si es definida positiva y,
+    si no, P·A·Pᵀ = L·D·Lᵀ con pivoteo de Bunch-Kaufman. La definición
+    positiva se detecta en la propia eliminación: A es definida positiva si
+    y solo si todos los pivotes son positivos. Con un pivote <= 0 (aunque
+    sea diminuto) se descarta la eliminación sin pivoteo, que ya no es
+    estable, y se usa la pivoteada.
+
+    'pivoting' se ignora (está por compatibilidad con cached_factorization).
+    Lanza ValueError si A no es simétrica o si es singular.
+    """
+    A = _as_dense(A)
+    if not is_symmetric(A):
+        raise ValueError("La matriz no es simétrica; use la factorización LU.")
+    a = np.array(A)
+    n = a.shape[0]
+    if _ldlt_blocked(a, int(block_size)) is None:
+        # Cholesky: L_chol = L·sqrt(D), columna por columna
+        d = np.sqrt(np.diag(a))
+        a *= d
+        np.fill_diagonal(a, d)
+        return SymmetricFactorization(a[np.tril_indices(n)], n)
+
+    lu, blocks, perm = ldl(A, lower=True, hermitian=False, check_finite=False)
+    factors = PivotedLDLFactorization(lu[perm], blocks, perm)
+    if np.any(factors._block_determinants() == 0):
+        raise ValueError("El sistema no tiene solución única (A es singular).")
+    return factors
+
+
+def direct_factor(A, pivoting="partial"):
+    """
+    Factorización directa adecuada para A: Cholesky si A es simétrica
+    definida positiva, LDLᵀ con pivoteo de Bunch-Kaufman si es simétrica
+    indefinida y LU con 'pivoting' si no es simétrica, desde la caché.
+    Devuelve (factorización, True si venía de la caché).
+    """
+    A = _as_dense(A)
+    if is_symmetric(A):
+        try:
+            return cached_factorization(A, "none", factor=symmetric_factor)
+        except ValueError:
+            pass
+    return cached_factorization(A, pivoting)
+
+
+def direct_solve(A, b, pivoting="partial"):
+    """
+    Resuelve A·x = b con direct_factor (Cholesky, LDLᵀ pivoteada o LU).
+    Devuelve (x, factorización, True si venía de la caché).
+    """
+    factors, reused = direct_factor(A, pivoting)
+    return factors.solve(b), factors, reused
+
+
+def lu_method(A, b, pivoting="partial"):
+    """
+    LU compatible con la GUI. Devuelve (summary_text, tabla) con una fila
+    por componente de x y su residuo (b - A·x)_i.
+    """
+    matrix_a = A if isinstance(A, np.ndarray) or is_sparse(A) else str_to_numpy_matrix(A)
+    vector_b = b if isinstance(b, np.ndarray) else str_to_numpy_matrix(b)
+    matrix_a = _as_dense(matrix_a)
+
+    factors, reused = cached_factorization(matrix_a, pivoting)
+    x = factors.solve(vector_b)
+    residual = vector_b - matrix_a @ x
+
+    with np.printoptions(precision=6, suppress=True):
+        factor_text = (f"L =\n{factors.L}", f"U =\n{factors.U}")
+    summary = (
+        f"Factorización LU ({PIVOTING_NAMES[factors.pivoting]})"
+        + (" reutilizada de la caché" if reused else ""),
+        f"det(A) = {factors.determinant():.6e}",
+        f"Residuo ||b - A·x|| = {np.linalg.norm(residual):.6e}",
+    ) + factor_text
+    if factors.pivoting != "none":
+        summary += (f"Orden de filas (P): {(factors.row_perm + 1).tolist()}",)
+    if factors.pivoting == "total":
+        summary += (f"Orden de columnas (Q): {(factors.col_perm + 1).tolist()}",)
+    table = [
+        {"i": i + 1, "x_i": float(x_i), "residuo_i": float(r_i)}
+        for i, (x_i, r_i) in enumerate(zip(np.ravel(x), np.ravel(residual)))
+    ]
+    summary_text = "\n".join(summary)
+    return (summary_text, table)
+
+
+def cholesky_method(A, b):
+    """
+    Cholesky / LDLᵀ compatible con la GUI: detecta si A es simétrica y
+    definida positiva y elige Cholesky, LDLᵀ con pivoteo de Bunch-Kaufman
+    (simétrica indefinida) o, si A no es simétrica, LU con pivoteo parcial.
+    Devuelve (summary_text, tabla) como lu_method.
+    """
+    matrix_a = A if isinstance(A, np.ndarray) or is_sparse(A) else str_to_numpy_matrix(A)
+    vector_b = b if isinstance(b, np.ndarray) else str_to_numpy_matrix(b)
+    matrix_a = _as_dense(matrix_a)
+
+    x, factors, reused = direct_solve(matrix_a, vector_b)
+    residual = vector_b - matrix_a @ x
+
+    storage = ()
+    if isinstance(factors, SymmetricFactorization):
+        n = factors.n
+        header = "A simétrica definida positiva: Cholesky A = L·Lᵀ"
+        with np.printoptions(precision=6, suppress=True):
+            factor_text = (f"L =\n{factors.L}",)
+        storage = (f"Factor guardado empaquetado: {factors.packed.size} números (n² = {n * n})",)
+    elif isinstance(factors, PivotedLDLFactorization):
+        header = "A simétrica indefinida: P·A·Pᵀ = L·D·Lᵀ con pivoteo de Bunch-Kaufman"
+        with np.printoptions(precision=6, suppress=True):
+            factor_text = (f"L =\n{factors.L}", f"D =\n{factors.D}", f"Orden de filas (P): {(factors.perm + 1).tolist()}")
+    else:
+        symmetric = is_symmetric(matrix_a)
+        header = ("A simétrica, pero la factorización LDLᵀ falló" if symmetric else "A no es simétrica") + ": se usó LU con pivoteo parcial"
+        with np.printoptions(precision=6, suppress=True):
+            factor_text = (f"L =\n{factors.L}", f"U =\n{factors.U}")
+
+    summary = (
+        header + (" (reutilizada de la caché)" if reused else ""),
+        f"det(A) = {factors.determinant():.6e}",
+        f"Residuo ||b - A·x|| = {np.linalg.norm(residual):.6e}",
+    ) + storage + factor_text
+    table = [
+        {"i": i + 1, "x_i": float(x_i), "residuo_i": float(r_i)}
+        for i, (x_i, r_i) in enumerate(zip(np.ravel(x), np.ravel(residual)))
+    ]
+    summary_text = "\n".join(summary)
+    return (summary_text, table)
+
+
+if __name__ == '__main__':
+    # modo consola: pedir entradas y mostrar la solución
+    matrix_a_str = input("Ingresa la matriz A (e.g., [[4,1],[1,3]]): ")
+    vector_b_str = input("Ingresa el vector b (e.g., [1,2]): ")
+    pivoting = input(f"Ingresa el pivoteo ({', '.join(PIVOTING)}): ").strip() or 'partial'
+
+    summary, table = lu_method(matrix_a_str, vector_b_str, pivoting)
+    print(summary)
+    try:
+        from tabulate import tabulate
+        print(tabulate([list(row.values()) for row in table], headers=["i", "x_i", "Residuo"]))
+    except Exception:
+        for row in table:
+            print(row)
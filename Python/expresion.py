@@ -0,0 +1,269 @@
+import ast
+import math
+from collections import OrderedDict, namedtuple
+from functools import lru_cache
+
+import numpy as np
+try:
+    from Python.diferenciacion import Jet, JET_MATH, jet_components
+except Exception:
+    from diferenciacion import Jet, JET_MATH, jet_components
+
+# Espacio de nombres disponible para las funciones que escribe el usuario.
+# Es el mismo que usaba la GUI con eval(), pero sin acceso a __builtins__.
+EXPRESSION_NAMESPACE = {
+    "np": np,
+    "math": math,
+    "sin": np.sin, "cos": np.cos, "tan": np.tan,
+    "exp": np.exp, "log": np.log, "sqrt": np.sqrt,
+    "abs": abs, "pow": pow, "min": min, "max": max,
+    "pi": np.pi, "e": np.e,
+}
+
+VARIABLE_NAME = "x"
+
+# Nodos del AST permitidos en una expresión f(x)
+_ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Load,
+    ast.Attribute, ast.Constant, ast.Compare, ast.IfExp, ast.Tuple, ast.List,
+    ast.keyword,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow,
+    ast.USub, ast.UAdd,
+    ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.Eq, ast.NotEq,
+)
+
+_MODULE_NAMES = {"np": np, "math": math}
+
+# Mismo espacio de nombres, pero con un 'math' que acepta Jets (derivadas automáticas)
+JET_NAMESPACE = dict(EXPRESSION_NAMESPACE, math=JET_MATH)
+
+
+def parse_expression(source):
+    """
+    Analiza la cadena f(x) una sola vez y valida su AST.
+
+    Solo se permiten operaciones aritméticas, la variable x, constantes
+    numéricas y funciones de np / math. Lanza ValueError si la expresión
+    no es válida.
+    """
+    if not isinstance(source, str) or not source.strip():
+        raise ValueError("Debe ingresar una función f(x)")
+
+    try:
+        tree = ast.parse(source.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Expresión inválida '{source}': {e.msg}")
+
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_NODES):
+            raise ValueError(f"Elemento no permitido en f(x): {type(node).__name__}")
+
+        if isinstance(node, ast.Constant) and not isinstance(node.value, (int, float, complex)):
+            raise ValueError(f"Constante no permitida en f(x): {node.value!r}")
+
+        if isinstance(node, ast.Name) and node.id != VARIABLE_NAME and node.id not in EXPRESSION_NAMESPACE:
+            raise ValueError(f"Nombre desconocido en f(x): '{node.id}'")
+
+        if isinstance(node, ast.Attribute):
+            # solo np.<algo> o math.<algo>, sin atributos privados
+            if not (isinstance(node.value, ast.Name) and node.value.id in _MODULE_NAMES):
+                raise ValueError("Solo se permiten atributos de 'np' o 'math' en f(x)")
+            if node.attr.startswith("_") or not hasattr(_MODULE_NAMES[node.value.id], node.attr):
+                raise ValueError(f"Atributo no permitido en f(x): '{node.value.id}.{node.attr}'")
+
+    return tree
+
+
+def _compile_lambda(tree, namespace):
+    """Convierte el AST validado en 'lambda x: <expr>' y lo compila una vez."""
+    lam = ast.Lambda(
+        args=ast.arguments(
+            posonlyargs=[], args=[ast.arg(arg=VARIABLE_NAME)], vararg=None,
+            kwonlyargs=[], kw_defaults=[], kwarg=None, defaults=[]
+        ),
+        body=tree.body,
+    )
+    expr = ast.fix_missing_locations(ast.Expression(body=lam))
+    code = compile(expr, "<f(x)>", "eval")
+    env = dict(namespace)
+    env["__builtins__"] = {}
+    return eval(code, env)
+
+
+class CompiledExpression:
+    """
+    Función f(x) compilada a partir de la cadena del usuario.
+
+    Se llama igual que una lambda (f(x)) con escalares o arreglos de NumPy.
+    Es serializable (pickle) reconstruyéndose desde la cadena original.
+    """
+
+    def __init__(self, source):
+        self.source = source.strip()
+        self._tree = parse_expression(self.source)
+        self._func = _compile_lambda(self._tree, EXPRESSION_NAMESPACE)
+        self._jet_func = _compile_lambda(self._tree, JET_NAMESPACE)
+        self._jet_ok = True
+
+    def __call__(self, x):
+        return self._func(x)
+
+    def evaluate_array(self, xs):
+        """
+        Evalúa f sobre un arreglo de puntos. Intenta la evaluación vectorizada
+        y, si la expresión no la admite (p. ej. math.sin), evalúa punto a punto.
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        try:
+            ys = np.asarray(self._func(xs))
+            if ys.shape != xs.shape:
+                # expresiones constantes (p. ej. '5') devuelven un escalar
+                ys = np.broadcast_to(ys, xs.shape).copy()
+            return ys
+        except (TypeError, ValueError):
+            return np.array([self._func(float(v)) for v in xs.ravel()]).reshape(xs.shape)
+
+    def derivatives(self, x):
+        """
+        Devuelve (f(x), f'(x), f''(x)) en una sola evaluación con
+        diferenciación automática. Si la expresión usa algo que los Jets no
+        soportan (TypeError), deja de usarlos y recurre a diferencias
+        centrales (las mismas de antes); cualquier otro error en este x
+        (p. ej. una división por cero) solo usa diferencias en esta llamada.
+        """
+        if self._jet_ok:
+            try:
+                return jet_components(self._jet_func(Jet.variable(x)))
+            except TypeError:
+                self._jet_ok = False
+            except Exception:
+                pass
+
+        f0 = self._func(x)
+        h1, h2 = 1e-6, 1e-4
+        d1 = (self._func(x + h1) - self._func(x - h1)) / (2.0 * h1)
+        d2 = (self._func(x + h2) - 2.0 * f0 + self._func(x - h2)) / (h2 ** 2)
+        return f0, d1, d2
+
+    def __reduce__(self):
+        return (CompiledExpression, (self.source,))
+
+    def __repr__(self):
+        return f"CompiledExpression({self.source!r})"
+
+
+@lru_cache(maxsize=64)
+def compile_expression(source):
+    """
+    Devuelve la función compilada para 'source'. La misma cadena produce el
+    mismo objeto, así que los métodos de raíces y la gráfica lo comparten.
+    """
+    return CompiledExpression(source)
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class CachedFunction:
+    """
+    Envoltorio LRU acotado para f(x), indexado por el valor exacto del float.
+
+    Pensado para compartirse durante una sesión de comparación: los métodos
+    de raíces vuelven a evaluar f en los mismos puntos (extremos, punto medio,
+    x0 = (a+b)/2, x1 = b) y esas evaluaciones se reutilizan. Los arreglos
+    no pasan por la caché. cache_info() informa aciertos y fallos.
+    """
+
+    def __init__(self, func, maxsize=4096):
+        self.func = func
+        self.maxsize = int(maxsize)
+        self.hits = 0
+        self.misses = 0
+        self._values = OrderedDict()
+        self._derivs = OrderedDict()
+        self.source = getattr(func, "source", None)
+        # solo se expone derivatives() si la función original la tiene
+        if hasattr(func, "derivatives"):
+            self.derivatives = self._cached_derivatives
+
+    @staticmethod
+    def _key(x):
+        if isinstance(x, (float, int, np.floating, np.integer)):
+            # hex() distingue el patrón exacto del float (incluido -0.0)
+            return float(x).hex()
+        return None
+
+    def _lookup(self, table, key):
+        value = table.get(key, table)
+        if value is table:
+            self.misses += 1
+            return None, False
+        table.move_to_end(key)
+        self.hits += 1
+        return value, True
+
+    def _store(self, table, key, value):
+        table[key] = value
+        if len(table) > self.maxsize:
+            table.popitem(last=False)
+
+    def __call__(self, x):
+        key = self._key(x)
+        if key is None:
+            return self.func(x)
+        value, found = self._lookup(self._values, key)
+        if not found:
+            value = self.func(x)
+            self._store(self._values, key, value)
+        return value
+
+    def _cached_derivatives(self, x):
+        key = self._key(x)
+        if key is None:
+            return self.func.derivatives(x)
+        value, found = self._lookup(self._derivs, key)
+        if not found:
+            value = self.func.derivatives(x)
+            self._store(self._derivs, key, value)
+            # f(x) sale gratis de la misma pasada
+            if key not in self._values:
+                self._store(self._values, key, value[0])
+        return value
+
+    def evaluate_array(self, xs):
+        if hasattr(self.func, "evaluate_array"):
+            return self.func.evaluate_array(xs)
+        return np.array([self(float(v)) for v in np.ravel(xs)]).reshape(np.shape(xs))
+
+    def cache_info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._values) + len(self._derivs))
+
+    def export(self):
+        """
+        Copia de los valores guardados, ({clave: f(x)}, {clave: derivadas}),
+        para pasarla a otro proceso (las claves son float.hex()).
+        """
+        return dict(self._values), dict(self._derivs)
+
+    def merge(self, entries):
+        """
+        Agrega a la caché los valores de export() de otra CachedFunction de la
+        misma f (p. ej. los de un proceso de la comparación), sin contarlos
+        como aciertos ni fallos.
+        """
+        if not entries:
+            return
+        values, derivs = entries
+        for table, new in ((self._values, values), (self._derivs, derivs)):
+            for key, value in new.items():
+                if key not in table:
+                    self._store(table, key, value)
+
+    def cache_clear(self):
+        self._values.clear()
+        self._derivs.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        return f"CachedFunction({self.func!r}, maxsize={self.maxsize})"
@@ -1,9 +1,25 @@
+import os
 import numpy as np
 import ast
+from concurrent.futures import ThreadPoolExecutor
 try:
     from Python.gui_helpers import compute_spectral_radius
+    from Python.matrices import check_diagonal, get_diagonal, greedy_coloring, is_operator, is_sparse, lower_triangular_solver, off_diagonal, prepare_matrix, strict_lower, strict_upper, with_diagonal
+    from Python.bandas import route_to_band
+    from Python.tareas import report_progress
+    from Python.trazas import IterationTrace
 except Exception:
     from gui_helpers import compute_spectral_radius
+    from matrices import check_diagonal, get_diagonal, greedy_coloring, is_operator, is_sparse, lower_triangular_solver, off_diagonal, prepare_matrix, strict_lower, strict_upper, with_diagonal
+    from bandas import route_to_band
+    from tareas import report_progress
+    from trazas import IterationTrace
+
+# Orden de actualización de las componentes
+VARIANTS = ("natural", "multicolor")
+
+# Filas mínimas por bloque para repartir un color entre varios hilos
+_MIN_ROWS_PER_THREAD = 4096
 
 def safe_divide(a, b):
     if b == 0:
@@ -21,9 +37,168 @@ def str_to_numpy_matrix(matrix_str):
     except Exception as e:
         raise ValueError(f"Error al convertir cadena a matriz numpy: {e}")
 
-def gauss_seidel_method(A, b, x0, tolerance, max_iterations, error_type='rel', show_report=False, auto_compare=True):
-    # si se solicita informe comparativo delegar a supCp2
-    if show_report:
+def gauss_seidel_splitting(matrix_a, dtype=np.float64):
+    """
+    Partición A = (D + L) + U que usa el barrido: devuelve (solve_lower, U),
+    con solve_lower(r) = (D + L)⁻¹ r. Armarla (sobre todo factorizar D + L
+    si A es dispersa) cuesta más que un barrido, así que quien llama al
+    núcleo muchas veces con la misma A (p. ej. multigrid) la arma una vez.
+    dtype: float32 guarda la partición en simple precisión.
+    """
+    A = prepare_matrix(matrix_a, dtype)
+    diagonal = get_diagonal(A).astype(dtype)
+    check_diagonal(diagonal, "Gauss-Seidel")
+    return lower_triangular_solver(with_diagonal(strict_lower(A), diagonal)), strict_upper(A)
+
+
+def gauss_seidel_kernel(matrix_a, vector_b, initial_guess, tolerance, max_iterations, error_type='rel', on_iteration=None, decimals=None, splitting=None, dtype=np.float64):
+    """
+    Núcleo vectorizado de Gauss-Seidel.
+
+    Cada barrido resuelve (D + L) x_new = b - U x_old con una sustitución
+    hacia adelante, equivalente a actualizar las componentes en orden usando
+    los valores nuevos. A puede ser densa, dispersa (CSR; el barrido cuesta
+    O(nnz)) o un operador con diagonal() y rows(start, stop), que se recorre
+    por bloques de filas sin guardarlo completo.
+
+        error_type   : 'rel' usa el error relativo; cualquier otro valor, el absoluto.
+        on_iteration : opcional, on_iteration(k, x, abs_err, rel_err) en cada barrido.
+        decimals     : si se indica, x se redondea a esos decimales tras cada barrido.
+        splitting    : opcional, gauss_seidel_splitting(A) ya calculada.
+        dtype        : precisión de los barridos (float32 con la partición en float32).
+
+    Devuelve (x, iteraciones, abs_err, rel_err) del último barrido.
+    """
+    b = np.asarray(vector_b, dtype=dtype)
+    solve_lower, upper = gauss_seidel_splitting(matrix_a, dtype) if splitting is None else splitting
+
+    x = np.array(initial_guess, dtype=dtype)
+    absolute_error = relative_error = float('inf')
+    iterations = 0
+
+    for iteration_count in range(max_iterations):
+        previous = x
+        x = solve_lower(b - upper @ previous)
+        if decimals is not None:
+            x = np.round(x, decimals=decimals)
+
+        absolute_error = float(np.linalg.norm(x - previous))
+        denom = np.linalg.norm(x)
+        relative_error = float(absolute_error / denom) if denom != 0 else float('inf')
+        iterations = iteration_count + 1
+
+        if on_iteration is not None:
+            on_iteration(iteration_count, x, absolute_error, relative_error)
+
+        error = relative_error if error_type == 'rel' else absolute_error
+        if error < tolerance:
+            break
+
+    return x, iterations, absolute_error, relative_error
+
+
+def multicolor_gauss_seidel_kernel(matrix_a, vector_b, initial_guess, tolerance, max_iterations, error_type='rel', on_iteration=None, decimals=None, colors=None, workers=1):
+    """
+    Gauss-Seidel multicolor (rojo-negro en mallas).
+
+    Se colorea el grafo de A de modo que dos incógnitas acopladas nunca
+    tengan el mismo color; así, todas las componentes de un color dependen
+    solo de los otros colores y se actualizan juntas en un bloque:
+        x[I_c] = (b[I_c] - R[I_c, :] · x) / d[I_c]
+    Un barrido recorre los colores en orden, con los valores nuevos de los
+    colores anteriores (es Gauss-Seidel sobre A reordenada por colores).
+
+        colors  : lista de índices por color; por defecto greedy_coloring(A).
+        workers : si es > 1, los colores grandes se reparten en bloques de
+                  filas que se calculan en un pool de hilos.
+    El resto de parámetros y la salida son los de gauss_seidel_kernel().
+    """
+    if is_operator(matrix_a):
+        raise ValueError("Gauss-Seidel multicolor necesita la matriz A para colorearla; con un operador use variant='natural'.")
+    A = prepare_matrix(matrix_a)
+    b = np.asarray(vector_b, dtype=np.float64)
+
+    diagonal = get_diagonal(A)
+    check_diagonal(diagonal, "Gauss-Seidel")
+
+    if colors is None:
+        colors = greedy_coloring(A)
+    remainder = off_diagonal(A)
+
+    # bloques (índices, R[índices, :], b[índices], 1/d[índices]) de cada color,
+    # partidos en trozos para los hilos
+    workers = max(1, int(workers or 1))
+    blocks = []
+    for idx in colors:
+        n_chunks = min(workers, max(1, len(idx) // _MIN_ROWS_PER_THREAD))
+        blocks.append([
+            (chunk, remainder[chunk, :], b[chunk], 1.0 / diagonal[chunk])
+            for chunk in np.array_split(idx, n_chunks)
+        ])
+
+    pool = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+
+    x = np.array(initial_guess, dtype=np.float64)
+    absolute_error = relative_error = float('inf')
+    iterations = 0
+
+    def update(block, source):
+        chunk, rows, b_chunk, inv_d = block
+        return chunk, (b_chunk - rows @ source) * inv_d
+
+    try:
+        for iteration_count in range(max_iterations):
+            previous = x.copy()
+            for color_blocks in blocks:
+                if pool is not None and len(color_blocks) > 1:
+                    updates = list(pool.map(lambda blk: update(blk, x), color_blocks))
+                else:
+                    updates = [update(blk, x) for blk in color_blocks]
+                for chunk, values in updates:
+                    x[chunk] = values
+            if decimals is not None:
+                x = np.round(x, decimals=decimals)
+
+            absolute_error = float(np.linalg.norm(x - previous))
+            denom = np.linalg.norm(x)
+            relative_error = float(absolute_error / denom) if denom != 0 else float('inf')
+            iterations = iteration_count + 1
+
+            if on_iteration is not None:
+                on_iteration(iteration_count, x, absolute_error, relative_error)
+
+            error = relative_error if error_type == 'rel' else absolute_error
+            if error < tolerance:
+                break
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    return x, iterations, absolute_error, relative_error
+
+
+def gauss_seidel_method(A, b, x0, tolerance, max_iterations, error_type='rel', show_report=False, auto_compare=True, variant="natural", workers=1, trace='full', band='off'):
+    """
+    Gauss-Seidel compatible con la GUI. Devuelve (summary_text, results_matrix).
+
+        variant : 'natural' (componentes en orden) o 'multicolor' (bloques por
+                  color del grafo de A; ver multicolor_gauss_seidel_kernel).
+        workers : hilos para repartir cada color (solo en 'multicolor').
+        trace   : qué iteraciones guardar en la tabla: 'full', 'errors',
+                  'every:k' o 'last:N' (ver trazas.IterationTrace).
+        band    : 'auto' resuelve A de banda con Thomas o LU de banda en lugar de iterar.
+    """
+    if variant not in VARIANTS:
+        raise ValueError(f"Variante de Gauss-Seidel desconocida: '{variant}'. Use {', '.join(VARIANTS)}.")
+    # si se solicita informe comparativo delegar a supCp2 (compara los métodos en orden natural)
+    report = show_report and variant == "natural" and not is_operator(A)
+    # band='auto': si A es de banda, se resuelve de forma directa (bandas.route_to_band);
+    # con informe se itera igual, para que el informe tenga sus iteraciones
+    routed = None if report else route_to_band(A, b, band)
+    if routed is not None:
+        return routed
+
+    if report:
         try:
             from Python.supCp2 import subgauss_seidel as sg
             return sg.gauss_seidel_method(A, b, x0, tolerance, max_iterations, error_type, show_report=True, auto_compare=auto_compare)
@@ -33,47 +208,53 @@ def gauss_seidel_method(A, b, x0, tolerance, max_iterations, error_type='rel', s
                 return sg.gauss_seidel_method(A, b, x0, tolerance, max_iterations, error_type, show_report=True, auto_compare=auto_compare)
             except Exception:
                 pass
-    matrix_a = A if isinstance(A, np.ndarray) else str_to_numpy_matrix(A)
+    matrix_a = A if isinstance(A, np.ndarray) or is_sparse(A) or is_operator(A) else str_to_numpy_matrix(A)
     vector_b = b if isinstance(b, np.ndarray) else str_to_numpy_matrix(b)
     initial_guess = x0 if isinstance(x0, np.ndarray) else str_to_numpy_matrix(x0)
-    results_matrix = []
-
-    diagonal_matrix = np.diag(np.diag(matrix_a))
-    lu_matrix = matrix_a - diagonal_matrix
-    solution_vector = initial_guess
+    history = IterationTrace(trace, max_iterations)
 
-    for iteration_count in range(max_iterations):
-        previous_solution = solution_vector.copy()
-        for j in range(matrix_a.shape[0]):
-            solution_vector[j] = safe_divide(
-                (vector_b[j] - np.dot(lu_matrix[j, :], solution_vector)),
-                diagonal_matrix[j, j]
-            )
-        solution_vector = np.round(solution_vector, decimals=5)
-        absolute_error = np.linalg.norm(solution_vector - previous_solution)
-
-        if np.linalg.norm(solution_vector) != 0:
-            relative_error = absolute_error / np.linalg.norm(solution_vector)
-        else:
-            relative_error = float('inf')
-
-
-        if error_type == "rela":
-            error = relative_error
-        else:
-            error = absolute_error
-        results_matrix.append([iteration_count,solution_vector.copy().tolist(),round(float(absolute_error), 6),round(float(relative_error), 6)])
-        if error < tolerance:
-            break
+    def record(iteration_count, solution_vector, absolute_error, relative_error):
+        history.record(iteration_count, solution_vector, absolute_error, relative_error)
+        report_progress(iteration_count, relative_error if error_type == "rela" else absolute_error)
 
+    # error_type == "rela" usa el error relativo; cualquier otro valor, el absoluto.
+    # Como antes, la solución se redondea a 5 decimales en cada barrido.
+    kernel_et = 'rel' if error_type == "rela" else 'abs'
+    if variant == "multicolor":
+        matrix_a = prepare_matrix(matrix_a)
+        colors = greedy_coloring(matrix_a)
+        multicolor_gauss_seidel_kernel(
+            matrix_a, vector_b, initial_guess, tolerance, max_iterations,
+            error_type=kernel_et, on_iteration=record, decimals=5,
+            colors=colors, workers=workers
+        )
+        # el barrido multicolor es Gauss-Seidel sobre A reordenada por colores
+        order = np.concatenate(colors)
+        rho, _ = compute_spectral_radius(matrix_a[order][:, order], method='gauss_seidel', residual_history=history.absolute_errors())
+    else:
+        gauss_seidel_kernel(
+            matrix_a, vector_b, initial_guess, tolerance, max_iterations,
+            error_type=kernel_et, on_iteration=record, decimals=5
+        )
+        rho, _ = compute_spectral_radius(matrix_a, method='gauss_seidel', residual_history=history.absolute_errors())
 
-    headers = ["Iteración", "Solución", "Error absoluto", "Error relativo"]
-    rho, _ = compute_spectral_radius(matrix_a, method='gauss_seidel')
     can_conv = False if rho is None else (rho < 1)
 
     summary = (
         f"Radio espectral: {rho:.6f}" if rho is not None else "Radio espectral: Desconocido",
-        f"Converge (rho<1)?: {'Sí' if can_conv else 'No'}",
+        f"Converge (rho<1)?: {'Desconocido' if rho is None else ('Sí' if can_conv else 'No')}",
     )
+    if variant == "multicolor":
+        summary += (f"Colores: {len(colors)} (tamaños: {', '.join(str(len(c)) for c in colors)})",)
     summary_text = "\n".join(summary)
-    return (summary_text, results_matrix)
\ No newline at end of file
+    # la tabla redondea los errores; rho se estimó con los errores sin redondear
+    return (summary_text, history.rows(decimals=6))
+
+
+def multicolor_gauss_seidel_method(A, b, x0, tolerance, max_iterations, error_type='rel', show_report=False, auto_compare=True, trace='full', band='off'):
+    """Gauss-Seidel multicolor (ver gauss_seidel_method), con un hilo por núcleo disponible."""
+    return gauss_seidel_method(
+        A, b, x0, tolerance, max_iterations, error_type,
+        show_report=show_report, auto_compare=auto_compare,
+        variant="multicolor", workers=os.cpu_count() or 1, trace=trace, band=band
+    )
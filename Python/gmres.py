@@ -0,0 +1,182 @@
+import math
+
+import numpy as np
+import ast
+from scipy.linalg import solve_triangular
+try:
+    from Python.matrices import is_operator, is_sparse, prepare_matrix
+    from Python.precondicionadores import PRECONDITIONER_NAMES, build_preconditioner, precondition_system
+    from Python.trazas import IterationTrace, progress_recorder, residual_summary
+except Exception:
+    from matrices import is_operator, is_sparse, prepare_matrix
+    from precondicionadores import PRECONDITIONER_NAMES, build_preconditioner, precondition_system
+    from trazas import IterationTrace, progress_recorder, residual_summary
+
+# GMRES con reinicio, GMRES(m), para sistemas no simétricos.
+# A puede ser densa, dispersa (scipy.sparse) o un operador sin matriz
+# (un objeto con matvec(v) y shape, como scipy.sparse.linalg.LinearOperator).
+
+# Precondicionadores admitidos: los de barrido de Gauss-Seidel / SOR y sus variantes
+PRECONDITIONERS = ("none", "jacobi", "gauss_seidel", "sor", "ssor")
+
+
+def str_to_numpy_matrix(matrix_str):
+    """
+    Convierte una cadena de texto que representa una matriz o vector en un objeto numpy array.
+    """
+    try:
+        matrix_list = ast.literal_eval(matrix_str)
+        matrix_np = np.array(matrix_list, dtype=np.float64)
+        return matrix_np
+    except Exception as e:
+        raise ValueError(f"Error al convertir cadena a matriz numpy: {e}")
+
+
+def gmres_kernel(matrix_a, vector_b, initial_guess, tolerance, max_iterations, restart=30, error_type='rel', preconditioner='none', side='right', w=1.0, on_iteration=None):
+    """
+    GMRES(m): en cada ciclo se construye una base de Arnoldi de hasta m = restart
+    vectores y x_k minimiza el residuo sobre el espacio de Krylov; al llenarse
+    la base se reinicia desde el x actual. El residuo de cada iteración sale de
+    las rotaciones de Givens, sin productos extra por A.
+
+        preconditioner : 'none', 'jacobi', 'gauss_seidel', 'sor' (con factor w) o 'ssor'.
+        side           : 'right' (el error es el residuo verdadero ||b - A·x_k||)
+                         o 'left' (el error es el residuo precondicionado ||M⁻¹(b - A·x_k)||).
+        error_type     : 'rel' divide el residuo entre ||b|| (o ||M⁻¹b||); otro valor usa el absoluto.
+        on_iteration   : opcional, on_iteration(k, x_k, abs_err, rel_err) en cada iteración;
+                         x_k se arma en cada paso para la tabla (una aplicación extra de M⁻¹).
+
+    Devuelve (x, iteraciones, abs_err, rel_err) de la última iteración.
+    """
+    if is_operator(matrix_a):
+        A = matrix_a
+        matvec = matrix_a.matvec
+    else:
+        A = prepare_matrix(matrix_a)
+        matvec = lambda v: A @ v
+    apply_m = build_preconditioner(A, preconditioner, omega=w, allowed=PRECONDITIONERS)
+
+    b = np.asarray(vector_b, dtype=np.float64)
+    x = np.array(initial_guess, dtype=np.float64)
+    op, apply_right, rhs = precondition_system(matvec, apply_m, b, side)
+    # en 'left' el residuo del sistema es M⁻¹(b - A·x) = rhs - op(x)
+    residual_of = (lambda v: rhs - op(v)) if str(side).strip().lower() == "left" else (lambda v: b - matvec(v))
+
+    n = b.shape[0]
+    m = max(1, min(int(restart), n))
+    norm_rhs = np.linalg.norm(rhs)
+
+    absolute_error = float(np.linalg.norm(residual_of(x)))
+    relative_error = absolute_error / norm_rhs if norm_rhs != 0 else float('inf')
+    iterations = 0
+
+    while iterations < max_iterations and absolute_error > 0:
+        r = residual_of(x)
+        beta = np.linalg.norm(r)
+        if beta == 0:
+            absolute_error = relative_error = 0.0
+            break
+
+        V = np.zeros((m + 1, n))
+        H = np.zeros((m + 1, m))
+        cs = np.zeros(m)
+        sn = np.zeros(m)
+        g = np.zeros(m + 1)
+        g[0] = beta
+        V[0] = r / beta
+        x_start = x
+
+        for j in range(m):
+            w_vec = op(V[j])
+            # Gram-Schmidt clásico con reortogonalización si hay cancelación
+            norm_before = np.linalg.norm(w_vec)
+            for _ in range(2):
+                h = V[:j + 1] @ w_vec
+                w_vec = w_vec - h @ V[:j + 1]
+                H[:j + 1, j] += h
+                norm_after = np.linalg.norm(w_vec)
+                if norm_after > 0.7 * norm_before:
+                    break
+                norm_before = norm_after
+            H[j + 1, j] = norm_after
+            breakdown = norm_after <= 1e-14 * max(1.0, np.linalg.norm(H[:j + 1, j]))
+            if not breakdown:
+                V[j + 1] = w_vec / norm_after
+
+            # rotaciones de Givens: H queda triangular superior y |g[j+1]| es el residuo
+            for i in range(j):
+                H[i, j], H[i + 1, j] = cs[i] * H[i, j] + sn[i] * H[i + 1, j], -sn[i] * H[i, j] + cs[i] * H[i + 1, j]
+            denom = math.hypot(H[j, j], H[j + 1, j])
+            cs[j], sn[j] = (1.0, 0.0) if denom == 0 else (H[j, j] / denom, H[j + 1, j] / denom)
+            H[j, j] = denom
+            H[j + 1, j] = 0.0
+            g[j + 1] = -sn[j] * g[j]
+            g[j] = cs[j] * g[j]
+
+            iterations += 1
+            absolute_error = abs(float(g[j + 1]))
+            relative_error = float(absolute_error / norm_rhs) if norm_rhs != 0 else float('inf')
+
+            y = solve_triangular(H[:j + 1, :j + 1], g[:j + 1], check_finite=False)
+            x = x_start + apply_right(y @ V[:j + 1])
+
+            if on_iteration is not None:
+                on_iteration(iterations - 1, x, absolute_error, relative_error)
+
+            error = relative_error if error_type == 'rel' else absolute_error
+            if error < tolerance or breakdown or iterations >= max_iterations:
+                return x, iterations, absolute_error, relative_error
+
+    return x, iterations, absolute_error, relative_error
+
+
+def gmres_method(A, b, x0, tolerance, max_iterations, restart=30, preconditioner='gauss_seidel', side='right', w=1.0, error_type='rel', trace='full'):
+    """
+    GMRES(m) compatible con la GUI. Devuelve (summary_text, results_matrix),
+    con filas [k, x_k, residuo, residuo relativo].
+    trace: qué iteraciones guardar ('full', 'errors', 'every:k' o 'last:N').
+    """
+    matrix_a = A if isinstance(A, np.ndarray) or is_sparse(A) or is_operator(A) else str_to_numpy_matrix(A)
+    vector_b = b if isinstance(b, np.ndarray) else str_to_numpy_matrix(b)
+    initial_guess = x0 if isinstance(x0, np.ndarray) else str_to_numpy_matrix(x0)
+    history = IterationTrace(trace, max_iterations)
+    record = progress_recorder(history, error_type)
+
+    kernel_et = 'rel' if error_type in ("rel", "rela") else 'abs'
+    _, iterations, absolute_error, relative_error = gmres_kernel(
+        matrix_a, vector_b, initial_guess, tolerance, max_iterations, restart=int(restart),
+        error_type=kernel_et, preconditioner=preconditioner, side=side, w=float(w), on_iteration=record
+    )
+
+    kind = str(preconditioner).strip().lower()
+    side_text = "izquierda" if str(side).strip().lower() == "left" else "derecha"
+    residual_lines, _ = residual_summary(
+        absolute_error, relative_error, iterations, tolerance, kernel_et,
+        label=f"Residuo final{' precondicionado' if side_text == 'izquierda' else ''}"
+    )
+    summary = (
+        f"Reinicio (m): {int(restart)}",
+        f"Precondicionador: {PRECONDITIONER_NAMES.get(kind, kind)}{f' (w = {float(w)})' if kind in ('sor', 'ssor') else ''}, por la {side_text}",
+    ) + residual_lines
+    summary_text = "\n".join(summary)
+    return (summary_text, history.rows())
+
+
+if __name__ == '__main__':
+    # modo consola: pedir entradas y mostrar tabla en consola
+    matrix_a_str = input("Ingresa la matriz A (e.g., [[4,1],[1,3]]): ")
+    vector_b_str = input("Ingresa el vector b (e.g., [1,2]): ")
+    initial_guess_str = input("Introduzca la estimación inicial x0 (e.g., [0,0]): ")
+    tolerance = float(input("Ingresa la tolerancia: "))
+    max_iterations = int(input("Ingresa el número máximo de iteraciones: "))
+    restart = int(input("Ingresa el reinicio m: ") or 30)
+    preconditioner = input(f"Ingresa el precondicionador ({', '.join(PRECONDITIONERS)}): ").strip() or 'gauss_seidel'
+
+    summary, table = gmres_method(matrix_a_str, vector_b_str, initial_guess_str, tolerance, max_iterations, restart, preconditioner)
+    print(summary)
+    try:
+        from tabulate import tabulate
+        print(tabulate(table, headers=["Iteración", "Solución", "Residuo absoluto", "Residuo relativo"]))
+    except Exception:
+        for row in table:
+            print(row)
@@ -0,0 +1,160 @@
+import time
+
+import numpy as np
+import ast
+try:
+    from Python.matrices import is_operator, is_sparse, prepare_matrix
+    from Python.precondicionadores import PRECONDITIONER_NAMES, build_preconditioner, effective_preconditioner
+    from Python.trazas import IterationTrace, progress_recorder, residual_summary
+except Exception:
+    from matrices import is_operator, is_sparse, prepare_matrix
+    from precondicionadores import PRECONDITIONER_NAMES, build_preconditioner, effective_preconditioner
+    from trazas import IterationTrace, progress_recorder, residual_summary
+
+# Gradiente conjugado precondicionado (PCG) para A simétrica definida positiva.
+# A puede ser densa, dispersa (scipy.sparse) o un operador sin matriz: cualquier
+# objeto con matvec(v) y shape, como scipy.sparse.linalg.LinearOperator.
+
+# Precondicionadores simétricos definidos positivos, los únicos válidos para CG
+PRECONDITIONERS = ("none", "jacobi", "ssor", "ic")
+
+
+def str_to_numpy_matrix(matrix_str):
+    """
+    Convierte una cadena de texto que representa una matriz o vector en un objeto numpy array.
+    """
+    try:
+        matrix_list = ast.literal_eval(matrix_str)
+        matrix_np = np.array(matrix_list, dtype=np.float64)
+        return matrix_np
+    except Exception as e:
+        raise ValueError(f"Error al convertir cadena a matriz numpy: {e}")
+
+
+def pcg_kernel(matrix_a, vector_b, initial_guess, tolerance, max_iterations, error_type='rel', preconditioner='jacobi', on_iteration=None):
+    """
+    Gradiente conjugado precondicionado.
+
+    En cada iteración hay un producto A·p y una aplicación de M⁻¹; el error
+    es el residuo r_k = b - A·x_k:
+        abs_err = ||r_k||,   rel_err = ||r_k|| / ||b||.
+
+        error_type     : 'rel' usa el residuo relativo; cualquier otro valor, el absoluto.
+        preconditioner : 'none', 'jacobi', 'ssor' o 'ic' (ver build_preconditioner).
+                         Con un operador sin diagonal(), 'jacobi' pasa a 'none'.
+        on_iteration   : opcional, on_iteration(k, x, abs_err, rel_err) en cada iteración.
+
+    Devuelve (x, iteraciones, abs_err, rel_err) de la última iteración.
+    Lanza ValueError si encuentra una dirección con pᵀ·A·p <= 0 (A no es
+    simétrica definida positiva).
+    """
+    if is_operator(matrix_a):
+        A = matrix_a
+        matvec = matrix_a.matvec
+    else:
+        A = prepare_matrix(matrix_a)
+        matvec = lambda v: A @ v
+    preconditioner, _ = effective_preconditioner(A, preconditioner)
+    apply_m = build_preconditioner(A, preconditioner, allowed=PRECONDITIONERS)
+
+    b = np.asarray(vector_b, dtype=np.float64)
+    x = np.array(initial_guess, dtype=np.float64)
+    norm_b = np.linalg.norm(b)
+
+    r = b - matvec(x)
+    absolute_error = float(np.linalg.norm(r))
+    relative_error = absolute_error / norm_b if norm_b != 0 else float('inf')
+    iterations = 0
+    if absolute_error == 0:
+        return x, iterations, 0.0, 0.0
+
+    z = apply_m(r)
+    p = z.copy()
+    rz = float(r @ z)
+
+    for iteration_count in range(max_iterations):
+        Ap = matvec(p)
+        curvature = float(p @ Ap)
+        if curvature <= 0:
+            raise ValueError("La matriz no es simétrica definida positiva (pᵀ·A·p <= 0); PCG no puede continuar.")
+        alpha = rz / curvature
+        x = x + alpha * p
+        r = r - alpha * Ap
+
+        absolute_error = float(np.linalg.norm(r))
+        relative_error = float(absolute_error / norm_b) if norm_b != 0 else float('inf')
+        iterations = iteration_count + 1
+
+        if on_iteration is not None:
+            on_iteration(iteration_count, x, absolute_error, relative_error)
+
+        error = relative_error if error_type == 'rel' else absolute_error
+        if error < tolerance or absolute_error == 0:
+            break
+
+        z = apply_m(r)
+        rz_new = float(r @ z)
+        p = z + (rz_new / rz) * p
+        rz = rz_new
+
+    return x, iterations, absolute_error, relative_error
+
+
+def _compute_once(A_local, b_local, x0_local, tol, max_it, err_type, preconditioner='jacobi'):
+    rows = []
+    start = time.perf_counter()
+
+    def record(k, x, abs_err, rel_err):
+        rows.append([k, x.tolist(), abs_err, rel_err])
+
+    pcg_kernel(A_local, b_local, x0_local, tol, max_it, error_type=err_type, preconditioner=preconditioner, on_iteration=record)
+    end = time.perf_counter()
+    metrics = {'iterations': len(rows), 'abs_error': float(rows[-1][2]) if rows else None, 'rel_error': float(rows[-1][3]) if rows else None, 'time': end - start}
+    return rows, metrics
+
+
+def pcg_method(A, b, x0, tolerance, max_iterations, preconditioner='jacobi', error_type='rel', trace='full'):
+    """
+    PCG compatible con la GUI. Devuelve (summary_text, results_matrix), con
+    filas [k, x_k, ||r_k||, ||r_k||/||b||].
+    trace: qué iteraciones guardar ('full', 'errors', 'every:k' o 'last:N').
+    """
+    matrix_a = A if isinstance(A, np.ndarray) or is_sparse(A) or is_operator(A) else str_to_numpy_matrix(A)
+    vector_b = b if isinstance(b, np.ndarray) else str_to_numpy_matrix(b)
+    initial_guess = x0 if isinstance(x0, np.ndarray) else str_to_numpy_matrix(x0)
+    history = IterationTrace(trace, max_iterations)
+    record = progress_recorder(history, error_type)
+
+    kernel_et = 'rel' if error_type in ("rel", "rela") else 'abs'
+    _, iterations, absolute_error, relative_error = pcg_kernel(
+        matrix_a, vector_b, initial_guess, tolerance, max_iterations,
+        error_type=kernel_et, preconditioner=preconditioner, on_iteration=record
+    )
+
+    kind, note = effective_preconditioner(matrix_a, preconditioner)
+    residual_lines, _ = residual_summary(absolute_error, relative_error, iterations, tolerance, kernel_et)
+    summary = (
+        f"Precondicionador: {PRECONDITIONER_NAMES.get(kind, kind)}" + (f" ({note})" if note else ""),
+    ) + residual_lines
+    summary_text = "\n".join(summary)
+    return (summary_text, history.rows())
+
+
+if __name__ == '__main__':
+    # modo consola: pedir entradas y mostrar tabla en consola
+    matrix_a_str = input("Ingresa la matriz A (e.g., [[4,1],[1,3]]): ")
+    vector_b_str = input("Ingresa el vector b (e.g., [1,2]): ")
+    initial_guess_str = input("Introduzca la estimación inicial x0 (e.g., [0,0]): ")
+    tolerance = float(input("Ingresa la tolerancia: "))
+    max_iterations = int(input("Ingresa el número máximo de iteraciones: "))
+    preconditioner = input(f"Ingresa el precondicionador ({', '.join(PRECONDITIONERS)}): ").strip() or 'jacobi'
+    error_type = input("Ingresa el tipo de error (rel para relativo o abs para absoluto): ")
+
+    summary, table = pcg_method(matrix_a_str, vector_b_str, initial_guess_str, tolerance, max_iterations, preconditioner, error_type)
+    print(summary)
+    try:
+        from tabulate import tabulate
+        print(tabulate(table, headers=["Iteración", "Solución", "Residuo absoluto", "Residuo relativo"]))
+    except Exception:
+        for row in table:
+            print(row)
@@ -1,43 +1,188 @@
 import tkinter as tk
 from tkinter import ttk
 import numpy as np
+try:
+    from Python.matrices import (
+        get_diagonal, is_operator, lower_triangular_solver, off_diagonal, prepare_matrix,
+        strict_lower, strict_upper, with_diagonal
+    )
+except Exception:
+    from matrices import (
+        get_diagonal, is_operator, lower_triangular_solver, off_diagonal, prepare_matrix,
+        strict_lower, strict_upper, with_diagonal
+    )
 
 
-def compute_spectral_radius(matrix_a, method='jacobi', omega=None):
+# Con operadores sin matriz de más incógnitas, solo se usa el cociente de errores
+ARNOLDI_OPERATOR_LIMIT = 200000
+
+
+def compute_spectral_radius(matrix_a, method='jacobi', omega=None, residual_history=None, tolerance=1e-6, max_iterations=300):
     """
-    Calcula el radio espectral de la matriz de iteración para cada método.
+    Estima el radio espectral de la matriz de iteración T de cada método sin
+    formarla (ni invertir D, D+L o D+wL).
     method: 'jacobi', 'gauss_seidel' o 'sor'
     omega: factor de relajación para SOR
-    Devuelve (spectral_radius, iteration_matrix) o (None, None) si falla.
+    residual_history: errores ||x_{k+1} - x_k|| de una corrida del método, si
+        los hay; cuando los últimos cocientes e_{k+1}/e_k ya se estabilizaron
+        (hasta 'tolerance'), ese cociente es el radio y no se aplica T.
+    tolerance, max_iterations: tolerancia relativa de la estimación y máximo
+        de aplicaciones de T.
+    Devuelve (spectral_radius, None) o (None, None) si falla. El segundo
+    elemento se mantiene por compatibilidad: T ya no se construye.
     """
+    rho = _residual_ratio(residual_history, tolerance)
+    if rho is not None:
+        return (rho, None)
+    if is_operator(matrix_a) and matrix_a.shape[0] > ARNOLDI_OPERATOR_LIMIT:
+        # cada aplicación de T sobre un operador enorme es un barrido completo
+        return (None, None)
     try:
-        A = np.array(matrix_a, dtype=np.float64)
-        D = np.diag(np.diag(A))
-        L = np.tril(A, -1)
-        U = np.triu(A, 1)
-
-        if method == 'jacobi':
-            # T_J = -D^{-1}(L+U)
-            R = A - D
-            T = -np.linalg.inv(D).dot(R)
-        elif method == 'gauss_seidel':
-            # T_GS = -(D+L)^{-1} U
-            T = -np.linalg.inv(D + L).dot(U)
-        elif method == 'sor':
-            if omega is None:
-                raise ValueError('Omega requerido para SOR')
-            # T_SOR = (D + w L)^{-1} ((1-w)D - w U)
-            T = np.linalg.inv(D + omega * L).dot((1 - omega) * D - omega * U)
-        else:
+        apply_t, n = _iteration_operator(matrix_a, method, omega)
+        if apply_t is None:
             return (None, None)
-
-        eigs = np.linalg.eigvals(T)
-        rho = max(np.abs(eigs))
-        return (float(rho), T)
+        return (_arnoldi_radius(apply_t, n, tolerance, max_iterations), None)
     except Exception:
         return (None, None)
 
 
+def _residual_ratio(residual_history, tolerance, window=3):
+    """
+    Radio a partir de los errores sucesivos del método: si los últimos
+    'window' cocientes e_{k+1}/e_k coinciden hasta 'tolerance', devuelve su
+    media; si no (pocas iteraciones, autovalores dominantes complejos,
+    redondeo de la tabla), None.
+    """
+    if residual_history is None:
+        return None
+    errors = np.asarray(residual_history, dtype=np.float64)
+    if errors.ndim != 1 or errors.size < window + 1:
+        return None
+    tail = errors[-(window + 1):]
+    if not np.all(np.isfinite(tail)) or np.any(tail <= 0):
+        return None
+    ratios = tail[1:] / tail[:-1]
+    mean = float(np.mean(ratios))
+    if np.ptp(ratios) <= tolerance * mean:
+        return mean
+    return None
+
+
+def _iteration_operator(matrix_a, method, omega=None):
+    """
+    Devuelve (apply_t, n): v -> T·v aplicada con productos por A y una
+    sustitución triangular (densa o CSR), sin formar T.
+        Jacobi:       T_J   = -D^{-1}(L+U)
+        Gauss-Seidel: T_GS  = -(D+L)^{-1} U
+        SOR:          T_SOR = (D + wL)^{-1} ((1-w)D - wU)
+    """
+    A = prepare_matrix(matrix_a)
+    d = get_diagonal(A)
+    L = strict_lower(A)
+    U = strict_upper(A)
+
+    if method == 'jacobi':
+        R = off_diagonal(A)
+        apply_t = lambda v: -(R @ v) / d
+    elif method == 'gauss_seidel':
+        solve_lower = lower_triangular_solver(with_diagonal(L, d))
+        apply_t = lambda v: -solve_lower(U @ v)
+    elif method == 'sor':
+        if omega is None:
+            raise ValueError('Omega requerido para SOR')
+        solve_lower = lower_triangular_solver(with_diagonal(omega * L, d))
+        N = with_diagonal(-omega * U, (1 - omega) * d)
+        apply_t = lambda v: solve_lower(N @ v)
+    else:
+        return (None, A.shape[0])
+    return (apply_t, A.shape[0])
+
+
+def _arnoldi_radius(apply_t, n, tolerance=1e-6, max_iterations=300, krylov_dim=20):
+    """
+    Radio espectral de T por Arnoldi con reinicio explícito: cada ciclo
+    construye una base de Krylov de dimensión m = min(n, krylov_dim) y toma el
+    mayor |valor de Ritz| de la Hessenberg H_m. A diferencia de la iteración
+    de potencia, capta pares complejos conjugados dominantes (frecuentes en
+    Gauss-Seidel y SOR). Si el espacio de Krylov es invariante (m = n o
+    ruptura) el resultado es exacto; si no, se reinicia desde el vector de
+    Ritz hasta que dos ciclos coinciden o se agotan max_iterations
+    aplicaciones de T.
+    """
+    m = min(n, krylov_dim)
+    rng = np.random.default_rng(0)
+    v = rng.random(n)
+    v /= np.linalg.norm(v)
+
+    rho = None
+    applications = 0
+    while applications < max_iterations:
+        # base de Krylov por filas: V[j] es el j-ésimo vector
+        V = np.zeros((m + 1, n))
+        H = np.zeros((m + 1, m))
+        V[0] = v
+        k = m
+        invariant = (m == n)
+        for j in range(m):
+            w = apply_t(V[j])
+            applications += 1
+            # Gram-Schmidt clásico; se reortogonaliza solo si w perdió mucha
+            # norma (criterio de Kahan), que es cuando aparece la cancelación
+            norm_before = np.linalg.norm(w)
+            for _ in range(2):
+                h = V[:j + 1] @ w
+                w = w - h @ V[:j + 1]
+                H[:j + 1, j] += h
+                norm_after = np.linalg.norm(w)
+                if norm_after > 0.7 * norm_before:
+                    break
+                norm_before = norm_after
+            H[j + 1, j] = norm_after
+            if H[j + 1, j] <= 1e-12 * max(1.0, np.linalg.norm(H[:j + 1, j])):
+                k = j + 1
+                invariant = True
+                break
+            V[j + 1] = w / H[j + 1, j]
+
+        ritz, vectors = np.linalg.eig(H[:k, :k])
+        i = int(np.argmax(np.abs(ritz)))
+        estimate = float(np.abs(ritz[i]))
+        if invariant or estimate == 0.0:
+            return estimate
+        if rho is not None and abs(estimate - rho) <= tolerance * estimate:
+            return estimate
+        rho = estimate
+
+        # reiniciar desde el vector de Ritz dominante (parte real + imaginaria,
+        # que genera el mismo subespacio si el par es complejo)
+        y = vectors[:, i] @ V[:k]
+        v = y.real + y.imag
+        v /= np.linalg.norm(v)
+    return rho
+
+
+def add_pcg_report(informe, matrix_a, vector_b, initial_guess, tolerance, max_iterations, error_types):
+    """
+    Agrega la fila 'PCG (Jacobi)' al informe comparativo de Jacobi,
+    Gauss-Seidel o SOR (su error es el residuo). Se omite si PCG falla,
+    p. ej. cuando A no es simétrica definida positiva.
+    """
+    try:
+        from Python import gradiente_conjugado as gc
+    except Exception:
+        try:
+            import gradiente_conjugado as gc
+        except Exception:
+            return
+
+    for et in error_types:
+        try:
+            r_pcg, m_pcg = gc._compute_once(matrix_a, vector_b, initial_guess, tolerance, max_iterations, et)
+            informe.setdefault('PCG (Jacobi)', {})[et] = {'rows': r_pcg, 'metrics': m_pcg}
+        except Exception:
+            pass
+
+
 def show_results_window(title, headers, rows, spectral_radius, can_converge):
     root = tk.Tk()
     root.title(title)
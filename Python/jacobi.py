@@ -2,8 +2,16 @@ import numpy as np
 import ast
 try:
     from Python.gui_helpers import compute_spectral_radius
+    from Python.matrices import check_diagonal, get_diagonal, is_operator, is_sparse, off_diagonal, prepare_matrix
+    from Python.bandas import route_to_band
+    from Python.tareas import report_progress
+    from Python.trazas import IterationTrace
 except Exception:
     from gui_helpers import compute_spectral_radius
+    from matrices import check_diagonal, get_diagonal, is_operator, is_sparse, off_diagonal, prepare_matrix
+    from bandas import route_to_band
+    from tareas import report_progress
+    from trazas import IterationTrace
 
 def str_to_numpy_matrix(matrix_str):
     """
@@ -19,9 +27,110 @@ def str_to_numpy_matrix(matrix_str):
         return None
     
 
-def jacobi(A, b, x0, tolerance, max_iterations, error_type='rel', show_report=False,  auto_compare=True):
-    # si se solicita informe comparativo, delegar a la versión en supCp2 (si existe)
-    if show_report:
+def jacobi_splitting(matrix_a, dtype=np.float64):
+    """
+    Partición A = D + R que usa Jacobi: devuelve (1/d, R), con la diagonal
+    ya invertida. Para llamar al núcleo muchas veces con la misma A (p. ej.
+    como suavizador de multigrid) se arma una sola vez.
+    dtype: float32 guarda la partición en simple precisión.
+    """
+    A = prepare_matrix(matrix_a, dtype)
+    diagonal = get_diagonal(A)
+    check_diagonal(diagonal, "Jacobi")
+    return (1.0 / diagonal).astype(dtype), off_diagonal(A)
+
+
+def jacobi_kernel(matrix_a, rhs, initial_guess, tolerance, max_iterations, error_type='rel', on_iteration=None, weight=1.0, splitting=None, dtype=np.float64):
+    """
+    Núcleo vectorizado de Jacobi para una o varias columnas de términos independientes.
+
+        matrix_a      : matriz A (n x n), densa, dispersa (scipy.sparse) o un
+                        operador con matvec y diagonal() (ver matrices.py).
+        rhs           : b (n,) o B (n x k); cada columna es un sistema.
+        initial_guess : x0 (n,) común a todas las columnas o X0 (n x k).
+        error_type    : 'rel' usa el error relativo; cualquier otro valor, el absoluto.
+        on_iteration  : opcional, on_iteration(k, X, abs_err, rel_err) en cada paso
+                        (X es n x k; los errores son vectores de longitud k).
+        weight        : ω de Jacobi ponderado, X <- (1 - ω)·X + ω·X_Jacobi
+                        (ω = 1 es Jacobi clásico; ω = 2/3 suaviza para multigrid).
+        splitting     : opcional, jacobi_splitting(A) ya calculada.
+        dtype         : precisión de las iteraciones; con float32 (y la
+                        partición en float32) cada paso mueve la mitad de bytes.
+
+    La diagonal se guarda como vector (se invierte una sola vez) y cada paso
+    es un único producto matriz-matriz R @ X sobre las columnas que aún no
+    convergieron; cada columna se congela al cumplir la tolerancia. Si A es
+    dispersa, R se guarda en CSR y cada paso cuesta O(nnz · k).
+
+    Devuelve (X, iteraciones, abs_err, rel_err), con un valor por columna.
+    """
+    B = np.asarray(rhs, dtype=dtype)
+    single = B.ndim == 1
+    if single:
+        B = B[:, None]
+    n, k = B.shape
+
+    inv_diagonal, remainder = jacobi_splitting(matrix_a, dtype) if splitting is None else splitting
+    inv_diagonal = inv_diagonal[:, None]
+
+    X = np.array(initial_guess, dtype=dtype)
+    if X.ndim == 1:
+        X = np.repeat(X[:, None], k, axis=1)
+
+    iterations = np.zeros(k, dtype=int)
+    abs_err = np.full(k, np.inf)
+    rel_err = np.full(k, np.inf)
+    active = np.ones(k, dtype=bool)
+
+    for iteration_count in range(max_iterations):
+        cols = np.flatnonzero(active)
+        X_prev = X[:, cols]
+        X_new = (B[:, cols] - remainder @ X_prev) * inv_diagonal
+        if weight != 1.0:
+            X_new = weight * X_new + (1.0 - weight) * X_prev
+        X[:, cols] = X_new
+
+        step_abs = np.linalg.norm(X_new - X_prev, axis=0)
+        norms = np.linalg.norm(X_new, axis=0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            step_rel = np.where(norms != 0, step_abs / norms, np.inf)
+
+        abs_err[cols] = step_abs
+        rel_err[cols] = step_rel
+        iterations[cols] = iteration_count + 1
+
+        if on_iteration is not None:
+            on_iteration(iteration_count, X, abs_err, rel_err)
+
+        error = step_rel if error_type == 'rel' else step_abs
+        active[cols[error < tolerance]] = False
+        if not active.any():
+            break
+
+    if single:
+        return X[:, 0], iterations[0], abs_err[0], rel_err[0]
+    return X, iterations, abs_err, rel_err
+
+
+def jacobi(A, b, x0, tolerance, max_iterations, error_type='rel', show_report=False,  auto_compare=True, trace='full', band='off'):
+    """
+    Jacobi compatible con la GUI. Devuelve (summary_text, results_matrix).
+    Con b de varias columnas (n x k), cada fila trae las k soluciones (una
+    por sistema) y un error absoluto y relativo por sistema.
+
+        trace : qué iteraciones guardar en la tabla: 'full', 'errors',
+                'every:k' o 'last:N' (ver trazas.IterationTrace).
+        band  : 'auto' resuelve A de banda con Thomas o LU de banda en lugar de iterar.
+    """
+    # si se solicita informe comparativo, delegar a la versión en supCp2 (si existe);
+    # el informe compara sistemas de un solo término independiente
+    report = show_report and not is_operator(A) and not (isinstance(b, np.ndarray) and b.ndim == 2)
+    # band='auto': si A es de banda, se resuelve de forma directa (bandas.route_to_band);
+    # con informe se itera igual, para que el informe tenga sus iteraciones
+    routed = None if report else route_to_band(A, b, band)
+    if routed is not None:
+        return routed
+    if report:
         try:
             from Python.supCp2 import subjacobi as sj
             return sj.jacobi(A, b, x0, tolerance, max_iterations, error_type, show_report=True, auto_compare=auto_compare)
@@ -32,45 +141,47 @@ def jacobi(A, b, x0, tolerance, max_iterations, error_type='rel', show_report=Fa
             except Exception:
                 pass
     # A, b, x0 pueden ser numpy arrays (desde GUI2) o strings (ejecución directa)
-    matrix_a = A if isinstance(A, np.ndarray) else str_to_numpy_matrix(A)
+    matrix_a = A if isinstance(A, np.ndarray) or is_sparse(A) or is_operator(A) else str_to_numpy_matrix(A)
     vector_b = b if isinstance(b, np.ndarray) else str_to_numpy_matrix(b)
     initial_guess = x0 if isinstance(x0, np.ndarray) else str_to_numpy_matrix(x0)
-    results_matrix = []
-    diagonal_matrix = np.diag(np.diag(matrix_a))
-    lu_matrix = matrix_a - diagonal_matrix
-    solution_vector = initial_guess
-    
-    for iteration_count in range(max_iterations):
-        diagonal_inverse = np.linalg.inv(diagonal_matrix)
-        previous_solution = solution_vector
-        solution_vector = np.dot(diagonal_inverse, np.dot(-lu_matrix, solution_vector)) + np.dot(diagonal_inverse, vector_b)
-        absolute_error = np.linalg.norm(solution_vector - previous_solution)
-        
-        if np.linalg.norm(solution_vector) != 0:
-            relative_error = absolute_error / np.linalg.norm(solution_vector)
-        else:
-            print("Error: División por 0")
-            relative_error = float('inf')
-        
-        results_matrix.append([iteration_count, solution_vector.copy().tolist(), absolute_error, relative_error]) 
-        if error_type=="rela":
-            error = relative_error
+    history = IterationTrace(trace, max_iterations)
+    multiple_rhs = np.ndim(vector_b) == 2
+
+    def record(iteration_count, solution, absolute_error, relative_error):
+        if multiple_rhs:
+            # una solución por sistema (X es n x k): x_k de la fila es k x n,
+            # en el mismo orden que los errores de cada columna de b
+            history.record(iteration_count, solution.T, absolute_error, relative_error)
         else:
-            error = absolute_error
-            
-        if error < tolerance:
-            break
+            history.record(iteration_count, solution[:, 0], absolute_error[0], relative_error[0])
+            if np.isinf(relative_error[0]):
+                print("Error: División por 0")
+        report_progress(iteration_count, float(np.max(relative_error if error_type == "rela" else absolute_error)))
+
+    # error_type == "rela" usa el error relativo; cualquier otro valor, el absoluto
+    _, iterations, _, _ = jacobi_kernel(
+        matrix_a, vector_b, initial_guess, tolerance, max_iterations,
+        error_type='rel' if error_type == "rela" else 'abs',
+        on_iteration=record
+    )
 
     headers = ["Iteración", "Solución", "Error absoluto", "Error relativo"]
     # Calcular radio espectral
-    rho, _ = compute_spectral_radius(matrix_a, method='jacobi')
+    # con un solo b, los errores de la tabla sirven para estimar rho sin más cálculos
+    residuals = None if multiple_rhs else history.absolute_errors()
+    rho, _ = compute_spectral_radius(matrix_a, method='jacobi', residual_history=residuals)
     can_conv = False if rho is None else (rho < 1)
 
     summary = (
         f"Radio espectral: {rho:.6f}" if rho is not None else "Radio espectral: Desconocido",
-        f"Converge (rho<1)?: {'Sí' if can_conv else 'No'}",
+        f"Converge (rho<1)?: {'Desconocido' if rho is None else ('Sí' if can_conv else 'No')}",
     )
+    if multiple_rhs:
+        summary += (
+            f"Columnas de b: {len(iterations)}",
+            f"Iteraciones por columna: {', '.join(str(it) for it in iterations)}",
+        )
 
     # Devolver (summary_text, table_rows)
     summary_text = "\n".join(summary)
-    return (summary_text, results_matrix)
\ No newline at end of file
+    return (summary_text, history.rows())
\ No newline at end of file
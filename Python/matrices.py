@@ -0,0 +1,313 @@
+import numpy as np
+import scipy.sparse as sp
+from scipy.linalg import solve_triangular
+from scipy.sparse.linalg import splu, spsolve_triangular
+
+# Operaciones sobre la matriz A que comparten Jacobi, Gauss-Seidel y SOR.
+# A puede ser un arreglo denso de NumPy o una matriz dispersa de scipy.sparse;
+# las dispersas se trabajan en CSR, así que memoria y tiempo escalan con nnz.
+#
+# A también puede ser un operador sin matriz (p. ej. un esténcil), que nunca se
+# guarda completo. Debe tener:
+#   shape             : (n, n)
+#   matvec(x)         : A·x
+#   diagonal()        : la diagonal de A (Jacobi, Gauss-Seidel, SOR)
+#   rows(start, stop) : opcional, las filas start..stop-1 de A como CSR de
+#                       (stop - start) x n; con ellas Gauss-Seidel y SOR hacen
+#                       el barrido por bloques de filas
+# scipy.sparse.linalg.LinearOperator sirve si se le agrega diagonal().
+
+# Filas por bloque en los barridos sobre operadores
+OPERATOR_ROW_BLOCK = 65536
+
+
+def is_sparse(A):
+    return sp.issparse(A)
+
+
+def is_operator(A):
+    """True si A es un operador sin matriz (tiene matvec(v) y shape) en lugar de una matriz."""
+    return hasattr(A, "matvec") and not isinstance(A, np.ndarray) and not is_sparse(A)
+
+
+def working_dtype(A):
+    """float32 si A ya viene en simple precisión y float64 en cualquier otro caso."""
+    return np.dtype(np.float32) if getattr(A, "dtype", None) == np.float32 else np.dtype(np.float64)
+
+
+def prepare_matrix(A, dtype=np.float64):
+    """
+    A como CSR si es dispersa, sin cambios si es un operador y, si no, como
+    arreglo denso; 'dtype' es float64 salvo en el refinamiento de precisión
+    mixta, que arma copias float32.
+    """
+    if is_operator(A):
+        return A
+    if is_sparse(A):
+        return sp.csr_matrix(A, dtype=dtype)
+    return np.asarray(A, dtype=dtype)
+
+
+def get_diagonal(A):
+    """Diagonal de A como vector."""
+    if is_operator(A):
+        if not hasattr(A, "diagonal"):
+            raise ValueError("El operador no tiene diagonal(); Jacobi, Gauss-Seidel y SOR la necesitan.")
+        return np.asarray(A.diagonal(), dtype=np.float64)
+    if is_sparse(A):
+        return np.asarray(A.diagonal(), dtype=np.float64)
+    return np.diag(A).astype(np.float64)
+
+
+def off_diagonal(A):
+    """R = A - D (A sin su diagonal)."""
+    if is_operator(A):
+        return OperatorPart(A, "off")
+    if is_sparse(A):
+        R = (A - sp.diags(A.diagonal())).tocsr()
+        R.eliminate_zeros()
+        return R
+    R = np.array(A, dtype=working_dtype(A))
+    np.fill_diagonal(R, 0.0)
+    return R
+
+
+def strict_lower(A):
+    """L: parte estrictamente triangular inferior de A."""
+    if is_operator(A):
+        return OperatorPart(A, "lower")
+    if is_sparse(A):
+        return sp.tril(A, -1, format='csr')
+    return np.tril(A, -1)
+
+
+def strict_upper(A):
+    """U: parte estrictamente triangular superior de A."""
+    if is_operator(A):
+        return OperatorPart(A, "upper")
+    if is_sparse(A):
+        return sp.triu(A, 1, format='csr')
+    return np.triu(A, 1)
+
+
+def with_diagonal(M, d):
+    """M + diag(d), del mismo tipo (denso, CSR u OperatorPart) que M."""
+    if isinstance(M, OperatorPart):
+        return M.with_diagonal(d)
+    if is_sparse(M):
+        return (M + sp.diags(np.asarray(d, dtype=M.dtype))).tocsr()
+    M = np.array(M, dtype=working_dtype(M))
+    M[np.diag_indices_from(M)] += d
+    return M
+
+
+def lower_triangular_solver(T):
+    """
+    Devuelve solve(rhs) para T·x = rhs con T triangular inferior.
+
+    Densa: sustitución hacia adelante de LAPACK. Dispersa: se factoriza T una
+    vez con SuperLU en el orden natural (una matriz triangular no genera
+    relleno) y cada barrido es una sustitución O(nnz).
+    """
+    return _triangular_solver(T, lower=True)
+
+
+def upper_triangular_solver(T):
+    """Como lower_triangular_solver, para T triangular superior (sustitución hacia atrás)."""
+    return _triangular_solver(T, lower=False)
+
+
+def _triangular_solver(T, lower):
+    if isinstance(T, OperatorPart):
+        if not lower or T.part != "lower":
+            raise ValueError("Con un operador solo se resuelve la parte triangular inferior (barrido hacia adelante).")
+        return T.forward_solver()
+    if not is_sparse(T):
+        return lambda rhs: solve_triangular(T, rhs, lower=lower, check_finite=False)
+
+    T = sp.csc_matrix(T)
+    try:
+        lu = splu(T, permc_spec='NATURAL', diag_pivot_thresh=0.0)
+        return lu.solve
+    except Exception:
+        T = T.tocsr()
+        return lambda rhs: spsolve_triangular(T, rhs, lower=lower)
+
+
+def apply_operator(A, X):
+    """A·X para un operador y X de una o varias columnas."""
+    X = np.asarray(X, dtype=np.float64)
+    if X.ndim == 1:
+        return np.asarray(A.matvec(X), dtype=np.float64)
+    if hasattr(A, "matmat"):
+        return np.asarray(A.matmat(X), dtype=np.float64)
+    return np.column_stack([A.matvec(X[:, j]) for j in range(X.shape[1])])
+
+
+def _operator_rows(A, start, stop):
+    if not hasattr(A, "rows"):
+        raise ValueError("El operador no tiene rows(start, stop); Gauss-Seidel y SOR necesitan acceso por filas.")
+    return sp.csr_matrix(A.rows(start, stop), dtype=np.float64)
+
+
+def _select_entries(rows, keep, shape=None, column_shift=0):
+    """CSR con solo los elementos 'keep' (máscara sobre rows.data) de rows, sin reordenar."""
+    row_of = np.repeat(np.arange(rows.shape[0]), np.diff(rows.indptr))
+    counts = np.bincount(row_of[keep], minlength=rows.shape[0])
+    indptr = np.concatenate([[0], np.cumsum(counts)])
+    return sp.csr_matrix((rows.data[keep], rows.indices[keep] - column_shift, indptr), shape=shape or rows.shape)
+
+
+def _row_of_entries(rows, start):
+    """Fila global (start + fila del bloque) de cada elemento guardado de rows."""
+    return start + np.repeat(np.arange(rows.shape[0]), np.diff(rows.indptr))
+
+
+class OperatorPart:
+    """
+    Una parte de un operador A sin formarla: 'off' (A - D), 'lower' (L) o
+    'upper' (U), multiplicada por 'scale' y con 'diagonal' sumada, es decir
+    scale·parte + diag(diagonal).
+
+    'off' se aplica con matvec; 'lower' y 'upper' leen A por bloques de
+    OPERATOR_ROW_BLOCK filas con rows(start, stop), así que la memoria es la
+    de un bloque y no la de A.
+    """
+
+    def __init__(self, A, part, scale=1.0, diagonal=None):
+        self.A = A
+        self.part = part
+        self.scale = scale
+        self.diagonal = diagonal
+        self.shape = A.shape
+
+    def __rmul__(self, c):
+        return OperatorPart(self.A, self.part, c * self.scale, None if self.diagonal is None else c * self.diagonal)
+
+    def __neg__(self):
+        return (-1.0) * self
+
+    def with_diagonal(self, d):
+        d = np.asarray(d, dtype=np.float64)
+        return OperatorPart(self.A, self.part, self.scale, d if self.diagonal is None else self.diagonal + d)
+
+    def _blocks(self):
+        n = self.shape[0]
+        for start in range(0, n, OPERATOR_ROW_BLOCK):
+            stop = min(start + OPERATOR_ROW_BLOCK, n)
+            yield start, stop, _operator_rows(self.A, start, stop)
+
+    def __matmul__(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        column = (slice(None),) + (None,) * (X.ndim - 1)
+        if self.part == "off":
+            Y = apply_operator(self.A, X) - get_diagonal(self.A)[column] * X
+        else:
+            Y = np.empty(X.shape)
+            for start, stop, rows in self._blocks():
+                # fila i del bloque = fila start + i de A
+                row_of = _row_of_entries(rows, start)
+                keep = rows.indices > row_of if self.part == "upper" else rows.indices < row_of
+                Y[start:stop] = _select_entries(rows, keep) @ X
+        if self.scale != 1.0:
+            Y *= self.scale
+        if self.diagonal is not None:
+            Y += self.diagonal[column] * X
+        return Y
+
+    def forward_solver(self):
+        """
+        solve(r) para (scale·L + diag(diagonal))·x = r, bloque a bloque: lo
+        ya resuelto (columnas < start) pasa al lado derecho y el bloque
+        diagonal es una sustitución triangular dispersa.
+        """
+        if self.diagonal is None:
+            raise ValueError("La parte triangular necesita su diagonal para resolverse.")
+        diagonal = self.diagonal
+
+        def solve(r):
+            r = np.asarray(r, dtype=np.float64)
+            # x = 0 en lo aún no resuelto: L_bloque·x solo ve las columnas < start
+            x = np.zeros(r.shape)
+            for start, stop, rows in self._blocks():
+                row_of = _row_of_entries(rows, start)
+                strict = rows.indices < row_of
+                rhs = r[start:stop] - self.scale * (_select_entries(rows, strict) @ x)
+                inside = strict & (rows.indices >= start)
+                T = _select_entries(rows, inside, (stop - start, stop - start), column_shift=start)
+                T = (self.scale * T + sp.diags(diagonal[start:stop])).tocsr()
+                x[start:stop] = spsolve_triangular(T, rhs, lower=True)
+            return x
+
+        return solve
+
+
+def check_diagonal(d, method_name):
+    if np.any(d == 0):
+        raise ZeroDivisionError(f"La matriz tiene ceros en la diagonal; {method_name} no puede aplicarse.")
+
+
+def _adjacency_lists(A):
+    """(indptr, indices) como listas de Python del patrón simétrico de A (i ~ j si a_ij o a_ji no es cero)."""
+    if is_sparse(A):
+        pattern = sp.csr_matrix(A, dtype=bool)
+    else:
+        pattern = sp.csr_matrix(np.asarray(A) != 0)
+    pattern = (pattern + pattern.T).tocsr()
+    # listas de Python: el bucle por nodo es mucho más rápido que con arreglos pequeños
+    return pattern.indptr.tolist(), pattern.indices.tolist()
+
+
+def greedy_coloring(A):
+    """
+    Colorea el grafo de adyacencia de A (i ~ j si a_ij o a_ji no es cero)
+    con el algoritmo voraz en orden natural: cada nodo recibe el menor color
+    que no usa ningún vecino ya coloreado. En mallas (Poisson 1D/2D) esto da
+    la ordenación roja-negra.
+
+    Devuelve una lista de arreglos con los índices de cada color.
+    """
+    indptr, indices = _adjacency_lists(A)
+
+    n = len(indptr) - 1
+    colors = [-1] * n
+    for i in range(n):
+        used = {colors[j] for j in indices[indptr[i]:indptr[i + 1]]}
+        c = 0
+        while c in used:
+            c += 1
+        colors[i] = c
+
+    colors = np.array(colors, dtype=np.int64)
+    return [np.flatnonzero(colors == c) for c in range(colors.max() + 1)]
+
+
+def is_consistently_ordered(A):
+    """
+    True si A está consistentemente ordenada (Young): existen niveles enteros
+    g tales que, para cada a_ij != 0 con i != j, g(j) = g(i) + 1 si j > i y
+    g(j) = g(i) - 1 si j < i. Incluye las tridiagonales y las matrices de
+    Poisson 1D/2D en orden natural. Se comprueba con un recorrido del grafo
+    en O(nnz).
+    """
+    indptr, indices = _adjacency_lists(A)
+
+    n = len(indptr) - 1
+    levels = [None] * n
+    for start in range(n):
+        if levels[start] is not None:
+            continue
+        levels[start] = 0
+        stack = [start]
+        while stack:
+            i = stack.pop()
+            for j in indices[indptr[i]:indptr[i + 1]]:
+                if j == i:
+                    continue
+                expected = levels[i] + (1 if j > i else -1)
+                if levels[j] is None:
+                    levels[j] = expected
+                    stack.append(j)
+                elif levels[j] != expected:
+                    return False
+    return True
@@ -0,0 +1,258 @@
+import numpy as np
+import ast
+import scipy.sparse as sp
+from scipy.sparse.linalg import splu
+try:
+    from Python.gauss_seidel import gauss_seidel_kernel, gauss_seidel_splitting
+    from Python.jacobi import jacobi_kernel, jacobi_splitting
+    from Python.matrices import is_sparse, prepare_matrix
+    from Python.trazas import IterationTrace, progress_recorder, residual_summary
+except Exception:
+    from gauss_seidel import gauss_seidel_kernel, gauss_seidel_splitting
+    from jacobi import jacobi_kernel, jacobi_splitting
+    from matrices import is_sparse, prepare_matrix
+    from trazas import IterationTrace, progress_recorder, residual_summary
+
+# Multigrid geométrico para sistemas tipo Poisson en mallas 1D (n puntos) y
+# 2D (n x n puntos, orden natural por filas). Los niveles gruesos se obtienen
+# con n_grueso = (n - 1) / 2 mientras n sea impar, así que conviene n = 2^k - 1.
+# Los suavizadores son los núcleos de Gauss-Seidel y de Jacobi ponderado.
+
+CYCLES = ("V", "F")
+SMOOTHERS = ("gauss_seidel", "jacobi")
+
+SMOOTHER_NAMES = {
+    "gauss_seidel": "Gauss-Seidel",
+    "jacobi": "Jacobi ponderado",
+}
+
+
+def str_to_numpy_matrix(matrix_str):
+    """
+    Convierte una cadena de texto que representa una matriz o vector en un objeto numpy array.
+    """
+    try:
+        matrix_list = ast.literal_eval(matrix_str)
+        matrix_np = np.array(matrix_list, dtype=np.float64)
+        return matrix_np
+    except Exception as e:
+        raise ValueError(f"Error al convertir cadena a matriz numpy: {e}")
+
+
+def poisson_matrix(n, dim=1):
+    """
+    Matriz de -Δu = f con diferencias centradas en n puntos interiores por
+    lado (CSR): tridiagonal (-1, 2, -1) en 1D y de cinco puntos (-1, 4, -1)
+    en 2D, de tamaño n^dim. El término independiente es b = h²·f con
+    h = 1 / (n + 1).
+    """
+    n = int(n)
+    T = sp.diags([-1.0, 2.0, -1.0], [-1, 0, 1], shape=(n, n), format='csr')
+    if int(dim) == 1:
+        return T
+    if int(dim) == 2:
+        I = sp.identity(n, format='csr')
+        return (sp.kron(I, T) + sp.kron(T, I)).tocsr()
+    raise ValueError("La dimensión de la malla debe ser 1 o 2.")
+
+
+def infer_grid_shape(matrix_a):
+    """
+    Forma de la malla de A a partir de su ancho de banda: 1 en 1D
+    (tridiagonal) y n en 2D (N = n² incógnitas). Lanza ValueError si A no
+    parece una matriz de malla 1D o 2D.
+    """
+    A = sp.coo_matrix(matrix_a)
+    N = A.shape[0]
+    bandwidth = int(np.max(np.abs(A.row - A.col))) if A.nnz else 0
+    if bandwidth <= 1:
+        return (N,)
+    if bandwidth * bandwidth == N:
+        return (bandwidth, bandwidth)
+    raise ValueError("No se reconoce la malla de A; indique grid_shape=(n,) o (n, n).")
+
+
+def prolongation_1d(n):
+    """
+    Interpolación lineal de la malla gruesa ((n - 1) / 2 puntos) a la fina
+    (n puntos, n impar): el punto grueso j es el fino 2j + 1 y los puntos
+    finos pares son el promedio de sus vecinos gruesos.
+    """
+    n_coarse = (n - 1) // 2
+    j = np.arange(n_coarse)
+    rows = np.concatenate([2 * j + 1, 2 * j, 2 * j + 2])
+    cols = np.concatenate([j, j, j])
+    vals = np.concatenate([np.ones(n_coarse), np.full(n_coarse, 0.5), np.full(n_coarse, 0.5)])
+    return sp.csr_matrix((vals, (rows, cols)), shape=(n, n_coarse))
+
+
+def build_hierarchy(matrix_a, grid_shape=None, smoother="gauss_seidel"):
+    """
+    Niveles de multigrid, de la malla fina a la más gruesa.
+
+    En cada nivel: P (prolongación lineal; en 2D, P_1D ⊗ P_1D), la
+    restricción de ponderación completa R = Pᵀ / 2^dim y el operador grueso
+    de Galerkin A_c = R·A·P. Los suavizadores se preparan una vez por nivel;
+    el nivel más grueso se resuelve con LU dispersa.
+
+    Devuelve una lista de diccionarios con 'A', 'shape', 'P', 'R' y
+    'splitting' (o 'lu' en el último nivel).
+    """
+    A = sp.csr_matrix(prepare_matrix(matrix_a))
+    shape = tuple(grid_shape) if grid_shape is not None else infer_grid_shape(A)
+    if int(np.prod(shape)) != A.shape[0]:
+        raise ValueError(f"La malla {shape} no coincide con el tamaño de A ({A.shape[0]}).")
+
+    setup = gauss_seidel_splitting if smoother == "gauss_seidel" else jacobi_splitting
+    levels = []
+    while shape[0] % 2 == 1 and shape[0] >= 3:
+        P1 = prolongation_1d(shape[0])
+        P = P1 if len(shape) == 1 else sp.kron(P1, P1, format='csr')
+        R = (P.T / 2 ** len(shape)).tocsr()
+        levels.append({'A': A, 'shape': shape, 'P': P, 'R': R, 'splitting': setup(A)})
+        A = (R @ A @ P).tocsr()
+        shape = tuple((s - 1) // 2 for s in shape)
+    levels.append({'A': A, 'shape': shape, 'lu': splu(sp.csc_matrix(A))})
+    return levels
+
+
+def _smooth(level, b, x, sweeps, smoother, weight):
+    if sweeps <= 0:
+        return x
+    # tolerancia 0: el núcleo hace exactamente 'sweeps' barridos
+    if smoother == "gauss_seidel":
+        x, _, _, _ = gauss_seidel_kernel(level['A'], b, x, 0.0, sweeps, error_type='abs', splitting=level['splitting'])
+    else:
+        x, _, _, _ = jacobi_kernel(level['A'], b, x, 0.0, sweeps, error_type='abs', weight=weight, splitting=level['splitting'])
+    return x
+
+
+def _cycle(levels, depth, b, x, cycle, smoother, pre_smooth, post_smooth, weight):
+    """
+    Un ciclo desde el nivel 'depth'. V: suavizar, corregir con un ciclo V
+    en la malla gruesa y volver a suavizar. F: la corrección gruesa es un
+    ciclo F seguido de un ciclo V.
+    """
+    level = levels[depth]
+    if 'lu' in level:
+        return level['lu'].solve(b)
+
+    x = _smooth(level, b, x, pre_smooth, smoother, weight)
+    coarse_residual = level['R'] @ (b - level['A'] @ x)
+    correction = _cycle(levels, depth + 1, coarse_residual, np.zeros_like(coarse_residual),
+                        cycle, smoother, pre_smooth, post_smooth, weight)
+    if cycle == "F":
+        correction = _cycle(levels, depth + 1, coarse_residual, correction,
+                            "V", smoother, pre_smooth, post_smooth, weight)
+    x = x + level['P'] @ correction
+    return _smooth(level, b, x, post_smooth, smoother, weight)
+
+
+def multigrid_kernel(matrix_a, vector_b, initial_guess, tolerance, max_iterations, error_type='rel', cycle='V', smoother='gauss_seidel', pre_smooth=2, post_smooth=2, weight=None, grid_shape=None, levels=None, on_iteration=None):
+    """
+    Multigrid geométrico: cada iteración es un ciclo V o F completo.
+
+        cycle       : 'V' o 'F'.
+        smoother    : 'gauss_seidel' o 'jacobi' (Jacobi ponderado).
+        pre_smooth, post_smooth : barridos del suavizador antes y después de
+                      la corrección gruesa.
+        weight      : ω de Jacobi ponderado; por defecto 2/3 en 1D y 4/5 en 2D.
+        grid_shape  : (n,) o (n, n); por defecto se deduce de A.
+        levels      : opcional, build_hierarchy(A, ...) ya calculada.
+        on_iteration: opcional, on_iteration(k, x, abs_err, rel_err) tras cada ciclo.
+
+    El error es el residuo: abs_err = ||b - A·x_k||, rel_err = abs_err / ||b||.
+    Devuelve (x, iteraciones, abs_err, rel_err) del último ciclo.
+    """
+    cycle = str(cycle).strip().upper()
+    if cycle not in CYCLES:
+        raise ValueError(f"Ciclo desconocido: '{cycle}'. Use {', '.join(CYCLES)}.")
+    smoother = str(smoother).strip().lower()
+    if smoother not in SMOOTHERS:
+        raise ValueError(f"Suavizador desconocido: '{smoother}'. Use {', '.join(SMOOTHERS)}.")
+
+    if levels is None:
+        levels = build_hierarchy(matrix_a, grid_shape, smoother)
+    if weight is None:
+        weight = 2.0 / 3.0 if len(levels[0]['shape']) == 1 else 4.0 / 5.0
+    A = levels[0]['A']
+
+    b = np.asarray(vector_b, dtype=np.float64)
+    x = np.array(initial_guess, dtype=np.float64)
+    norm_b = np.linalg.norm(b)
+    absolute_error = float(np.linalg.norm(b - A @ x))
+    relative_error = absolute_error / norm_b if norm_b != 0 else float('inf')
+    iterations = 0
+
+    for iteration_count in range(max_iterations):
+        if absolute_error == 0:
+            break
+        x = _cycle(levels, 0, b, x, cycle, smoother, int(pre_smooth), int(post_smooth), weight)
+
+        absolute_error = float(np.linalg.norm(b - A @ x))
+        relative_error = float(absolute_error / norm_b) if norm_b != 0 else float('inf')
+        iterations = iteration_count + 1
+
+        if on_iteration is not None:
+            on_iteration(iteration_count, x, absolute_error, relative_error)
+
+        error = relative_error if error_type == 'rel' else absolute_error
+        if error < tolerance:
+            break
+
+    return x, iterations, absolute_error, relative_error
+
+
+def multigrid_method(A, b, x0, tolerance, max_iterations, cycle='V', smoother='gauss_seidel', error_type='rel', trace='full'):
+    """
+    Multigrid compatible con la GUI. Devuelve (summary_text, results_matrix),
+    con filas [k, x_k, residuo, residuo relativo] (una por ciclo).
+    trace: qué iteraciones guardar ('full', 'errors', 'every:k' o 'last:N').
+    """
+    matrix_a = A if isinstance(A, np.ndarray) or is_sparse(A) else str_to_numpy_matrix(A)
+    vector_b = b if isinstance(b, np.ndarray) else str_to_numpy_matrix(b)
+    initial_guess = x0 if isinstance(x0, np.ndarray) else str_to_numpy_matrix(x0)
+    history = IterationTrace(trace, max_iterations)
+    record = progress_recorder(history, error_type)
+
+    smoother = str(smoother).strip().lower()
+    levels = build_hierarchy(matrix_a, smoother=smoother if smoother in SMOOTHERS else "gauss_seidel")
+    initial_residual = float(np.linalg.norm(np.asarray(vector_b, dtype=np.float64) - levels[0]['A'] @ np.asarray(initial_guess, dtype=np.float64)))
+
+    kernel_et = 'rel' if error_type in ("rel", "rela") else 'abs'
+    _, iterations, absolute_error, relative_error = multigrid_kernel(
+        matrix_a, vector_b, initial_guess, tolerance, max_iterations,
+        error_type=kernel_et, cycle=cycle, smoother=smoother, levels=levels, on_iteration=record
+    )
+
+    sizes = " → ".join("x".join(str(s) for s in level['shape']) for level in levels)
+    residual_lines, _ = residual_summary(absolute_error, relative_error, iterations, tolerance, kernel_et, unit="ciclos")
+    summary = (
+        f"Ciclo {str(cycle).strip().upper()}, suavizador: {SMOOTHER_NAMES.get(smoother, smoother)} (2 + 2 barridos)",
+        f"Niveles: {len(levels)} ({sizes})",
+    ) + residual_lines
+    if iterations > 0 and initial_residual > 0 and absolute_error > 0:
+        factor = (absolute_error / initial_residual) ** (1.0 / iterations)
+        summary += (f"Factor de reducción medio del residuo por ciclo: {factor:.4f}",)
+    summary_text = "\n".join(summary)
+    return (summary_text, history.rows())
+
+
+if __name__ == '__main__':
+    # modo consola: resolver -Δu = 1 en la malla indicada y mostrar los ciclos
+    n = int(input("Puntos interiores por lado (mejor 2^k - 1, e.g. 63): "))
+    dim = int(input("Dimensión de la malla (1 o 2): "))
+    tolerance = float(input("Ingresa la tolerancia: "))
+    max_iterations = int(input("Ingresa el número máximo de ciclos: "))
+    cycle = input("Ciclo (V o F): ").strip() or 'V'
+
+    matrix_a = poisson_matrix(n, dim)
+    vector_b = np.full(matrix_a.shape[0], 1.0 / (n + 1) ** 2)
+    summary, table = multigrid_method(matrix_a, vector_b, np.zeros(matrix_a.shape[0]), tolerance, max_iterations, cycle)
+    print(summary)
+    try:
+        from tabulate import tabulate
+        print(tabulate([[row[0], row[2], row[3]] for row in table], headers=["Ciclo", "Residuo absoluto", "Residuo relativo"]))
+    except Exception:
+        for row in table:
+            print(row[0], row[2], row[3])
@@ -1,4 +1,10 @@
 import numpy as np
+try:
+    from Python.criterios import ALL_ERRORS, MultiCriterionRun, step_error
+    from Python.tareas import report_progress
+except Exception:
+    from criterios import ALL_ERRORS, MultiCriterionRun, step_error
+    from tareas import report_progress
 
 def newton_method(
     f,
@@ -15,10 +21,13 @@ def newton_method(
 
     Parámetros:
         f             : función f(x) ya construida por la GUI (lambda o def).
+                        Si ofrece f.derivatives(x) se usa f'(x) exacta (dif. automática).
         x0            : valor inicial.
         tolerance     : tolerancia (float).
         max_iterations: máximo número de iteraciones (int).
-        error_type    : 'abs', 'rel' o 'cond' (la GUI manda este valor).
+        error_type    : 'abs', 'rel' o 'cond' (la GUI manda este valor). Con 'all'
+                        se calculan los tres criterios en una sola corrida y se
+                        devuelve un dict {tipo: (raiz, f(raiz), iteraciones, tabla)}.
         show_report   : (no usado aquí, pero se deja para compatibilidad).
         eval_grid     : (no usado aquí).
         auto_compare  : (no usado aquí).
@@ -29,44 +38,47 @@ def newton_method(
         [iter, x_actual, f(x_actual), f'(x_actual), error]
     """
 
-    # Derivada numérica central
+    # Derivada numérica central (solo si f no trae derivadas automáticas)
     def df(x):
         h = 1e-6
         return (f(x + h) - f(x - h)) / (2.0 * h)
 
+    # La función compilada por la GUI devuelve f y f' en una sola pasada
+    derivatives = getattr(f, "derivatives", None)
+
     x_current = float(x0)
     iteration_data = []
+    multi = MultiCriterionRun(tolerance) if error_type == ALL_ERRORS else None
 
     for k in range(int(max_iterations)):
-        f_current = f(x_current)
-        df_current = df(x_current)
+        if derivatives is not None:
+            f_current, df_current, _ = derivatives(x_current)
+        else:
+            f_current = f(x_current)
+            df_current = df(x_current)
 
         # derivada casi cero → peligro
         if df_current == 0:
             # agregamos la fila con error "infinito" para que aparezca en la tabla
             iteration_data.append([k, x_current, f_current, df_current, float("inf")])
+            if multi is not None:
+                multi.record_failure()
             break
 
         x_next = x_current - f_current / df_current
 
-        # cálculo del error según tipo
-        if error_type == "abs":
-            error = abs(x_next - x_current)
-        elif error_type == "rel":
-            if x_next != 0:
-                error = abs((x_next - x_current) / x_next)
-            else:
-                error = abs(x_next - x_current)
-        elif error_type == "cond":
-            # por ejemplo: error basado en |f(x)|
-            error = abs(f_current)
-        else:
-            # fallback: error absoluto
-            error = abs(x_next - x_current)
+        # cálculo del error según tipo ('cond' usa |f(x)|)
+        error = step_error(error_type, x_next - x_current, x_next, f_current)
 
         iteration_data.append([k, x_current, f_current, df_current, error])
+        report_progress(k, error)
 
-        if error < tolerance:
+        if multi is not None:
+            multi.record(x_next - x_current, x_next, f_current, root=x_next)
+            if multi.done():
+                x_current = x_next
+                break
+        elif error < tolerance:
             x_current = x_next
             break
 
@@ -76,4 +88,7 @@ def newton_method(
     f_root = f(root)
     iterations = len(iteration_data)
 
+    if multi is not None:
+        return multi.results(iteration_data, 4, root, f_root, f)
+
     return root, f_root, iterations, iteration_data
@@ -0,0 +1,72 @@
+import numpy as np
+import scipy.sparse as sp
+
+# Operadores sin matriz para los métodos del capítulo 2 (ver matrices.py):
+# objetos con shape, matvec(x), diagonal() y rows(start, stop) que aplican A
+# sin guardarla. Con ellos Jacobi, Gauss-Seidel y SOR resuelven mallas de
+# millones de incógnitas con memoria O(n).
+
+
+class PoissonOperator:
+    """
+    -Δ con diferencias centradas en una malla de n puntos interiores por
+    lado en 'dim' dimensiones (Dirichlet homogéneo, orden natural por
+    filas): la misma matriz que multigrid.poisson_matrix(n, dim), con
+    2·dim en la diagonal y -1 en cada vecino, más 'shift' en la diagonal
+    (-Δ + shift·I).
+
+    matvec cuesta O(n^dim) con operaciones sobre la malla; rows(start, stop)
+    arma solo las filas pedidas.
+    """
+
+    def __init__(self, n, dim=2, shift=0.0):
+        self.n = int(n)
+        self.dim = int(dim)
+        self.shift = float(shift)
+        if self.dim < 1:
+            raise ValueError("La dimensión de la malla debe ser 1 o mayor.")
+        self.size = self.n ** self.dim
+        self.shape = (self.size, self.size)
+        self.dtype = np.dtype(np.float64)
+        # salto en el índice lineal al moverse un punto en cada eje
+        self.strides = [self.n ** (self.dim - 1 - axis) for axis in range(self.dim)]
+
+    def diagonal(self):
+        return np.full(self.size, 2.0 * self.dim + self.shift)
+
+    def matvec(self, x):
+        x = np.asarray(x, dtype=np.float64)
+        extra = x.shape[1:]
+        u = x.reshape((self.n,) * self.dim + extra)
+        y = (2.0 * self.dim + self.shift) * u
+        for axis in range(self.dim):
+            lead = (slice(None),) * axis
+            y[lead + (slice(1, None),)] -= u[lead + (slice(None, -1),)]
+            y[lead + (slice(None, -1),)] -= u[lead + (slice(1, None),)]
+        return y.reshape(x.shape)
+
+    def matmat(self, X):
+        return self.matvec(X)
+
+    def __matmul__(self, x):
+        return self.matvec(x)
+
+    def rows(self, start, stop):
+        """Filas start..stop-1 de A como CSR de (stop - start) x n^dim."""
+        index = np.arange(start, stop, dtype=np.int64)
+        # desplazamientos de columna en orden creciente: -strides, 0, +strides
+        offsets = [-stride for stride in self.strides] + [0] + [stride for stride in reversed(self.strides)]
+        columns = index[:, None] + np.array(offsets, dtype=np.int64)
+        valid = np.ones(columns.shape, dtype=bool)
+        for j, stride in enumerate(self.strides):
+            coordinate = (index // stride) % self.n
+            valid[:, j] = coordinate > 0
+            valid[:, -1 - j] = coordinate < self.n - 1
+        values = np.full(columns.shape, -1.0)
+        values[:, self.dim] = 2.0 * self.dim + self.shift
+        indptr = np.concatenate([[0], np.cumsum(valid.sum(axis=1))])
+        return sp.csr_matrix((values[valid], columns[valid], indptr), shape=(stop - start, self.size))
+
+    def tocsr(self):
+        """A completa como CSR (solo para problemas pequeños o comparaciones)."""
+        return self.rows(0, self.size)
@@ -0,0 +1,169 @@
+import math
+
+import numpy as np
+import scipy.sparse as sp
+try:
+    from Python.matrices import check_diagonal, get_diagonal, is_operator, is_sparse, lower_triangular_solver, prepare_matrix, strict_lower, strict_upper, upper_triangular_solver, with_diagonal
+except Exception:
+    from matrices import check_diagonal, get_diagonal, is_operator, is_sparse, lower_triangular_solver, prepare_matrix, strict_lower, strict_upper, upper_triangular_solver, with_diagonal
+
+# Precondicionadores M ≈ A para los métodos de Krylov (PCG, GMRES, BiCGSTAB).
+# Cada uno se devuelve como apply(r) = M⁻¹·r. Los de barrido reutilizan las
+# sustituciones triangulares de Gauss-Seidel y SOR: aplicar M⁻¹ es hacer un
+# barrido del método partiendo de x = 0.
+
+PRECONDITIONER_NAMES = {
+    "none": "Ninguno",
+    "jacobi": "Jacobi (diagonal)",
+    "gauss_seidel": "Gauss-Seidel (un barrido)",
+    "sor": "SOR (un barrido)",
+    "ssor": "SSOR (barrido simétrico)",
+    "ic": "Cholesky incompleta IC(0)",
+}
+
+
+def _ic0(indptr, indices, data, n, shift):
+    """
+    IC(0) fila por fila sobre el patrón de tril(A) (CSR con índices ordenados).
+    Devuelve los valores de L en el orden de 'data', o None si aparece un
+    pivote no positivo.
+    """
+    rows = []
+    values = [0.0] * len(data)
+    for i in range(n):
+        row = {}
+        for p in range(indptr[i], indptr[i + 1]):
+            k = indices[p]
+            if k < i:
+                other = rows[k]
+                s = data[p] - sum(v * other[j] for j, v in row.items() if j in other)
+                row[k] = s / other[k]
+            else:
+                pivot = data[p] * (1.0 + shift) - sum(v * v for v in row.values())
+                if pivot <= 0:
+                    return None
+                row[k] = math.sqrt(pivot)
+            values[p] = row[k]
+        if i not in row:
+            return None
+        rows.append(row)
+    return values
+
+
+def incomplete_cholesky(matrix_a):
+    """
+    Cholesky incompleta: L triangular inferior con L·Lᵀ ≈ A.
+
+    Dispersa: IC(0), L tiene el mismo patrón que tril(A). Densa: el patrón
+    es completo, así que se usa la factorización de Cholesky de NumPy.
+    Si aparece un pivote no positivo (puede pasar aun con A definida
+    positiva) se factoriza A + α·diag(A), duplicando α desde 1e-3.
+    Devuelve (L, α), con L del mismo tipo (densa o CSR) que A.
+    """
+    A = prepare_matrix(matrix_a)
+    d = get_diagonal(A)
+    shift = 0.0
+
+    if not is_sparse(A):
+        while True:
+            try:
+                return np.linalg.cholesky(A + shift * np.diag(d)), shift
+            except np.linalg.LinAlgError:
+                shift = 1e-3 if shift == 0 else 2 * shift
+                if shift > 1e3:
+                    raise ValueError("No se pudo calcular la factorización de Cholesky incompleta.")
+
+    lower = sp.tril(A, format='csr')
+    lower.sort_indices()
+    indptr, indices, data = lower.indptr.tolist(), lower.indices.tolist(), lower.data.tolist()
+    while True:
+        values = _ic0(indptr, indices, data, A.shape[0], shift)
+        if values is not None:
+            break
+        shift = 1e-3 if shift == 0 else 2 * shift
+        if shift > 1e3:
+            raise ValueError("No se pudo calcular la factorización de Cholesky incompleta.")
+    L = sp.csr_matrix((np.array(values), lower.indices, lower.indptr), shape=A.shape)
+    return L, shift
+
+
+def effective_preconditioner(A, kind):
+    """
+    Precondicionador que de verdad se puede usar con A: con un operador sin
+    diagonal() (p. ej. un LinearOperator de scipy) Jacobi no es posible y se
+    pasa a 'none'. Devuelve (tipo, nota para el reporte o None).
+    """
+    kind = str(kind).strip().lower()
+    if kind == "jacobi" and is_operator(A) and not hasattr(A, "diagonal"):
+        return "none", "el operador no tiene diagonal(): se resolvió sin precondicionador en lugar de Jacobi"
+    return kind, None
+
+
+def build_preconditioner(A, kind="jacobi", omega=1.0, allowed=None):
+    """
+    Devuelve apply(r) = M⁻¹·r para el precondicionador indicado:
+        'none'         : M = I.
+        'jacobi'       : M = D.
+        'gauss_seidel' : M = D + L; un barrido hacia adelante.
+        'sor'          : M = D/ω + L; un barrido de SOR con factor ω.
+        'ssor'         : M = ω/(2-ω) · (D/ω + L) (D/ω)⁻¹ (D/ω + U); barrido
+                         hacia adelante y hacia atrás (simétrico si A lo es).
+        'ic'           : M = L·Lᵀ con L de incomplete_cholesky(A).
+    'allowed' limita los tipos válidos (CG necesita M simétrica definida
+    positiva). Con un operador sin matriz solo se admiten 'none' y, si el
+    operador ofrece diagonal(), 'jacobi'.
+    """
+    kind = str(kind).strip().lower()
+    valid = tuple(PRECONDITIONER_NAMES) if allowed is None else tuple(allowed)
+    if kind not in valid:
+        raise ValueError(f"Precondicionador desconocido: '{kind}'. Use {', '.join(valid)}.")
+    if kind == "none":
+        return lambda r: r
+
+    if is_operator(A):
+        if kind == "jacobi" and hasattr(A, "diagonal"):
+            d = np.asarray(A.diagonal(), dtype=np.float64)
+            check_diagonal(d, "El precondicionador de Jacobi")
+            return lambda r: r / d
+        raise ValueError(f"El precondicionador '{kind}' necesita la matriz A explícita (densa o dispersa).")
+
+    A = prepare_matrix(A)
+    d = get_diagonal(A)
+    if kind == "ic":
+        L, _ = incomplete_cholesky(A)
+        solve_lower = lower_triangular_solver(L)
+        solve_upper = upper_triangular_solver(L.T)
+        return lambda r: solve_upper(solve_lower(r))
+
+    check_diagonal(d, f"El precondicionador {PRECONDITIONER_NAMES[kind]}")
+    if kind == "jacobi":
+        return lambda r: r / d
+
+    if kind == "gauss_seidel":
+        omega = 1.0
+    solve_lower = lower_triangular_solver(with_diagonal(strict_lower(A), d / omega))
+    if kind in ("gauss_seidel", "sor"):
+        return solve_lower
+
+    solve_upper = upper_triangular_solver(with_diagonal(strict_upper(A), d / omega))
+    scale = (2.0 - omega) / omega
+    return lambda r: scale * solve_upper((d / omega) * solve_lower(r))
+
+
+SIDES = ("left", "right")
+
+
+def precondition_system(matvec, apply_m, b, side="right"):
+    """
+    Aplica M a izquierda o derecha del sistema A·x = b:
+        'left'  : M⁻¹A·x = M⁻¹b; el residuo que ve el método es M⁻¹(b - A·x).
+        'right' : A·M⁻¹·u = b con x = M⁻¹u; el residuo es el verdadero b - A·x.
+    Devuelve (op, apply_right, rhs): el método aplica op a sus vectores y
+    pasa cada dirección por apply_right antes de sumarla a x.
+    """
+    side = str(side).strip().lower()
+    if side not in SIDES:
+        raise ValueError(f"Lado de precondicionamiento desconocido: '{side}'. Use {', '.join(SIDES)}.")
+    if side == "left":
+        return (lambda v: apply_m(matvec(v))), (lambda v: v), apply_m(b)
+    return (lambda v: matvec(apply_m(v))), apply_m, b
@@ -1,4 +1,10 @@
 import numpy as np
+try:
+    from Python.criterios import ALL_ERRORS, MultiCriterionRun, step_error
+    from Python.tareas import report_progress
+except Exception:
+    from criterios import ALL_ERRORS, MultiCriterionRun, step_error
+    from tareas import report_progress
 
 def fixed_point_iteration(
     f,
@@ -17,7 +23,9 @@ def fixed_point_iteration(
     x0            : valor inicial.
     tolerance     : tolerancia.
     max_iterations: máximo de iteraciones.
-    error_type    : 'abs', 'rel' o 'cond'.
+    error_type    : 'abs', 'rel' o 'cond'. Con 'all' se calculan los tres criterios
+                    en una sola corrida y se devuelve un dict
+                    {tipo: (x*, g(x*), iteraciones, tabla)}.
     show_report, eval_grid, auto_compare: ignorados (compatibilidad).
 
     Devuelve:
@@ -29,6 +37,7 @@ def fixed_point_iteration(
 
     x_current = float(x0)
     iteration_data = []
+    multi = MultiCriterionRun(tolerance) if error_type == ALL_ERRORS else None
 
     for k in range(int(max_iterations)):
         g_current = f(x_current)   # aquí f es realmente g(x)
@@ -42,22 +51,18 @@ def fixed_point_iteration(
 
         x_next = g_current
 
-        # Cálculo del error según el tipo
-        if error_type == "abs":
-            error = abs(x_next - x_current)
-        elif error_type == "rel":
-            if x_next != 0:
-                error = abs((x_next - x_current) / x_next)
-            else:
-                error = abs(x_next - x_current)
-        elif error_type == "cond":
-            error = abs(x_next - x_current)  # por ejemplo, residuo de x = g(x)
-        else:
-            error = abs(x_next - x_current)
+        # Cálculo del error según el tipo ('cond' usa el residuo de x = g(x))
+        error = step_error(error_type, x_next - x_current, x_next, x_next - x_current)
 
         iteration_data.append([k, x_current, g_current, error])
+        report_progress(k, error)
 
-        if error < tolerance:
+        if multi is not None:
+            multi.record(x_next - x_current, x_next, x_next - x_current, root=x_next)
+            if multi.done():
+                x_current = x_next
+                break
+        elif error < tolerance:
             x_current = x_next
             break
 
@@ -67,4 +72,7 @@ def fixed_point_iteration(
     g_root = f(root)
     iterations = len(iteration_data)
 
+    if multi is not None:
+        return multi.results(iteration_data, 3, root, g_root, f)
+
     return root, g_root, iterations, iteration_data
\ No newline at end of file
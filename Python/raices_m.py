@@ -1,4 +1,10 @@
 import numpy as np
+try:
+    from Python.criterios import ALL_ERRORS, MultiCriterionRun, step_error
+    from Python.tareas import report_progress
+except Exception:
+    from criterios import ALL_ERRORS, MultiCriterionRun, step_error
+    from tareas import report_progress
 
 def multiple_roots(
     f,
@@ -14,11 +20,15 @@ def multiple_roots(
     Método de raíces múltiples compatible con la GUI.
 
     Parámetros:
-        f             : función f(x) con raíz múltiple.
+        f             : función f(x) con raíz múltiple. Si ofrece f.derivatives(x)
+                        se usan f'(x) y f''(x) exactas (dif. automática).
         x0            : valor inicial.
         tolerance     : tolerancia.
         max_iterations: máximo de iteraciones.
-        error_type    : 'abs', 'rel' o 'cond'.
+        error_type    : 'abs', 'rel' o 'cond'. Con 'all' se calculan los tres
+                        criterios en una sola corrida y se devuelve un dict
+                        {tipo: (raiz, f(raiz), iteraciones, tabla)} con la salida
+                        que habría dado cada criterio.
         show_report, eval_grid, auto_compare: ignorados (compatibilidad).
 
     Devuelve:
@@ -38,13 +48,21 @@ def multiple_roots(
         h = 1e-4
         return (f(x + h) - 2.0 * f(x) + f(x - h)) / (h ** 2)
 
+    # La función compilada por la GUI devuelve f, f' y f'' en una sola pasada,
+    # sin el error de truncamiento de las diferencias finitas
+    derivatives = getattr(f, "derivatives", None)
+
     x_current = float(x0)
     iteration_data = []
+    multi = MultiCriterionRun(tolerance) if error_type == ALL_ERRORS else None
 
     for k in range(int(max_iterations)):
-        f_val = f(x_current)
-        df_val = df(x_current)
-        d2f_val = d2f(x_current)
+        if derivatives is not None:
+            f_val, df_val, d2f_val = derivatives(x_current)
+        else:
+            f_val = f(x_current)
+            df_val = df(x_current)
+            d2f_val = d2f(x_current)
 
         # Denominador de la fórmula de raíces múltiples:
         # x_{n+1} = x_n - f f' / ( (f')^2 - f f'' )
@@ -53,29 +71,26 @@ def multiple_roots(
             # Guardamos fila con error infinito y salimos
             error = float("inf")
             iteration_data.append([k, x_current, f_val, df_val, d2f_val, error])
+            if multi is not None:
+                multi.record_failure()
             break
 
         x_next = x_current - f_val * df_val / denom
 
-        # Cálculo del error según el tipo
-        if error_type == "abs":
-            error = abs(x_next - x_current)
-        elif error_type == "rel":
-            if x_next != 0:
-                error = abs((x_next - x_current) / x_next)
-            else:
-                error = abs(x_next - x_current)
-        elif error_type == "cond":
-            # por ejemplo, residuo |f(x_n)|
-            error = abs(f_val)
-        else:
-            error = abs(x_next - x_current)
+        # Cálculo del error según el tipo ('cond' usa el residuo |f(x_n)|)
+        error = step_error(error_type, x_next - x_current, x_next, f_val)
 
         # Fila con el formato que espera la GUI:
         # [iter, x_n, f(x_n), f'(x_n), f''(x_n), error]
         iteration_data.append([k, x_current, f_val, df_val, d2f_val, error])
-
-        if error < tolerance:
+        report_progress(k, error)
+
+        if multi is not None:
+            multi.record(x_next - x_current, x_next, f_val, root=x_next)
+            if multi.done():
+                x_current = x_next
+                break
+        elif error < tolerance:
             x_current = x_next
             break
 
@@ -85,4 +100,7 @@ def multiple_roots(
     f_root = f(root)
     iterations = len(iteration_data)
 
+    if multi is not None:
+        return multi.results(iteration_data, 5, root, f_root, f)
+
     return root, f_root, iterations, iteration_data
@@ -0,0 +1,244 @@
+import numpy as np
+import ast
+try:
+    from Python.directos import PIVOTING_NAMES, PivotedLDLFactorization, SymmetricFactorization, direct_factor
+    from Python.gauss_seidel import gauss_seidel_kernel, gauss_seidel_splitting
+    from Python.jacobi import jacobi_kernel, jacobi_splitting
+    from Python.matrices import is_operator, is_sparse, prepare_matrix
+    from Python.trazas import IterationTrace, progress_recorder, residual_summary
+except Exception:
+    from directos import PIVOTING_NAMES, PivotedLDLFactorization, SymmetricFactorization, direct_factor
+    from gauss_seidel import gauss_seidel_kernel, gauss_seidel_splitting
+    from jacobi import jacobi_kernel, jacobi_splitting
+    from matrices import is_operator, is_sparse, prepare_matrix
+    from trazas import IterationTrace, progress_recorder, residual_summary
+
+# Refinamiento iterativo en precisión mixta: la parte cara (factorizar A o
+# iterar con Jacobi / Gauss-Seidel) se hace en float32, con la mitad de
+# memoria y de tráfico, y el residuo r = b - A·x y la actualización de x en
+# float64. Cada corrección gana unos 7 dígitos (los de float32) mientras
+# cond(A)·2⁻²⁴ < 1, hasta llegar a la precisión de float64:
+#
+#   r_k = b - A·x_k                  (float64)
+#   A·d_k = r_k                      (float32: factor o iteraciones)
+#   x_{k+1} = x_k + d_k              (float64)
+
+SOLVERS = ("direct", "jacobi", "gauss_seidel")
+
+SOLVER_NAMES = {
+    "direct": "factorización directa",
+    "jacobi": "Jacobi",
+    "gauss_seidel": "Gauss-Seidel",
+}
+
+LOW_PRECISION = np.float32
+HIGH_PRECISION = np.float64
+
+
+def str_to_numpy_matrix(matrix_str):
+    """
+    Convierte una cadena de texto que representa una matriz o vector en un objeto numpy array.
+    """
+    try:
+        matrix_list = ast.literal_eval(matrix_str)
+        matrix_np = np.array(matrix_list, dtype=np.float64)
+        return matrix_np
+    except Exception as e:
+        raise ValueError(f"Error al convertir cadena a matriz numpy: {e}")
+
+
+def _stored_nbytes(M):
+    """Bytes de una matriz densa o CSR (datos e índices)."""
+    if is_sparse(M):
+        return M.data.nbytes + M.indices.nbytes + M.indptr.nbytes
+    return np.asarray(M).nbytes
+
+
+class LowPrecisionSolver:
+    """
+    Resuelve A·d = r en float32 con el método elegido; la copia float32 de A
+    (y su factor o su partición) se arma una sola vez.
+
+        solver           : 'direct' (Cholesky / LDLᵀ pivoteada / LU de directos.py),
+                           'jacobi' o 'gauss_seidel' (sus núcleos en float32).
+        pivoting         : pivoteo de LU si A no es simétrica.
+        inner_tolerance  : tolerancia de cada resolución iterativa; basta
+                           con unos pocos dígitos, el refinamiento hace el resto.
+        inner_iterations : máximo de iteraciones por resolución iterativa.
+
+    Lleva la cuenta de las resoluciones y de las iteraciones internas.
+    """
+
+    def __init__(self, matrix_a, solver="direct", pivoting="partial", inner_tolerance=1e-4, inner_iterations=100):
+        solver = str(solver).strip().lower()
+        if solver not in SOLVERS:
+            raise ValueError(f"Método de corrección desconocido: '{solver}'. Use {', '.join(SOLVERS)}.")
+        if is_operator(matrix_a):
+            raise ValueError("El refinamiento en precisión mixta necesita A explícita para copiarla a float32.")
+        A = prepare_matrix(matrix_a, LOW_PRECISION)
+        if not np.all(np.isfinite(A.data if is_sparse(A) else A)):
+            raise ValueError("A tiene entradas fuera del rango de float32 (|a_ij| > 3.4e38); use float64.")
+
+        self.solver = solver
+        self.A = A
+        self.inner_tolerance = float(inner_tolerance)
+        self.inner_iterations = int(inner_iterations)
+        self.solves = 0
+        self.inner_count = 0
+        self.reused = False
+        if solver == "direct":
+            self.factors, self.reused = direct_factor(A, pivoting)
+        elif solver == "jacobi":
+            self.splitting = jacobi_splitting(A, LOW_PRECISION)
+        else:
+            self.splitting = gauss_seidel_splitting(A, LOW_PRECISION)
+
+    def describe(self):
+        """Nombre del método de corrección (con el tipo de factorización si es directo)."""
+        if self.solver != "direct":
+            return f"{SOLVER_NAMES[self.solver]} (hasta {self.inner_iterations} iteraciones, Tol = {self.inner_tolerance:g})"
+        if isinstance(self.factors, SymmetricFactorization):
+            return "Cholesky"
+        if isinstance(self.factors, PivotedLDLFactorization):
+            return "LDLᵀ con pivoteo de Bunch-Kaufman"
+        return f"LU con {PIVOTING_NAMES[self.factors.pivoting]}"
+
+    def nbytes(self):
+        """Memoria de la copia float32 de A y de su factor o partición."""
+        A = self.A
+        total = _stored_nbytes(A)
+        if self.solver == "jacobi":
+            inverse_diagonal, R = self.splitting
+            return total + inverse_diagonal.nbytes + _stored_nbytes(R)
+        if self.solver == "gauss_seidel":
+            _, U = self.splitting
+            # solve_lower guarda D + L: densa, otra matriz n x n; dispersa, las
+            # nnz(A) - nnz(U) entradas restantes (la factoriza SuperLU sin relleno)
+            if not is_sparse(A):
+                return total + A.nbytes + U.nbytes
+            lower = (A.nnz - U.nnz) * (A.data.itemsize + A.indices.itemsize) + A.indptr.nbytes
+            return total + lower + _stored_nbytes(U)
+        if isinstance(self.factors, SymmetricFactorization):
+            return total + self.factors.packed.nbytes
+        if isinstance(self.factors, PivotedLDLFactorization):
+            return total + self.factors.lower.nbytes + self.factors.blocks.nbytes
+        return total + self.factors.lu.nbytes
+
+    def __call__(self, r):
+        r = np.asarray(r, dtype=LOW_PRECISION)
+        self.solves += 1
+        if self.solver == "direct":
+            return self.factors.solve(r)
+        kernel = jacobi_kernel if self.solver == "jacobi" else gauss_seidel_kernel
+        d, iterations, _, _ = kernel(
+            self.A, r, np.zeros_like(r), self.inner_tolerance, self.inner_iterations,
+            splitting=self.splitting, dtype=LOW_PRECISION
+        )
+        self.inner_count += int(iterations)
+        return d
+
+
+def refinement_kernel(matrix_a, vector_b, initial_guess, tolerance, max_iterations, error_type='rel', solver="direct", pivoting="partial", on_iteration=None, correction=None):
+    """
+    Refinamiento iterativo en precisión mixta.
+
+        solver       : 'direct', 'jacobi' o 'gauss_seidel' (ver LowPrecisionSolver).
+        on_iteration : opcional, on_iteration(k, x, abs_err, rel_err) tras cada corrección.
+        correction   : opcional, LowPrecisionSolver(A, ...) ya armado.
+
+    El residuo se escala por su máximo antes de pasarlo a float32, para que
+    sus entradas pequeñas no se pierdan por debajo del rango de float32.
+    Como en multigrid, el error es el residuo en float64: abs_err = ||b - A·x_k||,
+    rel_err = abs_err / ||b||. Si una corrección no reduce el residuo (se
+    llegó al límite de float64, o cond(A) es demasiado grande para float32),
+    se descarta y el refinamiento termina.
+
+    Devuelve (x, iteraciones, abs_err, rel_err) de la última corrección aceptada.
+    """
+    A = prepare_matrix(matrix_a)
+    if correction is None:
+        correction = LowPrecisionSolver(A, solver, pivoting)
+
+    b = np.asarray(vector_b, dtype=HIGH_PRECISION)
+    x = np.array(initial_guess, dtype=HIGH_PRECISION)
+    norm_b = np.linalg.norm(b)
+    residual = b - A @ x
+    absolute_error = float(np.linalg.norm(residual))
+    relative_error = absolute_error / norm_b if norm_b != 0 else float('inf')
+    iterations = 0
+
+    for iteration_count in range(max_iterations):
+        if absolute_error == 0:
+            break
+        scale = np.max(np.abs(residual))
+        x_new = x + correction(residual / scale).astype(HIGH_PRECISION) * scale
+        residual_new = b - A @ x_new
+        error_new = float(np.linalg.norm(residual_new))
+        if not error_new < absolute_error:
+            break
+
+        x, residual, absolute_error = x_new, residual_new, error_new
+        relative_error = float(absolute_error / norm_b) if norm_b != 0 else float('inf')
+        iterations = iteration_count + 1
+
+        if on_iteration is not None:
+            on_iteration(iteration_count, x, absolute_error, relative_error)
+
+        error = relative_error if error_type == 'rel' else absolute_error
+        if error < tolerance:
+            break
+
+    return x, iterations, absolute_error, relative_error
+
+
+def refinement_method(A, b, x0, tolerance, max_iterations, solver="direct", error_type='rel', trace='full'):
+    """
+    Refinamiento en precisión mixta compatible con la GUI. Devuelve
+    (summary_text, results_matrix), con filas [k, x_k, residuo, residuo
+    relativo] (una por corrección), y la precisión usada en cada fase.
+    trace: qué iteraciones guardar ('full', 'errors', 'every:k' o 'last:N').
+    """
+    matrix_a = A if isinstance(A, np.ndarray) or is_sparse(A) else str_to_numpy_matrix(A)
+    vector_b = b if isinstance(b, np.ndarray) else str_to_numpy_matrix(b)
+    initial_guess = x0 if isinstance(x0, np.ndarray) else str_to_numpy_matrix(x0)
+    history = IterationTrace(trace, max_iterations)
+    record = progress_recorder(history, error_type)
+
+    matrix_a = prepare_matrix(matrix_a)
+    correction = LowPrecisionSolver(matrix_a, solver)
+    kernel_et = 'rel' if error_type in ("rel", "rela") else 'abs'
+    _, iterations, absolute_error, relative_error = refinement_kernel(
+        matrix_a, vector_b, initial_guess, tolerance, max_iterations,
+        error_type=kernel_et, on_iteration=record, correction=correction
+    )
+
+    residual_lines, converged = residual_summary(absolute_error, relative_error, iterations, tolerance, kernel_et, unit="correcciones")
+    phase = "factorización y sustituciones" if correction.solver == "direct" else "iteraciones de la corrección"
+    summary = (
+        f"Corrección A·d = r: {correction.describe()}"
+        + (" (factor reutilizado de la caché)" if correction.reused else ""),
+        f"Precisión por fase: {phase} en {np.dtype(LOW_PRECISION).name}; "
+        f"residuo r = b - A·x y actualización x + d en {np.dtype(HIGH_PRECISION).name}",
+        f"Memoria en {np.dtype(LOW_PRECISION).name} (A y factor/partición): {correction.nbytes() / 2**10:,.1f} KB "
+        f"(el doble en {np.dtype(HIGH_PRECISION).name})",
+    )
+    if correction.solver != "direct":
+        summary += (f"Iteraciones internas en {np.dtype(LOW_PRECISION).name}: {correction.inner_count} en {correction.solves} correcciones",)
+    summary += residual_lines
+    if not converged and iterations < max_iterations:
+        summary += ("El residuo dejó de bajar: límite de float64 o A demasiado mal condicionada para float32.",)
+    summary_text = "\n".join(summary)
+    return (summary_text, history.rows())
+
+
+if __name__ == '__main__':
+    # modo consola: pedir entradas y mostrar la solución
+    matrix_a_str = input("Ingresa la matriz A (e.g., [[4,1],[1,3]]): ")
+    vector_b_str = input("Ingresa el vector b (e.g., [1,2]): ")
+    x0_str = input("Ingresa el vector inicial x0 (e.g., [0,0]): ")
+    solver = input(f"Ingresa el método de corrección ({', '.join(SOLVERS)}): ").strip() or 'direct'
+
+    summary, table = refinement_method(matrix_a_str, vector_b_str, x0_str, 1e-12, 20, solver)
+    print(summary)
+    for row in table:
+        print(row)
@@ -1,4 +1,13 @@
 import numpy as np
+try:
+    from Python.criterios import ALL_ERRORS, MultiCriterionRun, step_error
+    from Python.tareas import report_progress
+except Exception:
+    from criterios import ALL_ERRORS, MultiCriterionRun, step_error
+    from tareas import report_progress
+
+# Variantes disponibles de la regla falsa
+VARIANTS = ("clasica", "illinois", "anderson_bjorck")
 
 def false_position_method(
     f,
@@ -9,27 +18,42 @@ def false_position_method(
     error_type="rel",    # 'abs', 'rel' o 'cond'
     show_report=True,
     eval_grid=500,
-    auto_compare=False
+    auto_compare=False,
+    variant="clasica"    # 'clasica', 'illinois' o 'anderson_bjorck'
 ):
     """
     Método de Regla Falsa (posición falsa) compatible con la GUI.
 
+    La fórmula clásica deja un extremo fijo en funciones convexas o cóncavas
+    y la convergencia se vuelve lineal. Las variantes 'illinois' y
+    'anderson_bjorck' escalan el valor de f del extremo que se repite dos
+    veces seguidas (por 1/2, o por 1 - f(xr)/f(extremo reemplazado)), lo
+    que recupera convergencia superlineal.
+
     Parámetros:
         f             : función f(x) ya construida por la interfaz.
         lower_bound   : límite inferior (a).
         upper_bound   : límite superior (b).
         tolerance     : tolerancia deseada.
         max_iterations: máximo de iteraciones.
-        error_type    : 'abs', 'rel' o 'cond'.
+        error_type    : 'abs', 'rel' o 'cond'. Con 'all' se calculan los tres
+                        criterios en una sola corrida y se devuelve un dict
+                        {tipo: (raiz, f(raiz), iteraciones, tabla)} con la salida
+                        que habría dado cada criterio.
         show_report, eval_grid, auto_compare: ignorados (para compatibilidad).
+        variant       : 'clasica', 'illinois' o 'anderson_bjorck'.
 
     Devuelve:
         (raiz, f(raiz), iteraciones, tabla)
 
     Tabla (por fila):
         [Iter, A, F(A), B, F(B), Xr, F(Xr), Error]
+        (F(A) y F(B) son los valores reales de f, sin el escalamiento).
     """
 
+    if variant not in VARIANTS:
+        raise ValueError(f"Variante de regla falsa desconocida: '{variant}'. Use {', '.join(VARIANTS)}.")
+
     a = float(lower_bound)
     b = float(upper_bound)
 
@@ -42,18 +66,26 @@ def false_position_method(
     iteration_data = []
     xr_prev = None
 
+    # Valores de f usados en la fórmula (escalados en las variantes) y
+    # extremo que se conservó en el paso anterior (+1: b, -1: a)
+    w_a, w_b = f_a, f_b
+    kept = 0
+    multi = MultiCriterionRun(tolerance) if error_type == ALL_ERRORS else None
+
     for k in range(int(max_iterations)):
-        # Fórmula clásica de posición falsa
-        denom = (f_b - f_a)
+        # Fórmula de posición falsa (con los valores escalados si aplica)
+        denom = (w_b - w_a)
         if denom == 0:
             # Guardamos una fila con error infinito y salimos
             xr = (a + b) / 2.0
             f_xr = f(xr)
             error = float("inf")
             iteration_data.append([k, a, f_a, b, f_b, xr, f_xr, error])
+            if multi is not None:
+                multi.record_failure()
             break
 
-        xr = b - f_b * (b - a) / denom
+        xr = b - w_b * (b - a) / denom
         f_xr = f(xr)
 
         # Cálculo del error según el tipo
@@ -63,34 +95,38 @@ def false_position_method(
         else:
             base_err = abs(xr - xr_prev)
 
-        if error_type == "abs":
-            error = base_err
-        elif error_type == "rel":
-            if xr != 0:
-                error = abs(base_err / xr)
-            else:
-                error = base_err
-        elif error_type == "cond":
-            # por ejemplo, residuo |f(xr)|
-            error = abs(f_xr)
-        else:
-            error = base_err
+        # 'cond' usa el residuo |f(xr)|
+        error = step_error(error_type, base_err, xr, f_xr)
 
         # Guardar fila en el formato que espera la GUI:
         # [Iter, A, F(A), B, F(B), Xr, F(Xr), Error]
         iteration_data.append([k, a, f_a, b, f_b, xr, f_xr, error])
+        report_progress(k, error)
 
         # Condición de parada
-        if error < tolerance:
+        if multi is not None:
+            multi.record(base_err, xr, f_xr, root=xr, f_root=f_xr)
+            if multi.done():
+                break
+        elif error < tolerance:
             break
 
         # Actualizar intervalo preservando el cambio de signo
         if f_a * f_xr < 0:
+            m = _scale_factor(variant, f_xr, f_b)
             b = xr
-            f_b = f_xr
+            f_b = w_b = f_xr
+            if kept == -1:
+                # a se conserva por segunda vez seguida
+                w_a *= m
+            kept = -1
         else:
+            m = _scale_factor(variant, f_xr, f_a)
             a = xr
-            f_a = f_xr
+            f_a = w_a = f_xr
+            if kept == 1:
+                w_b *= m
+            kept = 1
 
         xr_prev = xr
 
@@ -99,4 +135,54 @@ def false_position_method(
     f_root = f_xr
     iterations = len(iteration_data)
 
-    return root, f_root, iterations, iteration_data
\ No newline at end of file
+    if multi is not None:
+        return multi.results(iteration_data, 7, root, f_root, f)
+
+    return root, f_root, iterations, iteration_data
+
+def _scale_factor(variant, f_xr, f_replaced):
+    """Factor que escala al extremo conservado: 1 (clásica), 1/2 (Illinois) o Anderson–Björck."""
+    if variant == "illinois":
+        return 0.5
+    if variant == "anderson_bjorck":
+        m = 1.0 - f_xr / f_replaced if f_replaced != 0 else 0.0
+        return m if m > 0 else 0.5
+    return 1.0
+
+
+def illinois_method(
+    f,
+    lower_bound,
+    upper_bound,
+    tolerance,
+    max_iterations,
+    error_type="rel",
+    show_report=True,
+    eval_grid=500,
+    auto_compare=False
+):
+    """Regla falsa modificada de Illinois (ver false_position_method)."""
+    return false_position_method(
+        f, lower_bound, upper_bound, tolerance, max_iterations, error_type,
+        show_report=show_report, eval_grid=eval_grid, auto_compare=auto_compare,
+        variant="illinois"
+    )
+
+
+def anderson_bjorck_method(
+    f,
+    lower_bound,
+    upper_bound,
+    tolerance,
+    max_iterations,
+    error_type="rel",
+    show_report=True,
+    eval_grid=500,
+    auto_compare=False
+):
+    """Regla falsa modificada de Anderson–Björck (ver false_position_method)."""
+    return false_position_method(
+        f, lower_bound, upper_bound, tolerance, max_iterations, error_type,
+        show_report=show_report, eval_grid=eval_grid, auto_compare=auto_compare,
+        variant="anderson_bjorck"
+    )
@@ -1,3 +1,10 @@
+try:
+    from Python.criterios import ALL_ERRORS, MultiCriterionRun, step_error
+    from Python.tareas import report_progress
+except Exception:
+    from criterios import ALL_ERRORS, MultiCriterionRun, step_error
+    from tareas import report_progress
+
 def secante(
     f,
     x0,
@@ -17,7 +24,10 @@ def secante(
         x0, x1        : valores iniciales.
         tolerance     : tolerancia (float).
         max_iterations: máximo de iteraciones (int).
-        error_type    : 'abs', 'rel' o 'cond'.
+        error_type    : 'abs', 'rel' o 'cond'. Con 'all' se calculan los tres
+                        criterios en una sola corrida y se devuelve un dict
+                        {tipo: (raiz, f(raiz), iteraciones, tabla)} con la salida
+                        que habría dado cada criterio.
         show_report, eval_grid, auto_compare: ignorados, solo para compatibilidad.
 
     Devuelve:
@@ -35,6 +45,7 @@ def secante(
     f_curr = f(x_curr)
 
     iteration_data = []
+    multi = MultiCriterionRun(tolerance) if error_type == ALL_ERRORS else None
 
     for k in range(int(max_iterations)):
         # Evitar división por cero en la fórmula de la secante
@@ -43,30 +54,28 @@ def secante(
             # Guardamos fila con error infinito y salimos
             error = float("inf")
             iteration_data.append([k, x_prev, x_curr, f_curr, error])
+            if multi is not None:
+                multi.record_failure()
             break
 
         x_next = x_curr - f_curr * (x_curr - x_prev) / denom
         f_next = f(x_next)
 
-        # Cálculo del error según el tipo
-        if error_type == "abs":
-            error = abs(x_next - x_curr)
-        elif error_type == "rel":
-            if x_next != 0:
-                error = abs((x_next - x_curr) / x_next)
-            else:
-                error = abs(x_next - x_curr)
-        elif error_type == "cond":
-            # Por ejemplo, basándonos en el residuo |f(x_i)|
-            error = abs(f_curr)
-        else:
-            error = abs(x_next - x_curr)
+        # Cálculo del error según el tipo ('cond' usa el residuo |f(x_i)|)
+        error = step_error(error_type, x_next - x_curr, x_next, f_curr)
 
         # Fila con formato esperado por la GUI:
         # [iter, x_{i-1}, x_i, f(x_i), error]
         iteration_data.append([k, x_prev, x_curr, f_curr, error])
+        report_progress(k, error)
 
-        if error < tolerance:
+        if multi is not None:
+            multi.record(x_next - x_curr, x_next, f_curr, root=x_next)
+            if multi.done():
+                x_curr = x_next
+                f_curr = f_next
+                break
+        elif error < tolerance:
             x_curr = x_next
             f_curr = f_next
             break
@@ -79,4 +88,7 @@ def secante(
     f_root = f(root)
     iterations = len(iteration_data)
 
+    if multi is not None:
+        return multi.results(iteration_data, 4, root, f_root, f)
+
     return root, f_root, iterations, iteration_data
@@ -3,9 +3,16 @@ import ast
 import time
 import matplotlib.pyplot as plt
 try:
-    from Python.gui_helpers import compute_spectral_radius
+    from Python.gui_helpers import add_pcg_report, compute_spectral_radius
+    from Python.SOR import sor_kernel
+    from Python.matrices import is_sparse
 except Exception:
-    from gui_helpers import compute_spectral_radius
+    from gui_helpers import add_pcg_report, compute_spectral_radius
+    from SOR import sor_kernel
+    from matrices import is_sparse
+
+# ω de referencia con el que los informes de Jacobi y Gauss-Seidel incluyen a SOR
+REPORT_OMEGA = 1.25
 
 def safe_divide(a, b):
     if b == 0:
@@ -25,64 +32,36 @@ def str_to_numpy_matrix(matrix_str):
         return None
 
 def _compute_once(A_local, b_local, x0_local, w_local, tol, max_it, err_type):
-    A_n = A_local.copy()
-    b_n = b_local.copy()
-    x = x0_local.copy()
     rows = []
     start = time.perf_counter()
-    for k in range(max_it):
-        x_prev = x.copy()
-        for i in range(A_n.shape[0]):
-            sigma = 0
-            for j in range(A_n.shape[1]):
-                if i != j:
-                    sigma += A_n[i, j] * x[j]
-            x[i] = (1 - w_local) * x_prev[i] + (w_local / A_n[i, i]) * (b_n[i] - sigma)
-        abs_err = np.linalg.norm(x - x_prev)
-        rel_err = abs_err / np.linalg.norm(x) if np.linalg.norm(x) != 0 else float('inf')
-        rows.append([k, x.copy().tolist(), float(abs_err), float(rel_err)])
-        err = rel_err if err_type == 'rel' else abs_err
-        if err < tol:
-            break
+
+    def record(k, x, abs_err, rel_err):
+        rows.append([k, x.tolist(), abs_err, rel_err])
+
+    sor_kernel(A_local, b_local, x0_local, w_local, tol, max_it, error_type=err_type, on_iteration=record)
     end = time.perf_counter()
     metrics = {'iterations': len(rows), 'abs_error': float(rows[-1][2]) if rows else None, 'rel_error': float(rows[-1][3]) if rows else None, 'time': end - start}
     return rows, metrics
 
 def sor_method(A, b, x0, w, tolerance, max_iterations, error_type='rel', show_report=False, auto_compare=True):
-    matrix_a = A if isinstance(A, np.ndarray) else str_to_numpy_matrix(A)
+    matrix_a = A if isinstance(A, np.ndarray) or is_sparse(A) else str_to_numpy_matrix(A)
     vector_b = b if isinstance(b, np.ndarray) else str_to_numpy_matrix(b)
     initial_guess = x0 if isinstance(x0, np.ndarray) else str_to_numpy_matrix(x0)
 
     results_matrix = []
-    solution_vector = initial_guess.copy()
-
-    for iteration_count in range(max_iterations):
-        previous_solution = solution_vector.copy()
-
-        for i in range(matrix_a.shape[0]):
-            sigma = 0
-            for j in range(matrix_a.shape[1]):
-                if i != j:
-                    sigma += matrix_a[i, j] * solution_vector[j]
 
-            solution_vector[i] = (1 - w) * previous_solution[i] + (w / matrix_a[i, i]) * (vector_b[i] - sigma)
+    def record(iteration_count, solution_vector, absolute_error, relative_error):
+        results_matrix.append([iteration_count, solution_vector.tolist(), absolute_error, relative_error])
 
-        absolute_error = np.linalg.norm(solution_vector - previous_solution)
-        denom = np.linalg.norm(solution_vector)
-        relative_error = safe_divide(absolute_error, denom) if denom != 0 else float('inf')
-
-        if error_type == "rela":
-            error = relative_error
-        else:
-            error = absolute_error
-
-        results_matrix.append([iteration_count, solution_vector.tolist(), float(absolute_error), float(relative_error)])
-
-        if error < tolerance:
-            break
+    # error_type == "rela" usa el error relativo; cualquier otro valor, el absoluto
+    sor_kernel(
+        matrix_a, vector_b, initial_guess, w, tolerance, max_iterations,
+        error_type='rel' if error_type == "rela" else 'abs',
+        on_iteration=record
+    )
 
     # calcular radio espectral
-    rho, _ = compute_spectral_radius(matrix_a, method='sor', omega=w)
+    rho, _ = compute_spectral_radius(matrix_a, method='sor', omega=w, residual_history=[row[2] for row in results_matrix])
     can_conv = False if rho is None else (rho < 1)
     summary = (
         f"Radio espectral: {rho:.6f}" if rho is not None else "Radio espectral: Desconocido",
@@ -119,13 +98,16 @@ def sor_method(A, b, x0, w, tolerance, max_iterations, error_type='rel', show_re
                 rg, mg = sg._compute_once(matrix_a, vector_b, initial_guess, tolerance, max_iterations, et)
                 informe.setdefault('Gauss-Seidel', {})[et] = {'rows': rg, 'metrics': mg}
 
+        # PCG con precondicionador de Jacobi (se omite si falla)
+        add_pcg_report(informe, matrix_a, vector_b, initial_guess, tolerance, max_iterations, ets)
+
         resumen_best = {}
         for et in ets:
             best = None
             for method, data in informe.items():
                 if et not in data:
                     continue
-                m = data[et]
+                m = data[et]['metrics']
                 if best is None or m['iterations'] < best['iterations'] or (m['iterations'] == best['iterations'] and m['abs_error'] < best['abs_error']):
                     best = {'method': method, **m}
             resumen_best[et] = best
@@ -3,9 +3,13 @@ import ast
 import time
 import matplotlib.pyplot as plt
 try:
-    from Python.gui_helpers import compute_spectral_radius
+    from Python.gui_helpers import add_pcg_report, compute_spectral_radius
+    from Python.gauss_seidel import gauss_seidel_kernel
+    from Python.matrices import is_sparse
 except Exception:
-    from gui_helpers import compute_spectral_radius
+    from gui_helpers import add_pcg_report, compute_spectral_radius
+    from gauss_seidel import gauss_seidel_kernel
+    from matrices import is_sparse
 
 def safe_divide(a, b):
     if b == 0:
@@ -24,64 +28,41 @@ def str_to_numpy_matrix(matrix_str):
         raise ValueError(f"Error al convertir cadena a matriz numpy: {e}")
 
 def _compute_once(A_local, b_local, x0_local, tol, max_it, err_type):
-    A_n = A_local.copy()
-    b_n = b_local.copy()
-    x = x0_local.copy()
     rows = []
     start = time.perf_counter()
-    D = np.diag(np.diag(A_n))
-    LU = A_n - D
-    for k in range(max_it):
-        x_prev = x.copy()
-        for j in range(A_n.shape[0]):
-            x[j] = (b_n[j] - np.dot(LU[j, :], x)) / D[j, j]
-        abs_err = np.linalg.norm(x - x_prev)
-        rel_err = abs_err / np.linalg.norm(x) if np.linalg.norm(x) != 0 else float('inf')
-        rows.append([k, x.copy().tolist(), float(abs_err), float(rel_err)])
-        err = rel_err if err_type == 'rel' else abs_err
-        if err < tol:
-            break
+
+    def record(k, x, abs_err, rel_err):
+        rows.append([k, x.tolist(), abs_err, rel_err])
+
+    gauss_seidel_kernel(A_local, b_local, x0_local, tol, max_it, error_type=err_type, on_iteration=record)
     end = time.perf_counter()
     metrics = {'iterations': len(rows), 'abs_error': float(rows[-1][2]) if rows else None, 'rel_error': float(rows[-1][3]) if rows else None, 'time': end - start}
     return rows, metrics
 
 def gauss_seidel_method(A, b, x0, tolerance, max_iterations, error_type='rel', show_report=False, auto_compare=True):
-    matrix_a = A if isinstance(A, np.ndarray) else str_to_numpy_matrix(A)
+    matrix_a = A if isinstance(A, np.ndarray) or is_sparse(A) else str_to_numpy_matrix(A)
     vector_b = b if isinstance(b, np.ndarray) else str_to_numpy_matrix(b)
     initial_guess = x0 if isinstance(x0, np.ndarray) else str_to_numpy_matrix(x0)
     results_matrix = []
-
-    diagonal_matrix = np.diag(np.diag(matrix_a))
-    lu_matrix = matrix_a - diagonal_matrix
-    solution_vector = initial_guess
-
-    for iteration_count in range(max_iterations):
-        previous_solution = solution_vector.copy()
-        for j in range(matrix_a.shape[0]):
-            solution_vector[j] = safe_divide(
-                (vector_b[j] - np.dot(lu_matrix[j, :], solution_vector)),
-                diagonal_matrix[j, j]
-            )
-        solution_vector = np.round(solution_vector, decimals=5)
-        absolute_error = np.linalg.norm(solution_vector - previous_solution)
-
-        if np.linalg.norm(solution_vector) != 0:
-            relative_error = absolute_error / np.linalg.norm(solution_vector)
-        else:
-            relative_error = float('inf')
-
-
-        if error_type == "rela":
-            error = relative_error
-        else:
-            error = absolute_error
-        results_matrix.append([iteration_count,solution_vector.copy().tolist(),round(float(absolute_error), 6),round(float(relative_error), 6)])
-        if error < tolerance:
-            break
+    # la tabla redondea los errores; para estimar rho se guardan sin redondear
+    residuals = []
+
+    def record(iteration_count, solution_vector, absolute_error, relative_error):
+        results_matrix.append([iteration_count, solution_vector.tolist(), round(absolute_error, 6), round(relative_error, 6)])
+        residuals.append(absolute_error)
+
+    # error_type == "rela" usa el error relativo; cualquier otro valor, el absoluto.
+    # Como antes, la solución se redondea a 5 decimales en cada barrido.
+    gauss_seidel_kernel(
+        matrix_a, vector_b, initial_guess, tolerance, max_iterations,
+        error_type='rel' if error_type == "rela" else 'abs',
+        on_iteration=record,
+        decimals=5
+    )
 
 
     headers = ["Iteración", "Solución", "Error absoluto", "Error relativo"]
-    rho, _ = compute_spectral_radius(matrix_a, method='gauss_seidel')
+    rho, _ = compute_spectral_radius(matrix_a, method='gauss_seidel', residual_history=residuals)
     can_conv = False if rho is None else (rho < 1)
     summary = (
         f"Radio espectral: {rho:.6f}" if rho is not None else "Radio espectral: Desconocido",
@@ -115,16 +96,19 @@ def gauss_seidel_method(A, b, x0, tolerance, max_iterations, error_type='rel', s
 
         if ss is not None:
             for et in ets:
-                rs, ms = ss._compute_once(matrix_a, vector_b, initial_guess, tolerance, max_iterations, et)
+                rs, ms = ss._compute_once(matrix_a, vector_b, initial_guess, ss.REPORT_OMEGA, tolerance, max_iterations, et)
                 informe.setdefault('SOR', {})[et] = {'rows': rs, 'metrics': ms}
 
+        # PCG con precondicionador de Jacobi (se omite si falla)
+        add_pcg_report(informe, matrix_a, vector_b, initial_guess, tolerance, max_iterations, ets)
+
         resumen_best = {}
         for et in ets:
             best = None
             for method, data in informe.items():
                 if et not in data:
                     continue
-                m = data[et]
+                m = data[et]['metrics']
                 if best is None or m['iterations'] < best['iterations'] or (m['iterations'] == best['iterations'] and m['abs_error'] < best['abs_error']):
                     best = {'method': method, **m}
             resumen_best[et] = best
@@ -3,9 +3,13 @@ import ast
 import time
 import matplotlib.pyplot as plt
 try:
-    from Python.gui_helpers import compute_spectral_radius
+    from Python.gui_helpers import add_pcg_report, compute_spectral_radius
+    from Python.jacobi import jacobi_kernel
+    from Python.matrices import is_sparse
 except Exception:
-    from gui_helpers import compute_spectral_radius
+    from gui_helpers import add_pcg_report, compute_spectral_radius
+    from jacobi import jacobi_kernel
+    from matrices import is_sparse
 
 def str_to_numpy_matrix(matrix_str):
     """
@@ -22,22 +26,13 @@ def str_to_numpy_matrix(matrix_str):
     
 
 def _compute_once(A_local, b_local, x0_local, tol, max_it, err_type):
-    A_n = A_local.copy()
-    b_n = b_local.copy()
-    x = x0_local.copy()
     rows = []
     start = time.perf_counter()
-    D = np.diag(np.diag(A_n))
-    R = A_n - D
-    for k in range(max_it):
-        x_prev = x.copy()
-        x = np.dot(np.linalg.inv(D), -np.dot(R, x_prev)) + np.dot(np.linalg.inv(D), b_n)
-        abs_err = np.linalg.norm(x - x_prev)
-        rel_err = abs_err / np.linalg.norm(x) if np.linalg.norm(x) != 0 else float('inf')
-        rows.append([k, x.copy().tolist(), float(abs_err), float(rel_err)])
-        err = rel_err if err_type == 'rel' else abs_err
-        if err < tol:
-            break
+
+    def record(k, X, abs_err, rel_err):
+        rows.append([k, X[:, 0].tolist(), float(abs_err[0]), float(rel_err[0])])
+
+    jacobi_kernel(A_local, b_local, x0_local, tol, max_it, error_type=err_type, on_iteration=record)
     end = time.perf_counter()
     metrics = {'iterations': len(rows), 'abs_error': float(rows[-1][2]) if rows else None, 'rel_error': float(rows[-1][3]) if rows else None, 'time': end - start}
     return rows, metrics
@@ -45,34 +40,22 @@ def _compute_once(A_local, b_local, x0_local, tol, max_it, err_type):
 
 def jacobi(A, b, x0, tolerance, max_iterations, error_type='rel', show_report=False, auto_compare=True):
     # A, b, x0 pueden ser numpy arrays (desde GUI2) o strings (ejecución directa)
-    matrix_a = A if isinstance(A, np.ndarray) else str_to_numpy_matrix(A)
+    matrix_a = A if isinstance(A, np.ndarray) or is_sparse(A) else str_to_numpy_matrix(A)
     vector_b = b if isinstance(b, np.ndarray) else str_to_numpy_matrix(b)
     initial_guess = x0 if isinstance(x0, np.ndarray) else str_to_numpy_matrix(x0)
     results_matrix = []
-    diagonal_matrix = np.diag(np.diag(matrix_a))
-    lu_matrix = matrix_a - diagonal_matrix
-    solution_vector = initial_guess
-    
-    for iteration_count in range(max_iterations):
-        diagonal_inverse = np.linalg.inv(diagonal_matrix)
-        previous_solution = solution_vector
-        solution_vector = np.dot(diagonal_inverse, np.dot(-lu_matrix, solution_vector)) + np.dot(diagonal_inverse, vector_b)
-        absolute_error = np.linalg.norm(solution_vector - previous_solution)
-        
-        if np.linalg.norm(solution_vector) != 0:
-            relative_error = absolute_error / np.linalg.norm(solution_vector)
-        else:
+
+    def record(iteration_count, solution, absolute_error, relative_error):
+        results_matrix.append([iteration_count, solution[:, 0].tolist(), absolute_error[0], relative_error[0]])
+        if np.isinf(relative_error[0]):
             print("Error: División por 0")
-            relative_error = float('inf')
-        
-        results_matrix.append([iteration_count, solution_vector.copy().tolist(), absolute_error, relative_error]) 
-        if error_type=="rela":
-            error = relative_error
-        else:
-            error = absolute_error
-            
-        if error < tolerance:
-            break
+
+    # error_type == "rela" usa el error relativo; cualquier otro valor, el absoluto
+    jacobi_kernel(
+        matrix_a, vector_b, initial_guess, tolerance, max_iterations,
+        error_type='rel' if error_type == "rela" else 'abs',
+        on_iteration=record
+    )
 
     headers = ["Iteración", "Solución", "Error absoluto", "Error relativo"]
 
@@ -82,7 +65,7 @@ def jacobi(A, b, x0, tolerance, max_iterations, error_type='rel', show_report=Fa
     main_metrics = {'iterations': len(results_matrix), 'abs_error': float(results_matrix[-1][2]) if results_matrix else None, 'rel_error': float(results_matrix[-1][3]) if results_matrix else None}
 
     # Calcular radio espectral
-    rho, _ = compute_spectral_radius(matrix_a, method='jacobi')
+    rho, _ = compute_spectral_radius(matrix_a, method='jacobi', residual_history=[row[2] for row in results_matrix])
     can_conv = False if rho is None else (rho < 1)
     summary = (
         f"Radio espectral: {rho:.6f}" if rho is not None else "Radio espectral: Desconocido",
@@ -119,9 +102,12 @@ def jacobi(A, b, x0, tolerance, max_iterations, error_type='rel', show_report=Fa
 
         if ss is not None:
             for et in ets:
-                r_sor, m_sor = ss._compute_once(matrix_a, vector_b, initial_guess, tolerance, max_iterations, et)
+                r_sor, m_sor = ss._compute_once(matrix_a, vector_b, initial_guess, ss.REPORT_OMEGA, tolerance, max_iterations, et)
                 informe.setdefault('SOR', {})[et] = {'rows': r_sor, 'metrics': m_sor}
 
+        # PCG con precondicionador de Jacobi (se omite si falla)
+        add_pcg_report(informe, matrix_a, vector_b, initial_guess, tolerance, max_iterations, ets)
+
         # identificar mejor método por cada tipo de error (menor iteraciones, en caso de empate menor abs_error)
         resumen_best = {}
         for et in ets:
@@ -129,7 +115,7 @@ def jacobi(A, b, x0, tolerance, max_iterations, error_type='rel', show_report=Fa
             for method, data in informe.items():
                 if et not in data:
                     continue
-                m = data[et]
+                m = data[et]['metrics']
                 if best is None or m['iterations'] < best['iterations'] or (m['iterations'] == best['iterations'] and m['abs_error'] < best['abs_error']):
                     best = {'method': method, **m}
             resumen_best[et] = best
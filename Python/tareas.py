@@ -0,0 +1,123 @@
+import threading
+
+# Ejecución de los métodos en segundo plano para la GUI.
+# El método corre en un hilo de trabajo; en cada iteración llama a
+# report_progress(iteración, error), que deja el último avance para que la
+# GUI lo lea con after() y, si se pidió cancelar, detiene la corrida.
+# Fuera de una tarea, report_progress() no hace nada, así que los métodos
+# siguen funcionando igual desde consola.
+
+_local = threading.local()
+
+
+class JobCancelled(BaseException):
+    """
+    Se lanza dentro del método cuando el usuario cancela la tarea.
+    Hereda de BaseException para que los 'except Exception' de los métodos
+    no la absorban.
+    """
+
+
+def report_progress(iteration, error=None):
+    """
+    Punto de control de cada iteración: publica (iteración, error) y lanza
+    JobCancelled si la tarea actual fue cancelada.
+    """
+    job = getattr(_local, "job", None)
+    if job is None:
+        return
+    job.progress = (iteration, error)
+    if job.cancel_event.is_set():
+        raise JobCancelled()
+
+
+class Job:
+    """
+    Una ejecución de func(*args, **kwargs).
+
+    background=False la ejecuta en el hilo que llama a start() (lo usan los
+    métodos que dibujan con matplotlib, que debe correr en el hilo de Tk).
+    Al terminar, exactamente uno de result / error / cancelled queda definido.
+    """
+
+    def __init__(self, func, args=(), kwargs=None, background=True):
+        self.func = func
+        self.args = tuple(args)
+        self.kwargs = dict(kwargs or {})
+        self.background = background
+        self.progress = None
+        self.result = None
+        self.error = None
+        self.cancelled = False
+        self.cancel_event = threading.Event()
+        self._done = threading.Event()
+        self._thread = None
+
+    def _run(self):
+        _local.job = self
+        try:
+            self.result = self.func(*self.args, **self.kwargs)
+        except JobCancelled:
+            self.cancelled = True
+        except Exception as e:
+            self.error = e
+        finally:
+            _local.job = None
+            self._done.set()
+
+    def start(self):
+        if self.background:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        else:
+            self._run()
+        return self
+
+    def cancel(self):
+        """Pide la cancelación; el método se detiene en su próxima iteración."""
+        self.cancel_event.set()
+
+    def cancel_requested(self):
+        """
+        True si se pidió cancelar, aunque el método haya terminado antes de
+        llegar a otro report_progress(): su resultado ya no se debe mostrar.
+        """
+        return self.cancelled or self.cancel_event.is_set()
+
+    def done(self):
+        return self._done.is_set()
+
+
+def run_job(widget, job, on_done, on_progress=None, on_error=None, on_cancel=None, interval=100):
+    """
+    Inicia 'job' y lo sigue desde el hilo de Tk con widget.after(interval).
+
+    on_progress(iteración, error) se llama con el último avance publicado;
+    al terminar se llama on_done(resultado), on_error(excepción) u
+    on_cancel(), según corresponda; si se pidió cancelar, on_cancel() aunque
+    el método haya llegado a terminar. Devuelve el job (para cancelarlo).
+    """
+    last = [None]
+
+    def poll():
+        if on_progress is not None and job.progress is not None and job.progress is not last[0]:
+            last[0] = job.progress
+            on_progress(*job.progress)
+        if not job.done():
+            widget.after(interval, poll)
+            return
+        if job.cancel_requested():
+            if on_cancel is not None:
+                on_cancel()
+        elif job.error is not None:
+            if on_error is not None:
+                on_error(job.error)
+        else:
+            on_done(job.result)
+
+    job.start()
+    if job.background:
+        widget.after(interval, poll)
+    else:
+        poll()
+    return job
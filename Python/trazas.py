@@ -0,0 +1,215 @@
+import numpy as np
+try:
+    from Python.tareas import report_progress
+except Exception:
+    from tareas import report_progress
+
+# Registro de las iteraciones de los métodos de sistemas lineales.
+# Guardar x_k.tolist() en cada iteración cuesta O(n · iteraciones) floats de
+# Python (unos 8 GB con n = 10⁵ y 1000 iteraciones); IterationTrace guarda los
+# errores de todas las iteraciones en arreglos de NumPy y los iterados solo
+# según la política elegida:
+#
+#   'full'     : todos los iterados (arreglo preasignado de NumPy).
+#   'errors'   : solo los errores; la columna de la solución queda vacía.
+#   'every:k'  : uno de cada k iterados, más el último.
+#   'last:N'   : los últimos N iterados (búfer circular).
+
+TRACE_POLICIES = ("full", "errors", "every", "last")
+
+# Tope de memoria para preasignar los iterados de 'full'; si max_iterations
+# no cabe, el arreglo empieza con lo que cabe y duplica su tamaño al llenarse.
+PREALLOCATION_BYTES = 256 * 2**20
+
+
+def parse_trace_policy(policy):
+    """
+    Normaliza la política de registro a (nombre, parámetro).
+
+    Acepta 'full', 'errors', 'every:k' y 'last:N' (también 'every k' o
+    tuplas como ('last', 10)). Lanza ValueError si no la reconoce.
+    """
+    if policy is None:
+        return ("full", None)
+    if isinstance(policy, (tuple, list)):
+        name, value = (list(policy) + [None])[:2]
+    else:
+        text = str(policy).strip().lower().replace("=", ":").replace(" ", ":")
+        name, _, value = text.partition(":")
+    name = str(name).strip().lower()
+    if name not in TRACE_POLICIES:
+        raise ValueError(f"Política de registro desconocida: '{policy}'. Use full, errors, every:k o last:N.")
+    if name in ("full", "errors"):
+        return (name, None)
+    try:
+        value = int(value)
+    except Exception:
+        raise ValueError(f"La política '{name}' necesita un entero positivo, e.g. '{name}:10'.")
+    if value < 1:
+        raise ValueError(f"La política '{name}' necesita un entero positivo, e.g. '{name}:10'.")
+    return (name, value)
+
+
+class IterationTrace:
+    """
+    Registro de las iteraciones (k, x_k, error absoluto, error relativo).
+
+    record(k, x, abs_err, rel_err) es compatible con el callback on_iteration
+    de los núcleos. Los errores pueden ser escalares o vectores (Jacobi con
+    varias columnas en b); x puede ser un vector o una matriz.
+    """
+
+    def __init__(self, policy="full", max_iterations=None):
+        self.policy, self.parameter = parse_trace_policy(policy)
+        self.max_iterations = None if max_iterations is None else max(int(max_iterations), 1)
+        self.count = 0
+        self._iterations = None
+        self._abs = None
+        self._rel = None
+        self._iterates = None
+        self._iterate_rows = None
+        self._stored = 0
+        self._last_x = None
+
+    def __len__(self):
+        return self.count
+
+    def _capacity(self, row_bytes):
+        """Filas de iterados a preasignar según la política."""
+        if self.policy == "last":
+            return self.parameter
+        limit = self.max_iterations or 16
+        if self.policy == "every":
+            limit = -(-limit // self.parameter)
+        return int(max(1, min(limit, PREALLOCATION_BYTES // max(row_bytes, 1))))
+
+    @staticmethod
+    def _grow(array, size):
+        """Duplica la primera dimensión de 'array' hasta que quepan 'size' filas."""
+        if size <= array.shape[0]:
+            return array
+        bigger = np.empty((max(size, 2 * array.shape[0]),) + array.shape[1:], dtype=array.dtype)
+        bigger[:array.shape[0]] = array
+        return bigger
+
+    def record(self, k, x, absolute_error, relative_error):
+        x = np.asarray(x)
+        absolute_error = np.asarray(absolute_error, dtype=np.float64)
+        relative_error = np.asarray(relative_error, dtype=np.float64)
+
+        if self._abs is None:
+            size = min(self.max_iterations or 16, 4096)
+            self._iterations = np.empty(size, dtype=np.int64)
+            self._abs = np.empty((size,) + absolute_error.shape)
+            self._rel = np.empty((size,) + relative_error.shape)
+            if self.policy != "errors":
+                rows = self._capacity(x.nbytes)
+                self._iterates = np.empty((rows,) + x.shape, dtype=x.dtype)
+                self._iterate_rows = np.empty(rows, dtype=np.int64)
+            if self.policy == "every":
+                self._last_x = np.empty_like(x)
+
+        i = self.count
+        self._iterations = self._grow(self._iterations, i + 1)
+        self._abs = self._grow(self._abs, i + 1)
+        self._rel = self._grow(self._rel, i + 1)
+        self._iterations[i] = k
+        self._abs[i] = absolute_error
+        self._rel[i] = relative_error
+        self.count += 1
+
+        if self.policy == "full" or (self.policy == "every" and i % self.parameter == 0):
+            self._iterates = self._grow(self._iterates, self._stored + 1)
+            self._iterate_rows = self._grow(self._iterate_rows, self._stored + 1)
+            self._iterates[self._stored] = x
+            self._iterate_rows[self._stored] = i
+            self._stored += 1
+        elif self.policy == "last":
+            slot = self._stored % self.parameter
+            self._iterates[slot] = x
+            self._iterate_rows[slot] = i
+            self._stored += 1
+        if self.policy == "every":
+            # el último iterado siempre se conserva, aunque no toque guardarlo
+            self._last_x[...] = x
+
+    def absolute_errors(self):
+        """Errores absolutos de todas las iteraciones (arreglo de NumPy)."""
+        return np.array(self._abs[:self.count]) if self.count else np.empty(0)
+
+    def relative_errors(self):
+        """Errores relativos de todas las iteraciones (arreglo de NumPy)."""
+        return np.array(self._rel[:self.count]) if self.count else np.empty(0)
+
+    def iterates(self):
+        """
+        (índices, iterados) guardados, en orden de iteración: índices de
+        fila (0 .. count-1) y un arreglo con un iterado por fila. Son copias,
+        no vistas del registro.
+        """
+        if not self.count or self.policy == "errors":
+            return np.empty(0, dtype=np.int64), None
+        if self.policy == "last":
+            stored = min(self._stored, self.parameter)
+            order = np.arange(self._stored - stored, self._stored) % self.parameter
+            return self._iterate_rows[order], self._iterates[order]
+        rows, values = self._iterate_rows[:self._stored].copy(), self._iterates[:self._stored].copy()
+        if self.policy == "every" and rows[-1] != self.count - 1:
+            rows = np.append(rows, self.count - 1)
+            values = np.concatenate([values, self._last_x[None]])
+        return rows, values
+
+    def rows(self, decimals=None):
+        """
+        Filas [k, x_k, error absoluto, error relativo] para la tabla de la GUI.
+
+        'full' y 'errors' dan una fila por iteración ('errors' con x_k = None);
+        'every' y 'last', solo las filas con iterado guardado. x_k es un
+        arreglo de NumPy (sin copiar a listas), copiado del registro:
+        modificar la tabla no altera las filas que devuelva otra llamada.
+        decimals: opcional, redondea los errores de la tabla.
+        """
+        def error_value(e):
+            value = e.tolist()
+            if decimals is not None:
+                value = np.round(e, decimals).tolist()
+            return value
+
+        if self.policy == "errors":
+            selected, values = np.arange(self.count), None
+        else:
+            selected, values = self.iterates()
+        table = []
+        for j, i in enumerate(selected.tolist()):
+            x = values[j] if values is not None else None
+            table.append([int(self._iterations[i]), x, error_value(self._abs[i]), error_value(self._rel[i])])
+        return table
+
+
+def progress_recorder(history, error_type):
+    """
+    on_iteration para los métodos de la GUI: guarda la iteración en
+    'history' (IterationTrace) y avisa el progreso con el error elegido.
+    """
+    relative = error_type in ("rel", "rela")
+
+    def record(iteration_count, solution_vector, absolute_error, relative_error):
+        history.record(iteration_count, solution_vector, absolute_error, relative_error)
+        report_progress(iteration_count, relative_error if relative else absolute_error)
+
+    return record
+
+
+def residual_summary(absolute_error, relative_error, iterations, tolerance, error_type, unit="iteraciones", label="Residuo final"):
+    """
+    Últimas líneas del resumen de los métodos que miden el residuo (PCG,
+    GMRES, BiCGSTAB, multigrid, refinamiento): residuo final y si converge.
+    Devuelve (líneas, converged).
+    """
+    relative = error_type in ("rel", "rela")
+    converged = (relative_error if relative else absolute_error) < tolerance or absolute_error == 0
+    lines = (
+        f"{label}: {absolute_error:.6e} (relativo: {relative_error:.6e})",
+        f"Converge (residuo < Tol)?: {'Sí' if converged else 'No'} en {iterations} {unit}",
+    )
+    return lines, converged
@@ -0,0 +1,54 @@
+import math
+
+import numpy as np
+
+from Python.aislamiento import FAILED_KIND, OUTSIDE_KIND, find_all_roots
+
+
+def _bisection(f, lo, hi, tolerance, max_iterations, error_type="rel"):
+    for k in range(max_iterations):
+        mid = (lo + hi) / 2.0
+        if f(lo) * f(mid) <= 0:
+            hi = mid
+        else:
+            lo = mid
+    return mid, f(mid), max_iterations, None
+
+
+def test_failing_bracket_does_not_abort_scan():
+    def solver(f, lo, hi, tolerance, max_iterations, error_type="rel"):
+        if lo < math.pi < hi:
+            raise ZeroDivisionError("derivada nula")
+        return _bisection(f, lo, hi, tolerance, max_iterations)
+
+    roots = find_all_roots(math.sin, 0.5, 10.0, solver, 1e-10, 60, eval_grid=200)
+    found = [r["root"] for r in roots if r["kind"] not in (FAILED_KIND, OUTSIDE_KIND)]
+    failed = [r for r in roots if r["kind"] == FAILED_KIND]
+    assert len(failed) == 1 and "derivada nula" in failed[0]["error"]
+    assert any(abs(x - 2 * math.pi) < 1e-8 for x in found)
+    assert any(abs(x - 3 * math.pi) < 1e-8 for x in found)
+
+
+def test_open_method_outside_bracket_is_reported():
+    def solver(f, lo, hi, tolerance, max_iterations, error_type="rel"):
+        return hi + 1.0, 0.0, 3, None
+
+    roots = find_all_roots(math.sin, 2.0, 4.0, solver, 1e-10, 60, eval_grid=50)
+    assert [r["kind"] for r in roots] == [OUTSIDE_KIND]
+    assert roots[0]["root"] > roots[0]["interval"][1]
+
+
+def test_scan_finds_simple_and_double_roots_with_bisection():
+    from Python.aislamiento import as_bracket_solver
+    from Python.biseccion import biseccion
+    from Python.expresion import compile_expression
+
+    # raíces simples en -2 y 3, doble en 1 (sin cambio de signo)
+    f = compile_expression("(x + 2) * (x - 1)**2 * (x - 3)")
+    roots = find_all_roots(f, -3.0, 4.0, as_bracket_solver(biseccion), 1e-10, 100, eval_grid=301, zero_tol=1e-8)
+    found = sorted(r["root"] for r in roots)
+    assert len(found) == 3
+    assert np.allclose(found, [-2.0, 1.0, 3.0], atol=1e-4)
+    kinds = {round(r["root"]): r["kind"] for r in roots}
+    assert kinds[1] == "mínimo de |f| (multiplicidad par)"
+    assert kinds[-2] == kinds[3] == "cambio de signo"
@@ -0,0 +1,49 @@
+import numpy as np
+
+from Python.bandas import band_factor
+
+
+def test_tridiagonal_tiny_pivot_uses_band_lu():
+    # Thomas sin pivoteo daba x = [0, 1, 1]
+    A = np.array([[1e-17, 1.0, 0.0], [1.0, 1.0, 1.0], [0.0, 1.0, 1.0]])
+    factors = band_factor(A)
+    assert factors.kind == "band_lu"
+    assert np.allclose(factors.solve(np.array([1.0, 3.0, 2.0])), [1.0, 1.0, 1.0])
+
+
+def test_diagonally_dominant_uses_thomas():
+    n = 50
+    A = 4 * np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1)
+    b = A @ np.ones(n)
+    factors = band_factor(A)
+    assert factors.kind == "thomas"
+    assert np.allclose(factors.solve(b), np.ones(n))
+
+
+def test_wide_band_is_not_routed():
+    from Python.bandas import route_to_band
+    n = 6
+    A = 10 * np.eye(n) + np.ones((n, n))
+    A[0, n - 1] = A[n - 1, 0] = 0.0   # un solo cero en la esquina: kl = ku = n - 2
+    assert route_to_band(A, np.ones(n), "auto") is None
+    T = 4 * np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1)
+    assert route_to_band(T, T @ np.ones(n), "auto") is not None
+
+
+def test_small_tridiagonal_is_routed():
+    from Python.bandas import route_to_band
+    n = 4
+    T = 4 * np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1)
+    routed = route_to_band(T, T @ np.ones(n), "auto")
+    assert routed is not None
+    assert np.allclose(routed[1][0][1], np.ones(n))
+
+
+def test_report_iterates_instead_of_routing():
+    from Python.jacobi import jacobi
+    n = 8
+    T = 4 * np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1)
+    report = jacobi(T, T @ np.ones(n), np.zeros(n), 1e-8, 100, show_report=True, band="auto")
+    assert "Se detectó una matriz de banda" not in report[0]
+    summary, _ = jacobi(T, T @ np.ones(n), np.zeros(n), 1e-8, 100, show_report=False, band="auto")
+    assert summary.startswith("Se detectó una matriz de banda")
@@ -0,0 +1,15 @@
+from Python.comparacion import run_root_method
+from Python.expresion import CachedFunction, compile_expression
+
+
+def test_seeded_run_reuses_session_cache():
+    f = CachedFunction(compile_expression("x**3 - 2*x - 5"))
+    run_root_method("Bisección", "Python.biseccion", "biseccion", "x**3 - 2*x - 5", 2, 3, 1e-8, 50, "rel", 500, f=f)
+    _, info, entries = run_root_method("Bisección", "Python.biseccion", "biseccion", "x**3 - 2*x - 5",
+                                       2, 3, 1e-8, 50, "rel", 500, seed=f.export())
+    assert info.misses == 0
+
+    session = CachedFunction(compile_expression("x**3 - 2*x - 5"))
+    session.merge(entries)
+    assert session.cache_info().currsize == f.cache_info().currsize
+    assert session.cache_info().hits == 0
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from Python.directos import (
+    PivotedLDLFactorization, SymmetricFactorization, cached_factorization, clear_factorization_cache,
+    direct_solve, lu_factor, lu_method, symmetric_factor
+)
+
+
+def test_symmetric_indefinite_tiny_pivot():
+    # LDLᵀ sin pivoteo daba x = [0, 1]
+    A = np.array([[1e-17, 1.0], [1.0, 1.0]])
+    x, factors, _ = direct_solve(A, np.array([1.0, 2.0]))
+    assert isinstance(factors, PivotedLDLFactorization)
+    assert np.allclose(x, [1.0, 1.0])
+
+
+def test_symmetric_indefinite_random():
+    rng = np.random.default_rng(0)
+    M = rng.standard_normal((80, 80))
+    A = M + M.T
+    b = rng.standard_normal(80)
+    factors = symmetric_factor(A)
+    assert factors.kind == "ldlt"
+    assert np.allclose(factors.solve(b), np.linalg.solve(A, b))
+    assert np.isclose(factors.determinant(), np.linalg.det(A))
+
+
+def test_positive_definite_uses_cholesky():
+    A = np.array([[4.0, 2.0, 0.0], [2.0, 5.0, 1.0], [0.0, 1.0, 3.0]])
+    factors = symmetric_factor(A)
+    assert isinstance(factors, SymmetricFactorization)
+    assert np.allclose(factors.L @ factors.L.T, A)
+
+
+@pytest.mark.parametrize("pivoting", ["partial", "total"])
+def test_lu_reconstructs_permuted_matrix(pivoting):
+    rng = np.random.default_rng(1)
+    A = rng.standard_normal((150, 150))   # más de un bloque de BLOCK_SIZE
+    b = rng.standard_normal(150)
+    factors = lu_factor(A, pivoting)
+    PAQ = A[factors.row_perm][:, factors.col_perm]
+    assert np.allclose(factors.L @ factors.U, PAQ)
+    assert np.allclose(factors.solve(b), np.linalg.solve(A, b))
+    assert np.isclose(factors.determinant(), np.linalg.det(A))
+
+
+def test_lu_without_pivoting_needs_nonzero_pivots():
+    A = np.array([[0.0, 1.0], [1.0, 1.0]])
+    with pytest.raises(ZeroDivisionError):
+        lu_factor(A, "none")
+    assert np.allclose(lu_factor(A, "partial").solve([1.0, 2.0]), [1.0, 1.0])
+
+
+def test_lu_singular_matrix_raises():
+    with pytest.raises(ValueError):
+        lu_factor(np.array([[1.0, 2.0], [2.0, 4.0]]), "partial")
+
+
+def test_factorization_cache_reuses_by_content():
+    clear_factorization_cache()
+    A = np.array([[4.0, 1.0], [2.0, 3.0]])
+    first, reused = cached_factorization(A, "partial")
+    assert not reused
+    second, reused = cached_factorization(A.copy(), "partial")
+    assert reused and second is first
+    _, reused = cached_factorization(A, "total")
+    assert not reused
+    summary, table = lu_method(A, np.array([5.0, 5.0]))
+    assert "reutilizada de la caché" in summary
+    assert [row["x_i"] for row in table] == pytest.approx([1.0, 1.0])
@@ -0,0 +1,45 @@
+import math
+
+from Python.expresion import CompiledExpression
+
+
+def test_compiled_function_has_no_builtins():
+    f = CompiledExpression("x**2 + 1")
+    assert f._func.__globals__["__builtins__"] == {}
+    assert f._jet_func.__globals__["__builtins__"] == {}
+    assert f(2.0) == 5.0
+
+
+def test_derivatives_use_jets():
+    f = CompiledExpression("x**3 + math.sin(x)")
+    value, d1, d2 = f.derivatives(1.0)
+    assert math.isclose(value, 1.0 + math.sin(1.0))
+    assert math.isclose(d1, 3.0 + math.cos(1.0))
+    assert math.isclose(d2, 6.0 - math.sin(1.0))
+
+
+def test_point_error_falls_back_only_for_that_call():
+    f = CompiledExpression("x**2")
+    jet_func = f._jet_func
+    calls = []
+
+    def failing_once(x):
+        calls.append(x)
+        if len(calls) == 1:
+            raise ZeroDivisionError
+        return jet_func(x)
+
+    f._jet_func = failing_once
+    value, d1, _ = f.derivatives(3.0)
+    assert math.isclose(d1, 6.0, rel_tol=1e-6)
+    assert f._jet_ok
+    f.derivatives(3.0)
+    assert len(calls) == 2
+
+
+def test_unsupported_operation_disables_jets():
+    f = CompiledExpression("x % 2")
+    value, d1, _ = f.derivatives(0.5)
+    assert value == 0.5
+    assert math.isclose(d1, 1.0, rel_tol=1e-6)
+    assert not f._jet_ok
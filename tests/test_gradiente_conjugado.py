@@ -0,0 +1,28 @@
+import numpy as np
+from scipy.sparse.linalg import aslinearoperator
+
+from Python.gradiente_conjugado import pcg_kernel, pcg_method
+from Python.multigrid import poisson_matrix
+
+
+def test_linear_operator_without_diagonal():
+    A = poisson_matrix(15, 2)
+    b = np.ones(A.shape[0])
+    x, _, _, rel_err = pcg_kernel(aslinearoperator(A), b, np.zeros_like(b), 1e-10, 500)
+    assert rel_err < 1e-10
+    assert np.allclose(A @ x, b)
+    summary, _ = pcg_method(aslinearoperator(A), b, np.zeros_like(b), 1e-10, 500)
+    assert "no tiene diagonal()" in summary
+
+
+def test_report_row_added_for_spd_only():
+    from Python.gui_helpers import add_pcg_report
+    n = 10
+    A = 4 * np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1)
+    informe = {}
+    add_pcg_report(informe, A, A @ np.ones(n), np.zeros(n), 1e-10, 100, ["rel", "abs"])
+    assert set(informe["PCG (Jacobi)"]) == {"rel", "abs"}
+
+    informe = {}
+    add_pcg_report(informe, -A + 10 * np.eye(n, k=2), np.ones(n), np.zeros(n), 1e-10, 100, ["rel"])
+    assert "PCG (Jacobi)" not in informe
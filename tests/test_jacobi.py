@@ -0,0 +1,31 @@
+import numpy as np
+
+from Python.jacobi import jacobi, jacobi_kernel
+
+
+def _system(n):
+    return 4 * np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1)
+
+
+def test_multiple_rhs_match_single_solves():
+    n = 12
+    A = _system(n)
+    B = np.column_stack([A @ np.ones(n), A @ np.arange(n, dtype=float), np.zeros(n)])
+    X, iterations, _, _ = jacobi_kernel(A, B, np.zeros(n), 1e-12, 500)
+    for j in range(B.shape[1]):
+        x, it, _, _ = jacobi_kernel(A, B[:, j], np.zeros(n), 1e-12, 500)
+        assert np.allclose(X[:, j], x)
+        assert iterations[j] == it
+
+
+def test_multiple_rhs_table_has_one_solution_per_system():
+    n = 6
+    A = _system(n)
+    B = np.column_stack([A @ np.ones(n), A @ np.arange(n, dtype=float)])
+    summary, table = jacobi(A, B, np.zeros(n), 1e-12, 500, error_type="rela")
+    assert "Columnas de b: 2" in summary
+    _, solutions, abs_err, rel_err = table[-1]
+    assert np.shape(solutions) == (2, n)
+    assert np.allclose(solutions[0], np.ones(n))
+    assert np.allclose(solutions[1], np.arange(n))
+    assert len(abs_err) == len(rel_err) == 2
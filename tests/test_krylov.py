@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from Python.bicgstab import bicgstab_kernel, bicgstab_method
+from Python.gmres import gmres_kernel, gmres_method
+
+
+def _convection_diffusion(n):
+    # no simétrica: -u'' + 10 u' con diferencias centradas
+    h = 1.0 / (n + 1)
+    return (2 * np.eye(n) - (1 - 5 * h) * np.eye(n, k=1) - (1 + 5 * h) * np.eye(n, k=-1)) / h ** 2
+
+
+@pytest.mark.parametrize("kernel", [gmres_kernel, bicgstab_kernel])
+@pytest.mark.parametrize("preconditioner", ["none", "jacobi", "gauss_seidel"])
+def test_nonsymmetric_system_converges(kernel, preconditioner):
+    n = 40
+    A = _convection_diffusion(n)
+    x_true = np.sin(np.linspace(0, 3, n))
+    b = A @ x_true
+    x, _, _, rel_err = kernel(A, b, np.zeros(n), 1e-10, 500, preconditioner=preconditioner)
+    assert rel_err < 1e-10
+    assert np.allclose(x, x_true, atol=1e-6)
+
+
+def test_gmres_restart_still_converges():
+    n = 40
+    A = _convection_diffusion(n)
+    b = A @ np.ones(n)
+    x, iterations, _, _ = gmres_kernel(A, b, np.zeros(n), 1e-10, 2000, restart=5, preconditioner="jacobi")
+    assert np.allclose(x, np.ones(n), atol=1e-6)
+    assert iterations > 5
+
+
+@pytest.mark.parametrize("method", [gmres_method, bicgstab_method])
+def test_method_summary_and_rows(method):
+    n = 20
+    A = _convection_diffusion(n)
+    summary, table = method(A, A @ np.ones(n), np.zeros(n), 1e-10, 500, trace="last:3")
+    assert "Converge (residuo < Tol)?: Sí" in summary
+    assert len(table) <= 3
+    assert np.allclose(table[-1][1], np.ones(n), atol=1e-6)
@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+from Python.multigrid import build_hierarchy, multigrid_kernel, multigrid_method, poisson_matrix
+
+
+@pytest.mark.parametrize("dim, n", [(1, 63), (2, 15)])
+@pytest.mark.parametrize("cycle", ["V", "F"])
+def test_poisson_converges_in_few_cycles(dim, n, cycle):
+    A = poisson_matrix(n, dim)
+    x_true = np.random.default_rng(0).standard_normal(A.shape[0])
+    b = A @ x_true
+    x, cycles, _, rel_err = multigrid_kernel(A, b, np.zeros_like(b), 1e-10, 50, cycle=cycle)
+    assert rel_err < 1e-10
+    assert cycles <= 20
+    assert np.allclose(x, x_true, atol=1e-6)
+
+
+def test_hierarchy_coarsens_to_small_grid():
+    levels = build_hierarchy(poisson_matrix(31, 2))
+    assert levels[0]['shape'] == (31, 31)
+    assert levels[-1]['A'].shape[0] < levels[0]['A'].shape[0]
+
+
+def test_method_summary():
+    A = poisson_matrix(31, 1)
+    summary, table = multigrid_method(A, np.ones(A.shape[0]), np.zeros(A.shape[0]), 1e-10, 50, smoother="jacobi")
+    assert "Converge (residuo < Tol)?: Sí" in summary
+    assert "Factor de reducción medio" in summary
+    assert len(table) > 0
@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from Python import matrices
+from Python.gauss_seidel import gauss_seidel_kernel
+from Python.jacobi import jacobi, jacobi_kernel
+from Python.multigrid import poisson_matrix
+from Python.operadores import PoissonOperator
+from Python.SOR import sor_kernel
+
+
+@pytest.mark.parametrize("n, dim", [(30, 1), (6, 2)])
+def test_operator_matches_poisson_matrix(n, dim):
+    op = PoissonOperator(n, dim, shift=0.5)
+    A = poisson_matrix(n, dim) + 0.5 * np.eye(n ** dim)
+    A = np.asarray(A.toarray() if hasattr(A, "toarray") else A)
+    x = np.random.default_rng(dim).standard_normal(op.shape[0])
+    assert np.allclose(op.matvec(x), A @ x)
+    assert np.allclose(op.diagonal(), np.diag(A))
+    assert np.allclose(op.tocsr().toarray(), A)
+    assert np.allclose(op.rows(7, 19).toarray(), A[7:19])
+
+
+@pytest.mark.parametrize("kernel", ["jacobi", "gauss_seidel", "sor"])
+def test_kernels_match_sparse_matrix(kernel, monkeypatch):
+    # bloques de filas pequeños para recorrer varios bloques por barrido
+    monkeypatch.setattr(matrices, "OPERATOR_ROW_BLOCK", 7)
+    op = PoissonOperator(8, 2, shift=1.0)
+    S = op.tocsr()
+    b = np.ones(op.shape[0])
+    x0 = np.zeros_like(b)
+    if kernel == "jacobi":
+        run = lambda A: jacobi_kernel(A, b, x0, 1e-10, 500)
+    elif kernel == "gauss_seidel":
+        run = lambda A: gauss_seidel_kernel(A, b, x0, 1e-10, 500)
+    else:
+        run = lambda A: sor_kernel(A, b, x0, 1.2, 1e-10, 500)
+    x_op, it_op, _, _ = run(op)
+    x_sp, it_sp, _, _ = run(S)
+    assert it_op == it_sp
+    assert np.allclose(x_op, x_sp)
+    assert np.allclose(S @ x_op, b, atol=1e-8)
+
+
+def test_gui_wrapper_reports_unknown_radius():
+    op = PoissonOperator(6, 2, shift=1.0)
+    summary, table = jacobi(op, np.ones(op.shape[0]), np.zeros(op.shape[0]), 1e-8, 300, show_report=True)
+    assert "Converge (rho<1)?" in summary
+    assert len(table) > 0
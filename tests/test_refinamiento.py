@@ -0,0 +1,33 @@
+import numpy as np
+import scipy.sparse as sp
+
+from Python.refinamiento import LowPrecisionSolver, refinement_method
+
+
+def _poisson(n):
+    return 4 * np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1)
+
+
+def test_refinement_reaches_double_precision():
+    n = 30
+    A = _poisson(n) + 0.1 * np.eye(n, k=3)
+    x_true = np.linspace(1.0, 2.0, n)
+    for solver in ("direct", "jacobi", "gauss_seidel"):
+        summary, table = refinement_method(A, A @ x_true, np.zeros(n), 1e-13, 30, solver=solver)
+        assert "Converge (residuo < Tol)?: Sí" in summary
+        assert np.allclose(table[-1][1], x_true, rtol=1e-12)
+
+
+def test_nbytes_counts_the_splitting():
+    n = 40
+    A = _poisson(n)
+    dense = 4 * n * n
+    assert LowPrecisionSolver(A, "jacobi").nbytes() == 2 * dense + 4 * n
+    assert LowPrecisionSolver(A, "gauss_seidel").nbytes() == 3 * dense
+
+    S = sp.csr_matrix(A)
+    jacobi = LowPrecisionSolver(S, "jacobi")
+    gauss_seidel = LowPrecisionSolver(S, "gauss_seidel")
+    single = 8 * S.nnz + 4 * (n + 1)
+    assert jacobi.nbytes() > single + 4 * n
+    assert gauss_seidel.nbytes() > single
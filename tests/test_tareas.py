@@ -0,0 +1,28 @@
+from Python.tareas import Job, report_progress, run_job
+
+
+class _Widget:
+    """Sustituto mínimo de un widget de Tk: after() ejecuta de inmediato."""
+
+    def after(self, interval, callback):
+        callback()
+
+
+def test_cancel_after_last_progress_skips_result():
+    jobs = []
+
+    def work():
+        report_progress(0, 1.0)
+        jobs[0].cancel()  # el usuario pulsa Volver después del último report_progress
+        return "resultado"
+
+    events = []
+    jobs.append(Job(work, background=False))
+    run_job(_Widget(), jobs[0], on_done=lambda r: events.append(("done", r)), on_cancel=lambda: events.append("cancel"))
+    assert events == ["cancel"]
+
+
+def test_finished_job_reports_result():
+    events = []
+    run_job(_Widget(), Job(lambda: 42, background=False), on_done=events.append)
+    assert events == [42]
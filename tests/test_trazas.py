@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from Python.trazas import IterationTrace, parse_trace_policy
+
+
+def _fill(trace, count, n=3):
+    x = np.zeros(n)
+    for k in range(count):
+        x[:] = k          # el núcleo reutiliza el mismo arreglo
+        trace.record(k, x, 1.0 / (k + 1), 2.0 / (k + 1))
+
+
+@pytest.mark.parametrize("policy, expected", [
+    ("full", list(range(10))),
+    ("every:4", [0, 4, 8, 9]),
+    ("last:3", [7, 8, 9]),
+])
+def test_policies_keep_the_expected_iterates(policy, expected):
+    trace = IterationTrace(policy, 10)
+    _fill(trace, 10)
+    rows = trace.rows()
+    assert [row[0] for row in rows] == expected
+    assert all(np.all(row[1] == row[0]) for row in rows)
+
+
+def test_errors_policy_keeps_all_errors_without_iterates():
+    trace = IterationTrace("errors", 5)
+    _fill(trace, 5)
+    assert [row[1] for row in trace.rows()] == [None] * 5
+    assert np.allclose(trace.absolute_errors(), 1.0 / np.arange(1, 6))
+
+
+def test_rows_are_not_views_of_the_registry():
+    for policy in ("full", "every:2", "last:2"):
+        trace = IterationTrace(policy, 4)
+        _fill(trace, 4)
+        for row in trace.rows():
+            row[1][:] = -1.0   # quien recibe la tabla la modifica
+        assert all(np.all(row[1] == row[0]) for row in trace.rows())
+
+
+def test_parse_policy():
+    assert parse_trace_policy("every 5") == ("every", 5)
+    assert parse_trace_policy(("last", 10)) == ("last", 10)
+    with pytest.raises(ValueError):
+        parse_trace_policy("last:0")